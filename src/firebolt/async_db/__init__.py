@@ -16,7 +16,7 @@ from firebolt.async_db._types import (
     TimestampFromTicks,
 )
 from firebolt.async_db.connection import Connection, connect
-from firebolt.async_db.cursor import Cursor
+from firebolt.async_db.cursor import Cursor, StreamingCursor
 from firebolt.utils.exception import (
     DatabaseError,
     DataError,
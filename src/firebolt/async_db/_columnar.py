@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, List, Sequence, Union
+
+from firebolt.async_db._types import (
+    ARRAY,
+    DATETIME64,
+    DECIMAL,
+    RawColType,
+    parse_column,
+)
+from firebolt.utils.exception import DataError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa  # type: ignore
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd  # type: ignore
+except ImportError:
+    pd = None
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required to fetch results as arrays. "
+            "Install it with `pip install firebolt-sdk[numpy]`"
+        )
+
+
+def _numpy_dtype(ctype: Union[type, ARRAY, DECIMAL, DATETIME64]) -> Any:
+    """Get numpy dtype for a column type, None if values should be kept as objects."""
+    if ctype is int:
+        return np.dtype(np.int64)
+    if ctype is float:
+        return np.dtype(np.float64)
+    if ctype is date:
+        return np.dtype("datetime64[D]")
+    if ctype is datetime:
+        return np.dtype("datetime64[us]")
+    if isinstance(ctype, DATETIME64):
+        return np.dtype("datetime64[us]" if ctype.precision <= 6 else "datetime64[ns]")
+    return None
+
+
+def _object_array(values: Sequence[Any]) -> Any:
+    # Avoid numpy treating list values as an additional dimension
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def to_numpy_array(
+    values: Sequence[RawColType], ctype: Union[type, ARRAY, DECIMAL, DATETIME64]
+) -> Any:
+    """Convert raw column values into a numpy array.
+
+    Numeric, date and datetime values are converted in bulk by numpy into typed
+    arrays. Other values are parsed into Python objects. Columns with null
+    values are returned as masked arrays.
+    """
+    require_numpy()
+    mask = [value is None for value in values]
+    has_nulls = any(mask)
+    dtype = _numpy_dtype(ctype)
+
+    if dtype is None:
+        array = _object_array(parse_column(values, ctype))
+    else:
+        filled: Sequence[Any] = values
+        if has_nulls:
+            fill = "NaT" if dtype.kind == "M" else 0
+            filled = [fill if value is None else value for value in values]
+        try:
+            array = np.array(filled, dtype=dtype)
+        except OverflowError:
+            # UInt64 values might not fit into int64
+            try:
+                array = np.array(filled, dtype=np.uint64)
+            except OverflowError:
+                array = _object_array(parse_column(values, ctype))
+
+    if has_nulls:
+        return np.ma.masked_array(array, mask=mask)
+    return array
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required to fetch results in Arrow format. "
+            "Install it with `pip install firebolt-sdk[pyarrow]`"
+        )
+
+
+def arrow_type(ctype: Union[type, ARRAY, DECIMAL, DATETIME64]) -> Any:
+    """Get Arrow data type for a column type."""
+    if ctype is int:
+        return pa.int64()
+    if ctype is float:
+        return pa.float64()
+    if ctype is date:
+        return pa.date32()
+    if ctype is datetime:
+        return pa.timestamp("us")
+    if isinstance(ctype, DATETIME64):
+        if ctype.precision == 0:
+            return pa.timestamp("s")
+        if ctype.precision <= 3:
+            return pa.timestamp("ms")
+        return pa.timestamp("us" if ctype.precision <= 6 else "ns")
+    if isinstance(ctype, DECIMAL):
+        if ctype.precision <= 38:
+            return pa.decimal128(ctype.precision, ctype.scale)
+        return pa.decimal256(ctype.precision, ctype.scale)
+    if isinstance(ctype, ARRAY):
+        return pa.list_(arrow_type(ctype.subtype))
+    return pa.string()
+
+
+# Errors raised by pyarrow when values don't match the requested type
+_ARROW_CONVERSION_ERRORS = (TypeError, ValueError, OverflowError, NotImplementedError)
+
+
+def to_arrow_array(
+    values: Sequence[RawColType], ctype: Union[type, ARRAY, DECIMAL, DATETIME64]
+) -> Any:
+    """Convert raw column values into an Arrow array.
+
+    Values are converted by Arrow in bulk where possible: numbers and strings
+    directly, and float, date, datetime and decimal values are cast from their
+    string representation. Otherwise, values are parsed into Python objects first.
+    """
+    require_pyarrow()
+    target = arrow_type(ctype)
+    try:
+        if ctype in (int, str):
+            return pa.array(values, type=target)
+        if not isinstance(ctype, ARRAY):
+            return pa.array(values, type=pa.string()).cast(target)
+    except _ARROW_CONVERSION_ERRORS:
+        pass
+    parsed = parse_column(values, ctype)
+    try:
+        return pa.array(parsed, type=target)
+    except _ARROW_CONVERSION_ERRORS:
+        if ctype is int:
+            # UInt64 values might not fit into int64
+            try:
+                return pa.array(parsed, type=pa.uint64())
+            except _ARROW_CONVERSION_ERRORS:
+                pass
+        # Values don't match column type, let Arrow infer it
+        return pa.array(parsed)
+
+
+def to_arrow_batch(columns: Sequence[Sequence[RawColType]], descriptions: Any) -> Any:
+    """Convert raw column values into an Arrow record batch."""
+    require_pyarrow()
+    return pa.RecordBatch.from_arrays(
+        [
+            to_arrow_array(values, d.type_code)
+            for values, d in zip(columns, descriptions)
+        ],
+        names=[d.name for d in descriptions],
+    )
+
+
+def to_arrow_table(columns: Sequence[Sequence[RawColType]], descriptions: Any) -> Any:
+    """Convert raw column values into an Arrow table."""
+    return pa.Table.from_batches([to_arrow_batch(columns, descriptions)])
+
+
+def require_pandas() -> None:
+    if pd is None:
+        raise ImportError(
+            "pandas is required to fetch results as a DataFrame. "
+            "Install it with `pip install firebolt-sdk[pandas]`"
+        )
+
+
+def to_pandas_series(
+    values: Sequence[RawColType], ctype: Union[type, ARRAY, DECIMAL, DATETIME64]
+) -> Any:
+    """Convert raw column values into a pandas Series.
+
+    Integers are converted into nullable Int64 (or UInt64), floats into float64,
+    dates and datetimes into datetime64[ns]. Decimals, arrays and strings are kept
+    as Python objects.
+    """
+    require_pandas()
+    if _numpy_dtype(ctype) is not None:
+        array = to_numpy_array(values, ctype)
+        mask = np.ma.getmaskarray(array)
+        data = np.ma.getdata(array)
+        if data.dtype.kind in "iu":
+            return pd.Series(pd.arrays.IntegerArray(data, mask))
+        if data.dtype.kind == "f":
+            data[mask] = np.nan
+            return pd.Series(data)
+        if data.dtype.kind == "M":
+            try:
+                # Null values are already NaT
+                return pd.Series(data, dtype="datetime64[ns]")
+            except (OverflowError, ValueError):
+                # Value is out of datetime64[ns] range
+                pass
+    return pd.Series(_object_array(parse_column(values, ctype)), dtype=object)
+
+
+def to_dataframe(columns: Sequence[Sequence[RawColType]], descriptions: Any) -> Any:
+    """Convert raw column values into a pandas DataFrame."""
+    frame = pd.DataFrame(
+        {
+            i: to_pandas_series(values, d.type_code)
+            for i, (values, d) in enumerate(zip(columns, descriptions))
+        }
+    )
+    # Set names separately since column names might repeat
+    frame.columns = [d.name for d in descriptions]
+    return frame
+
+
+def columns_from_rows(rows: Sequence[List[RawColType]], width: int) -> List[tuple]:
+    """Transpose raw data rows into columns."""
+    if any(len(row) != width for row in rows):
+        raise DataError(f"Invalid row length: expected {width} values")
+    if not rows:
+        return [() for _ in range(width)]
+    return list(zip(*rows))
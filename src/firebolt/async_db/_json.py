@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from json import loads as json_loads
+from operator import itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from firebolt.async_db._types import RawColType, float_text_required
+from firebolt.utils.exception import ConfigurationError
+from firebolt.utils.util import gc_disabled
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import simdjson  # type: ignore
+except ImportError:
+    simdjson = None
+
+JSONDecoder = Callable[[Union[str, bytes]], Any]
+
+JSON_DECODERS = ("auto", "json", "orjson", "simdjson")
+
+
+def get_json_decoder(decoder: Union[str, JSONDecoder]) -> Optional[JSONDecoder]:
+    """Resolve `json_decoder` connection parameter into a decoding function.
+
+    Args:
+        decoder (Union[str, Callable]): One of "auto", "json", "orjson", "simdjson"
+            or a custom function, that decodes a JSON document. "auto" picks the
+            fastest installed decoder.
+
+    Returns:
+        Optional[Callable]: Decoding function, None if standard json module
+            should be used
+    """
+    if callable(decoder):
+        return decoder
+    if decoder not in JSON_DECODERS:
+        raise ConfigurationError(
+            f"Invalid json_decoder {decoder}: expected one of "
+            f"{', '.join(JSON_DECODERS)} or a callable"
+        )
+    if decoder in ("auto", "orjson") and orjson is not None:
+        return orjson.loads
+    if decoder in ("auto", "simdjson") and simdjson is not None:
+        return simdjson.loads
+    if decoder in ("orjson", "simdjson"):
+        raise ImportError(
+            f"{decoder} is required to use it as json decoder. "
+            f"Install it with `pip install {decoder}`"
+        )
+    return None
+
+
+def decode_json(content: Union[str, bytes], decoder: Optional[JSONDecoder]) -> Any:
+    """Decode JSON document with provided decoder.
+
+    If decoder is not provided or fails, the standard json module is used, which
+    keeps float values as strings to properly parse them later.
+    """
+    if decoder is not None:
+        try:
+            return decoder(content)
+        except ValueError:
+            pass
+    return json_loads(content, parse_float=str)
+
+
+def decode_json_lines(
+    lines: List[str], decoder: Optional[JSONDecoder]
+) -> List[List[RawColType]]:
+    """Decode JSON rows, one per line, with provided decoder."""
+    return [decode_json(line, decoder) for line in lines]
+
+
+def _has_float(value: RawColType) -> bool:
+    if isinstance(value, list):
+        return any(_has_float(item) for item in value)
+    return value.__class__ is float
+
+
+def _column_has_float(rows: Sequence[List[RawColType]], index: int) -> bool:
+    classes = set(map(type, map(itemgetter(index), rows)))
+    if list in classes:
+        return any(_has_float(row[index]) for row in rows)
+    return float in classes
+
+
+def decode_query_data(content: bytes, decoder: Optional[JSONDecoder]) -> Any:
+    """Decode JSON query response.
+
+    Decoders other than the standard json module return float values as Python
+    floats, which are the same for Float columns, but lose precision for decimals.
+    If a decimal (or unknown type) column has such values, the response is decoded
+    again by the standard json module.
+    """
+    with gc_disabled():
+        query_data = decode_json(content, decoder)
+        if decoder is None:
+            return query_data
+        try:
+            exact_columns = [
+                i
+                for i, d in enumerate(query_data["meta"])
+                if float_text_required(d["type"])
+            ]
+            rows: Sequence[List[RawColType]] = query_data["data"]
+            if not any(_column_has_float(rows, i) for i in exact_columns):
+                return query_data
+        except (AttributeError, IndexError, KeyError, TypeError):
+            # Invalid data format is reported after decoding by standard json module
+            pass
+        return json_loads(content, parse_float=str)
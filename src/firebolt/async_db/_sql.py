@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+from firebolt.utils.exception import InterfaceError
+
+# Quoted values and comments are skipped as a whole, so semicolons and question
+# marks inside them are not treated as statement ends or placeholders
+_TOKEN_RE = re.compile(
+    r"""
+    '(?:[^'\\]|\\.)*'
+    | "(?:[^"\\]|\\.)*"
+    | `[^`]*`
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<special>[;?])
+    | (?P<unsupported>['"`]|/\*|\$\$|%(?:\(\w+\))?s|(?<![\w:])[$:]\w+)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_SET_RE = re.compile(r"set(?:\s|$)", re.IGNORECASE)
+
+
+class SQLStatement(NamedTuple):
+    """Single statement of a SQL query.
+
+    Args:
+        sql (str): Statement text without trailing semicolon
+        segments (List[str]): Statement text split by '?' placeholders
+        set_parameter (Optional[Tuple[str, str]]): Parameter name and value
+            if it's a SET statement
+    """
+
+    sql: str
+    segments: List[str]
+    set_parameter: Optional[Tuple[str, str]]
+
+
+def _parse_set(sql: str, code: str) -> Optional[Tuple[str, str]]:
+    """Parse a statement code without comments as a SET statement."""
+    if not _SET_RE.match(code):
+        return None
+    name, eq, value = code[3:].partition("=")
+    name, value = name.strip(), value.strip()
+    if not eq or not name or not value:
+        raise InterfaceError(
+            f"Invalid set statement format: {sql}, expected SET <param> = <value>"
+        )
+    return name, value
+
+
+def split_sql(query: str) -> Optional[List[SQLStatement]]:
+    """Split a SQL query into statements in a single pass.
+
+    Statements, that consist only of comments, are skipped.
+
+    Returns:
+        Optional[List[SQLStatement]]: Query statements, None if the query
+            contains unterminated quotes or comments, dollar-quoted strings
+            or ':name', '%s', '$1' placeholders, which should be handled by
+            a full SQL parser
+    """
+    statements: List[SQLStatement] = []
+    start = 0
+    # Statement text before the last placeholder and comments
+    segments: List[str] = []
+    segment_start = 0
+    code: List[str] = []
+    code_start = 0
+    for match in _TOKEN_RE.finditer(query):
+        if match.group("unsupported") is not None:
+            return None
+        if match.group("comment") is not None:
+            code.append(query[code_start : match.start()])
+            code.append(" ")
+            code_start = match.end()
+            continue
+        special = match.group("special")
+        if special is None:
+            continue
+        if special == "?":
+            segments.append(query[segment_start : match.start()])
+            segment_start = match.end()
+            continue
+        # Statement end
+        end = match.end()
+        code.append(query[code_start:end])
+        _append_statement(
+            statements, query[start:end], segments + [query[segment_start:end]], code
+        )
+        start = segment_start = code_start = end
+        segments, code = [], []
+    code.append(query[code_start:])
+    _append_statement(
+        statements, query[start:], segments + [query[segment_start:]], code
+    )
+    return statements
+
+
+def _append_statement(
+    statements: List[SQLStatement], text: str, segments: List[str], code: List[str]
+) -> None:
+    statement_code = "".join(code).strip().rstrip(";").strip()
+    if not statement_code:
+        return
+    sql = text.strip().rstrip(";")
+    statements.append(SQLStatement(sql, segments, _parse_set(sql, statement_code)))
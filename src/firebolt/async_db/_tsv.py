@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+from itertools import compress, repeat
+from operator import contains
+from typing import Any, Callable, List, Sequence, Tuple
+
+from firebolt.async_db._types import (
+    ARRAY,
+    NULLABLE_PREFIX,
+    RawColType,
+    parse_type,
+)
+from firebolt.utils.exception import DataError
+
+TSV_NULL = "\\N"
+ARRAY_NULL = "NULL"
+
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPES = {
+    "0": "\0",
+    "a": "\a",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+_QUOTED_RE = re.compile(r"'((?:[^'\\]|\\.)*)'", re.DOTALL)
+_UNQUOTED_RE = re.compile(r"[^,\]]*")
+
+
+def _replace_escape(match: re.Match) -> str:
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
+
+def unescape(value: str) -> str:
+    """Replace escape sequences in a TabSeparated or quoted value."""
+    if "\\" not in value:
+        return value
+    return _ESCAPE_RE.sub(_replace_escape, value)
+
+
+def split_tsv_header(line: str) -> List[str]:
+    """Split a TabSeparated header line into unescaped column names or types."""
+    return [unescape(value) for value in line.split("\t")]
+
+
+def _parse_array(text: str, pos: int) -> Tuple[list, int]:
+    if text[pos] != "[":
+        raise DataError(f"Invalid array value {text}: '[' expected at {pos}")
+    pos += 1
+    items: list = []
+    if text[pos] == "]":
+        return items, pos + 1
+    while True:
+        item: RawColType
+        if text[pos] == "[":
+            item, pos = _parse_array(text, pos)
+        elif text[pos] == "'":
+            match = _QUOTED_RE.match(text, pos)
+            if match is None:
+                raise DataError(f"Invalid array value {text}: unclosed quote at {pos}")
+            item, pos = unescape(match.group(1)), match.end()
+        else:
+            match = _UNQUOTED_RE.match(text, pos)
+            assert match is not None  # always matches
+            item, pos = match.group(0), match.end()
+            if item == ARRAY_NULL:
+                item = None
+        items.append(item)
+        if text[pos] == "]":
+            return items, pos + 1
+        if text[pos] != ",":
+            raise DataError(f"Invalid array value {text}: ',' expected at {pos}")
+        pos += 1
+
+
+def parse_array_literal(text: str) -> list:
+    """Parse an array in text format, e.g. [1,NULL,3] or ['a','b'], into a list.
+
+    Numbers and other unquoted values are returned as strings to be parsed later.
+    """
+    # Fast path for flat arrays of unquoted values
+    if (
+        text.find("'") == -1
+        and text.rfind("[") == 0
+        and text.find("]") == len(text) - 1
+    ):
+        if len(text) == 2:
+            return []
+        return [None if item == ARRAY_NULL else item for item in text[1:-1].split(",")]
+    try:
+        items, pos = _parse_array(text, 0)
+    except IndexError:
+        raise DataError(f"Invalid array value {text}: unexpected end")
+    if pos != len(text):
+        raise DataError(f"Invalid array value {text}: unexpected data at {pos}")
+    return items
+
+
+def tsv_rows_decoder(
+    raw_types: Sequence[str],
+) -> Callable[[List[str]], List[List[RawColType]]]:
+    """Return a function, that splits TabSeparated lines into raw rows.
+
+    Values are unescaped and arrays are parsed into lists, so the result can be
+    parsed by `row_parser` the same way as JSON rows.
+    """
+    width = len(raw_types)
+    ctypes = [parse_type(raw_type) for raw_type in raw_types]
+    arrays = [i for i, ctype in enumerate(ctypes) if isinstance(ctype, ARRAY)]
+    scalars = [i for i, ctype in enumerate(ctypes) if not isinstance(ctype, ARRAY)]
+    # Only values of nullable columns can be NULL
+    nullable = [i for i in scalars if raw_types[i].startswith(NULLABLE_PREFIX)]
+
+    def decode_escapes(row: List[Any], line: str) -> None:
+        nulls = 0
+        for i in nullable:
+            if row[i] == TSV_NULL:
+                row[i] = None
+                nulls += 1
+        # There are escape sequences besides NULL values
+        if not nulls or line.count("\\") > nulls:
+            for i in scalars:
+                value = row[i]
+                if value is not None and "\\" in value:
+                    row[i] = unescape(value)
+
+    def decode_rows(lines: List[str]) -> List[List[RawColType]]:
+        rows: List[List[Any]] = list(map(str.split, lines, repeat("\t")))
+        for length in set(map(len, rows)):
+            if length != width:
+                raise DataError(
+                    f"Invalid row length: expected {width} values, got {length}"
+                )
+        # Only lines with NULL values or escape sequences need further processing
+        for i in compress(range(len(lines)), map(contains, lines, repeat("\\"))):
+            decode_escapes(rows[i], lines[i])
+        if arrays:
+            for row in rows:
+                for i in arrays:
+                    value = row[i]
+                    row[i] = None if value == TSV_NULL else parse_array_literal(value)
+        return rows
+
+    return decode_rows
@@ -4,7 +4,18 @@ from collections import namedtuple
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional, Sequence, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from sqlparse import parse as parse_sql  # type: ignore
 from sqlparse.sql import (  # type: ignore
@@ -18,15 +29,18 @@ from sqlparse.tokens import Token as TokenType  # type: ignore
 try:
     from ciso8601 import parse_datetime  # type: ignore
 except ImportError:
-    # Unfortunately, there seems to be no support for optional bits in strptime
+
     def parse_datetime(date_string: str) -> datetime:  # type: ignore
-        format = "%Y-%m-%d %H:%M:%S.%f"
-        # fromisoformat doesn't support milliseconds
+        # fromisoformat only supports 3 or 6 digit fractions before python 3.11
         if "." in date_string:
-            return datetime.strptime(date_string, format)
+            seconds, fraction = date_string.split(".", 1)
+            if len(fraction) > 6 or not fraction.isdigit():
+                raise ValueError(f"Invalid datetime value {date_string}")
+            date_string = f"{seconds}.{fraction:0<6}"
         return datetime.fromisoformat(date_string)
 
 
+from firebolt.async_db._sql import split_sql
 from firebolt.utils.exception import (
     DataError,
     InterfaceError,
@@ -246,6 +260,23 @@ def parse_type(raw_type: str) -> Union[type, ARRAY, DECIMAL, DATETIME64]:  # noq
         return str
 
 
+def float_text_required(raw_type: str) -> bool:
+    """Check if JSON float values of a type must be parsed from their exact text.
+
+    It's the case for decimals and unknown types, which are parsed from strings.
+    """
+    for prefix in (NULLABLE_PREFIX, ARRAY._prefix):
+        if raw_type.startswith(prefix) and raw_type.endswith(")"):
+            return float_text_required(raw_type[len(prefix) : -1])
+    if raw_type.startswith(DATETIME64._prefix):
+        return False
+    try:
+        _InternalType(raw_type)
+        return False
+    except ValueError:
+        return True
+
+
 def parse_value(
     value: RawColType,
     ctype: Union[type, ARRAY, DECIMAL, DATETIME64],
@@ -274,11 +305,94 @@ def parse_value(
     raise DataError(f"Unsupported data type returned: {ctype.__name__}")
 
 
+def _parse_date(value: RawColType) -> date:
+    if not isinstance(value, str):
+        raise DataError(f"Invalid date value {value}: str expected")
+    return parse_datetime(value).date()
+
+
+def _parse_datetime(value: RawColType) -> datetime:
+    if not isinstance(value, str):
+        raise DataError(f"Invalid datetime value {value}: str expected")
+    return parse_datetime(value)
+
+
+def value_parser(
+    ctype: Union[type, ARRAY, DECIMAL, DATETIME64]
+) -> Callable[[Any], ColType]:
+    """Return a function, that parses a non-null raw value of provided type.
+
+    Same as `parse_value`, but resolves the type only once.
+    """
+    if ctype in (int, str, float):
+        assert isinstance(ctype, type)
+        return ctype
+    if ctype is date:
+        return _parse_date
+    if ctype is datetime or isinstance(ctype, DATETIME64):
+        return _parse_datetime
+    if isinstance(ctype, DECIMAL):
+        return Decimal
+    if isinstance(ctype, ARRAY):
+        parse_item = value_parser(ctype.subtype)
+
+        def parse_array(value: RawColType) -> list:
+            assert isinstance(value, list)
+            return [None if it is None else parse_item(it) for it in value]
+
+        return parse_array
+    raise DataError(f"Unsupported data type returned: {ctype.__name__}")
+
+
+def row_parser(
+    ctypes: Sequence[Union[type, ARRAY, DECIMAL, DATETIME64]]
+) -> Callable[[List[RawColType]], List[ColType]]:
+    """Return a function, that parses a raw data row with provided column types.
+
+    Column parsers are resolved once. Values which already have the resulting
+    Python type (e.g. int and str JSON values) are not converted.
+    """
+    width = len(ctypes)
+    parsers = [
+        # Values of this class are returned as is by column parser
+        (i, value_parser(ctype), ctype if ctype in (int, str, float) else None)
+        for i, ctype in enumerate(ctypes)
+    ]
+
+    def parse_row(row: List[RawColType]) -> List[ColType]:
+        if len(row) != width:
+            raise DataError(
+                f"Invalid row length: expected {width} values, got {len(row)}"
+            )
+        parsed: List[ColType] = list(row)
+        for i, parse, result_class in parsers:
+            value = parsed[i]
+            if value is not None and value.__class__ is not result_class:
+                parsed[i] = parse(value)
+        return parsed
+
+    return parse_row
+
+
+def parse_column(
+    values: Sequence[RawColType], ctype: Union[type, ARRAY, DECIMAL, DATETIME64]
+) -> List[ColType]:
+    """Parse all raw values of a single column with provided type."""
+    parse = value_parser(ctype)
+    # Values of this class are returned as is by column parser
+    result_class = ctype if ctype in (int, str, float) else None
+    return [
+        value if value is None or value.__class__ is result_class else parse(value)
+        for value in values
+    ]
+
+
 escape_chars = {
     "\0": "\\0",
     "\\": "\\\\",
     "'": "\\'",
 }
+_escape_table = str.maketrans(escape_chars)
 
 
 def format_value(value: ParameterType) -> str:
@@ -288,7 +402,7 @@ def format_value(value: ParameterType) -> str:
     if isinstance(value, (int, float, Decimal)):
         return str(value)
     elif isinstance(value, str):
-        return f"'{''.join(escape_chars.get(c, c) for c in value)}'"
+        return f"'{value.translate(_escape_table)}'"
     elif isinstance(value, datetime):
         if value.tzinfo is not None:
             value = value.astimezone(timezone.utc)
@@ -338,6 +452,50 @@ def format_statement(statement: Statement, parameters: Sequence[ParameterType])
     return formatted_sql
 
 
+def format_insert_batches(
+    table: str,
+    columns: Optional[Sequence[str]],
+    rows: Iterable[Sequence[ParameterType]],
+    max_batch_rows: Optional[int],
+    max_batch_bytes: int,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Pack rows into multi-row `INSERT ... VALUES` statements.
+
+    Each statement contains at most `max_batch_rows` rows and takes at most
+    `max_batch_bytes` bytes, unless it consists of a single larger row.
+    Yields statements with number of rows in each of them.
+    """
+    prefix = f"INSERT INTO {table} "
+    if columns:
+        prefix += f"({', '.join(columns)}) "
+    prefix += "VALUES "
+    width = len(columns) if columns else None
+    batch: List[str] = []
+    size = len(prefix.encode("utf-8"))
+    for row in rows:
+        if width is None:
+            width = len(row)
+        if len(row) != width:
+            raise DataError(
+                f"Invalid row length: expected {width} values, got {len(row)}"
+            )
+        values = f"({', '.join(map(format_value, row))})"
+        # Values are separated by a comma
+        values_size = len(values.encode("utf-8")) + 1
+        if batch and (
+            size + values_size > max_batch_bytes
+            or (max_batch_rows is not None and len(batch) >= max_batch_rows)
+        ):
+            yield prefix + ",".join(batch), len(batch)
+            batch = []
+            size = len(prefix.encode("utf-8"))
+        batch.append(values)
+        size += values_size
+    if batch:
+        yield prefix + ",".join(batch), len(batch)
+
+
 SetParameter = namedtuple("SetParameter", ["name", "value"])
 
 
@@ -375,25 +533,129 @@ def statement_to_sql(statement: Statement) -> str:
     return str(statement).strip().rstrip(";")
 
 
+class PreparedStatement:
+    """
+    Query, split into statements which are parsed once and can be formatted
+    with different parameters without parsing them again.
+
+    Should not be created directly; use :py:func:`connection.prepare
+    <firebolt.async_db.connection.Connection.prepare>`
+
+    Args:
+        query (str): SQL query
+
+    Attributes:
+        query (str): SQL query
+    """
+
+    __slots__ = ("query", "_statements")
+
+    def __init__(self, query: str):
+        self.query = query
+        # Each statement is either a SET parameter, or its SQL along with SQL
+        # segments between placeholders
+        self._statements: List[Union[SetParameter, Tuple[str, List[str]]]] = []
+        statements = split_sql(query)
+        if statements is None:
+            self._parse_statements(query)
+            return
+        for statement in statements:
+            if statement.set_parameter is not None:
+                self._statements.append(SetParameter(*statement.set_parameter))
+            else:
+                self._statements.append((statement.sql, statement.segments))
+
+    def _parse_statements(self, query: str) -> None:
+        """Split query into statements with sqlparse, which is slower but handles
+        all SQL constructs."""
+        for statement in parse_sql(query):
+            set_parameter = statement_to_set(statement)
+            if set_parameter is not None:
+                self._statements.append(set_parameter)
+                continue
+            segments: List[str] = []
+            segment: List[str] = []
+            for token in statement.flatten():
+                if token.ttype == TokenType.Name.Placeholder:
+                    segments.append("".join(segment))
+                    segment = []
+                else:
+                    segment.append(str(token))
+            segments.append("".join(segment))
+            self._statements.append((statement_to_sql(statement), segments))
+
+    def __repr__(self) -> str:
+        return f"PreparedStatement({self.query!r})"
+
+    def format(
+        self, parameters: Sequence[Sequence[ParameterType]]
+    ) -> List[Union[str, SetParameter]]:
+        """
+        Multi-statement query formatting will result in `NotSupportedError`.
+        Instead, split a query into a separate statement and format with parameters.
+        """
+        if not self._statements:
+            return [self.query]
+
+        if parameters:
+            if len(self._statements) > 1:
+                raise NotSupportedError(
+                    "Formatting multi-statement queries is not supported."
+                )
+            statement = self._statements[0]
+            if isinstance(statement, SetParameter):
+                raise NotSupportedError("Formatting set statements is not supported.")
+            return [_format_segments(statement[1], paramset) for paramset in parameters]
+
+        return [
+            statement if isinstance(statement, SetParameter) else statement[0]
+            for statement in self._statements
+        ]
+
+
+def _format_segments(segments: List[str], parameters: Sequence[ParameterType]) -> str:
+    """Substitute placeholders between SQL segments with provided values."""
+    if len(parameters) != len(segments) - 1:
+        if len(parameters) < len(segments) - 1:
+            raise DataError(
+                "not enough parameters provided for substitution: given "
+                f"{len(parameters)}, found one more"
+            )
+        raise DataError(
+            f"too many parameters provided for substitution: given {len(parameters)}, "
+            f"used only {len(segments) - 1}"
+        )
+    parts = [segments[0]]
+    for value, segment in zip(parameters, segments[1:]):
+        parts.append(format_value(value))
+        parts.append(segment)
+    return "".join(parts).strip().rstrip(";")
+
+
+# Longer queries are parsed on each execution to limit memory used by the cache
+_MAX_CACHED_QUERY_LENGTH = 10000
+
+
+@lru_cache(maxsize=1024)
+def _cached_prepared_statement(query: str) -> PreparedStatement:
+    return PreparedStatement(query)
+
+
+def prepare_statement(query: str) -> PreparedStatement:
+    """Get prepared statement of a query, parsing only new queries."""
+    if len(query) > _MAX_CACHED_QUERY_LENGTH:
+        return PreparedStatement(query)
+    return _cached_prepared_statement(query)
+
+
 def split_format_sql(
-    query: str, parameters: Sequence[Sequence[ParameterType]]
+    query: Union[str, PreparedStatement],
+    parameters: Sequence[Sequence[ParameterType]],
 ) -> List[Union[str, SetParameter]]:
     """
     Multi-statement query formatting will result in `NotSupportedError`.
     Instead, split a query into a separate statement and format with parameters.
     """
-    statements = parse_sql(query)
-    if not statements:
-        return [query]
-
-    if parameters:
-        if len(statements) > 1:
-            raise NotSupportedError(
-                "Formatting multi-statement queries is not supported."
-            )
-        if statement_to_set(statements[0]):
-            raise NotSupportedError("Formatting set statements is not supported.")
-        return [format_statement(statements[0], paramset) for paramset in parameters]
-
-    # Try parsing each statement as a SET, otherwise return as a plain sql string
-    return [statement_to_set(st) or statement_to_sql(st) for st in statements]
+    if isinstance(query, str):
+        query = prepare_statement(query)
+    return query.format(parameters)
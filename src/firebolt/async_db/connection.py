@@ -1,24 +1,65 @@
 from __future__ import annotations
 
 import logging
-import socket
+from contextlib import contextmanager
+from functools import partial
 from json import JSONDecodeError
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
+from anyio import Lock
 from httpcore.backends.auto import AutoBackend
 from httpcore.backends.base import AsyncNetworkStream
-from httpx import AsyncHTTPTransport, HTTPStatusError, RequestError, Timeout
+from httpx import (
+    URL,
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    HTTPError,
+    HTTPStatusError,
+    Limits,
+    RequestError,
+    Timeout,
+    codes,
+)
 
-from firebolt.async_db.cursor import BaseCursor, Cursor
+from firebolt.async_db._json import get_json_decoder
+from firebolt.async_db._types import PreparedStatement, prepare_statement
+from firebolt.async_db.cursor import BaseCursor, Cursor, StreamingCursor
 from firebolt.client import DEFAULT_API_URL, AsyncClient
 from firebolt.client.auth import Auth, Token, UsernamePassword
+from firebolt.client.compression import get_compression
+from firebolt.client.transport import (
+    UnresolvedTransport,
+    limits_key,
+    set_keepalive,
+    ssl_context,
+    transport_registry,
+)
+from firebolt.utils.account_id_cache import auth_user_key
+from firebolt.utils.engine_url_cache import (
+    EngineUrlCache,
+    default_engine_url_cache,
+)
 from firebolt.utils.exception import (
     ConfigurationError,
     ConnectionClosedError,
     FireboltEngineError,
+    FireboltError,
     InterfaceError,
 )
+from firebolt.utils.result_cache import ResultCache
 from firebolt.utils.urls import (
     ACCOUNT_ENGINE_ID_BY_NAME_URL,
     ACCOUNT_ENGINE_URL,
@@ -28,8 +69,9 @@ from firebolt.utils.usage_tracker import get_user_agent_header
 from firebolt.utils.util import fix_url_schema
 
 DEFAULT_TIMEOUT_SECONDS: int = 60
-KEEPALIVE_FLAG: int = 1
-KEEPIDLE_RATE: int = 60  # seconds
+DEFAULT_HTTP_LIMITS = Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
 AUTH_CREDENTIALS_DEPRECATION_MESSAGE = """ Passing connection credentials
  directly to the `connect` function is deprecated.
  Pass the `Auth` object instead.
@@ -45,22 +87,26 @@ AUTH_CREDENTIALS_DEPRECATION_MESSAGE = """ Passing connection credentials
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str) -> Iterator[None]:
+    """Add execution time of a block to a bootstrap phase."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + perf_counter() - start
+
+
 async def _resolve_engine_url(
+    client: AsyncClient,
     engine_name: str,
-    auth: Auth,
-    api_endpoint: str,
-    account_name: Optional[str] = None,
+    timings: Dict[str, float],
 ) -> str:
-    async with AsyncClient(
-        auth=auth,
-        base_url=api_endpoint,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
-    ) as client:
+    with _timed(timings, "account"):
         account_id = await client.account_id
-        url = ACCOUNT_ENGINE_ID_BY_NAME_URL.format(account_id=account_id)
-        try:
+    url = ACCOUNT_ENGINE_ID_BY_NAME_URL.format(account_id=account_id)
+    try:
+        with _timed(timings, "engine"):
             response = await client.get(
                 url=url,
                 params={"engine_name": engine_name},
@@ -71,53 +117,47 @@ async def _resolve_engine_url(
             response = await client.get(url=url)
             response.raise_for_status()
             return response.json()["engine"]["endpoint"]
-        except HTTPStatusError as e:
-            # Engine error would be 404.
-            if e.response.status_code != 404:
-                raise InterfaceError(
-                    f"Error {e.__class__.__name__}: Unable to retrieve engine "
-                    f"endpoint {url}."
-                )
-            # Once this is point is reached we've already authenticated with
-            # the backend so it's safe to assume the cause of the error is
-            # missing engine.
-            raise FireboltEngineError(f"Firebolt engine {engine_name} does not exist.")
-        except (JSONDecodeError, RequestError, RuntimeError, HTTPStatusError) as e:
+    except HTTPStatusError as e:
+        # Engine error would be 404.
+        if e.response.status_code != 404:
             raise InterfaceError(
-                f"Error {e.__class__.__name__}: "
-                f"Unable to retrieve engine endpoint {url}."
+                f"Error {e.__class__.__name__}: Unable to retrieve engine "
+                f"endpoint {url}."
             )
+        # Once this is point is reached we've already authenticated with
+        # the backend so it's safe to assume the cause of the error is
+        # missing engine.
+        raise FireboltEngineError(f"Firebolt engine {engine_name} does not exist.")
+    except (JSONDecodeError, RequestError, RuntimeError, HTTPStatusError) as e:
+        raise InterfaceError(
+            f"Error {e.__class__.__name__}: "
+            f"Unable to retrieve engine endpoint {url}."
+        )
 
 
 async def _get_database_default_engine_url(
+    client: AsyncClient,
     database: str,
-    auth: Auth,
-    api_endpoint: str,
-    account_name: Optional[str] = None,
+    timings: Dict[str, float],
 ) -> str:
-    async with AsyncClient(
-        auth=auth,
-        base_url=api_endpoint,
-        account_name=account_name,
-        api_endpoint=api_endpoint,
-        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
-    ) as client:
-        try:
+    try:
+        with _timed(timings, "account"):
             account_id = await client.account_id
+        with _timed(timings, "engine"):
             response = await client.get(
                 url=ACCOUNT_ENGINE_URL_BY_DATABASE_NAME.format(account_id=account_id),
                 params={"database_name": database},
             )
             response.raise_for_status()
             return response.json()["engine_url"]
-        except (
-            JSONDecodeError,
-            RequestError,
-            RuntimeError,
-            HTTPStatusError,
-            KeyError,
-        ) as e:
-            raise InterfaceError(f"Unable to retrieve default engine endpoint: {e}.")
+    except (
+        JSONDecodeError,
+        RequestError,
+        RuntimeError,
+        HTTPStatusError,
+        KeyError,
+    ) as e:
+        raise InterfaceError(f"Unable to retrieve default engine endpoint: {e}.")
 
 
 def _validate_engine_name_and_url(
@@ -162,6 +202,122 @@ def _get_auth(
     return Token(access_token)
 
 
+def _get_result_cache(result_cache: Any) -> Optional[ResultCache]:
+    if result_cache is None or result_cache is False:
+        return None
+    if result_cache is True:
+        return ResultCache()
+    if not isinstance(result_cache, ResultCache):
+        raise ConfigurationError(
+            "Invalid result_cache: ResultCache instance or bool expected, "
+            f"got {type(result_cache).__name__}"
+        )
+    return result_cache
+
+
+def _get_engine_url_cache(engine_url_cache: Any) -> Optional[EngineUrlCache]:
+    if engine_url_cache is None or engine_url_cache is False:
+        return None
+    if engine_url_cache is True:
+        return default_engine_url_cache
+    if not isinstance(engine_url_cache, EngineUrlCache):
+        raise ConfigurationError(
+            "Invalid engine_url_cache: EngineUrlCache instance or bool expected, "
+            f"got {type(engine_url_cache).__name__}"
+        )
+    return engine_url_cache
+
+
+def _get_http_limits(limits: Any) -> Limits:
+    if limits is None:
+        return DEFAULT_HTTP_LIMITS
+    if not isinstance(limits, Limits):
+        raise ConfigurationError(
+            "Invalid http_limits: httpx.Limits instance expected, "
+            f"got {type(limits).__name__}"
+        )
+    return limits
+
+
+def _engine_url_cache_key(
+    auth: Auth,
+    api_endpoint: str,
+    account_name: Optional[str],
+    engine_name: Optional[str],
+    database: str,
+) -> Tuple[str, ...]:
+    """Build a cache key of an engine URL.
+
+    Default account and available engines depend on the user, so the key
+    includes user identity.
+    """
+    user = auth_user_key(auth)
+    if engine_name:
+        return (api_endpoint, account_name or "", user, "engine", engine_name)
+    return (api_endpoint, account_name or "", user, "database", database)
+
+
+async def _get_engine_url(
+    auth: Auth,
+    api_endpoint: str,
+    account_name: Optional[str],
+    engine_name: Optional[str],
+    engine_url: Optional[str],
+    database: str,
+    engine_url_cache: Optional[EngineUrlCache],
+    timings: Dict[str, float],
+) -> str:
+    """Resolve engine url by engine name or get database default engine url,
+    unless it's provided.
+
+    All requests are sent with a single client, time of each step is added to
+    `timings`.
+    """
+    if engine_url and not account_name:
+        return fix_url_schema(engine_url)
+
+    cache_key = _engine_url_cache_key(
+        auth, api_endpoint, account_name, engine_name, database
+    )
+    if not engine_url and engine_url_cache is not None:
+        engine_url = engine_url_cache.get(cache_key)
+        if engine_url:
+            # Credentials and account are still validated below, so connect
+            # fails the same way with a cached url
+            logger.debug(f"Using cached engine url {engine_url}.")
+
+    async with AsyncClient(
+        auth=auth,
+        base_url=api_endpoint,
+        account_name=account_name,
+        api_endpoint=api_endpoint,
+        timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
+        transport=AsyncHTTPTransport(verify=ssl_context()),
+    ) as client:
+        with _timed(timings, "authentication"):
+            await client.authenticate()
+
+        if engine_url:
+            # In below branches account name is validated since it's used to
+            # resolve or get an engine url.
+            # We need to manually validate account_name if engine url is
+            # provided or cached.
+            with _timed(timings, "account"):
+                await client.account_id
+            return fix_url_schema(engine_url)
+
+        if engine_name:
+            engine_url = await _resolve_engine_url(client, engine_name, timings)
+        else:
+            engine_url = await _get_database_default_engine_url(
+                client, database, timings
+            )
+    engine_url = fix_url_schema(engine_url)
+    if engine_url_cache is not None:
+        engine_url_cache.put(cache_key, engine_url)
+    return engine_url
+
+
 def async_connect_factory(connection_class: Type) -> Callable:
     async def connect_inner(
         database: str = None,
@@ -175,6 +331,7 @@ def async_connect_factory(connection_class: Type) -> Callable:
         api_endpoint: str = DEFAULT_API_URL,
         use_token_cache: bool = True,
         additional_parameters: Dict[str, Any] = {},
+        lazy: bool = False,
     ) -> Connection:
         """Connect to Firebolt database.
 
@@ -193,7 +350,36 @@ def async_connect_factory(connection_class: Type) -> Callable:
             `use_token_cache` (bool): Cached authentication token in filesystem
                                     Default: True
             `additional_parameters` (Optional[Dict]): Dictionary of less widely-used
-                                    arguments for connection
+                                    arguments for connection. `json_decoder` sets
+                                    the decoder of query results: "auto"
+                                    (default), "json", "orjson", "simdjson" or
+                                    a callable. `result_cache` enables caching
+                                    of SELECT results: True or a `ResultCache`.
+                                    `compression` sets the encoding of query
+                                    results: "gzip", "deflate", "br", "zstd"
+                                    or True for the best supported one.
+                                    `set_parameters` is a dictionary of SET
+                                    parameters applied to every cursor.
+                                    `engine_url_cache` caches engine URLs,
+                                    resolved by `engine_name` or `database`:
+                                    True (default), False or an
+                                    `EngineUrlCache`. `http_limits` sets
+                                    `httpx.Limits` of the connection pool,
+                                    shared by connections to the same engine.
+                                    `shared_transport` set to False gives the
+                                    connection its own connection pool.
+                                    `http2` set to True enables HTTP/2, so
+                                    concurrent queries share one connection
+            `lazy` (bool): Return the connection right away, and resolve the
+                                    engine url and authenticate on the first
+                                    query. Errors are raised by the first query
+                                    Default: False
+
+        Returns:
+            Connection: Connection, which `bootstrap_timings` contains time in
+                seconds, spent in each phase of connecting: "authentication",
+                "account", "engine" (engine url lookup), "connection" and
+                "total". Phases, that were skipped, are missing
 
         Note:
             Providing both `engine_name` and `engine_url` will result in an error
@@ -218,40 +404,38 @@ def async_connect_factory(connection_class: Type) -> Callable:
         # Mypy checks, this should never happen
         assert database is not None
 
-        if not engine_name and not engine_url:
-            engine_url = await _get_database_default_engine_url(
-                database=database,
-                auth=auth,
-                account_name=account_name,
-                api_endpoint=api_endpoint,
+        get_engine_url = partial(
+            _get_engine_url,
+            auth=auth,
+            api_endpoint=api_endpoint,
+            account_name=account_name,
+            engine_name=engine_name,
+            engine_url=engine_url,
+            database=database,
+            engine_url_cache=_get_engine_url_cache(
+                additional_parameters.get("engine_url_cache", True)
+            ),
+        )
+        if lazy:
+            return connection_class(
+                "",
+                database,
+                auth,
+                api_endpoint,
+                additional_parameters,
+                engine_url_resolver=get_engine_url,
             )
 
-        elif engine_name:
-            engine_url = await _resolve_engine_url(
-                engine_name=engine_name,
-                auth=auth,
-                account_name=account_name,
-                api_endpoint=api_endpoint,
+        start = perf_counter()
+        timings: Dict[str, float] = {}
+        engine_url = await get_engine_url(timings=timings)
+        with _timed(timings, "connection"):
+            connection = connection_class(
+                engine_url, database, auth, api_endpoint, additional_parameters
             )
-        elif account_name:
-            # In above if branches account name is validated since it's used to
-            # resolve or get an engine url.
-            # We need to manually validate account_name if none of the above
-            # cases are triggered.
-            async with AsyncClient(
-                auth=auth,
-                base_url=api_endpoint,
-                account_name=account_name,
-                api_endpoint=api_endpoint,
-            ) as client:
-                await client.account_id
-
-        assert engine_url is not None
-
-        engine_url = fix_url_schema(engine_url)
-        return connection_class(
-            engine_url, database, auth, api_endpoint, additional_parameters
-        )
+        timings["total"] = perf_counter() - start
+        connection.bootstrap_timings.update(timings)
+        return connection
 
     return connect_inner
 
@@ -276,25 +460,12 @@ class OverriddenHttpBackend(AutoBackend):
         stream = await super().connect_tcp(
             host, port, timeout=timeout, local_address=local_address
         )
-        # Enable keepalive
-        stream.get_extra_info("socket").setsockopt(
-            socket.SOL_SOCKET, socket.SO_KEEPALIVE, KEEPALIVE_FLAG
-        )
-        # MacOS does not have TCP_KEEPIDLE
-        if hasattr(socket, "TCP_KEEPIDLE"):
-            keepidle = socket.TCP_KEEPIDLE
-        else:
-            keepidle = 0x10  # TCP_KEEPALIVE on mac
-
-        # Set keepalive to 60 seconds
-        stream.get_extra_info("socket").setsockopt(
-            socket.IPPROTO_TCP, keepidle, KEEPIDLE_RATE
-        )
+        set_keepalive(stream.get_extra_info("socket"))
         return stream
 
 
 class BaseConnection:
-    client_class: type
+    client_class: type = AsyncClient
     cursor_class: type
     __slots__ = (
         "_client",
@@ -303,6 +474,16 @@ class BaseConnection:
         "engine_url",
         "api_endpoint",
         "_is_closed",
+        "_json_decoder",
+        "_compression",
+        "_set_parameters",
+        "_validated_set_parameters",
+        "result_cache",
+        "_engine_url_cache",
+        "_additional_parameters",
+        "_engine_url_resolver",
+        "_engine_url_lock",
+        "bootstrap_timings",
     )
 
     def __init__(
@@ -312,27 +493,108 @@ class BaseConnection:
         auth: Auth,
         api_endpoint: str = DEFAULT_API_URL,
         additional_parameters: Dict[str, Any] = {},
+        engine_url_resolver: Optional[Callable[..., Awaitable[str]]] = None,
     ):
-        # Override tcp keepalive settings for connection
-        transport = AsyncHTTPTransport()
-        transport._pool._network_backend = OverriddenHttpBackend()
         user_drivers = additional_parameters.get("user_drivers", [])
         user_clients = additional_parameters.get("user_clients", [])
-        self._client = AsyncClient(
+        self._client = self.client_class(
             auth=auth,
             base_url=engine_url,
             api_endpoint=api_endpoint,
             timeout=Timeout(DEFAULT_TIMEOUT_SECONDS, read=None),
-            transport=transport,
+            transport=(
+                UnresolvedTransport()
+                if engine_url_resolver is not None
+                else self._get_transport(engine_url, additional_parameters)
+            ),
             headers={"User-Agent": get_user_agent_header(user_drivers, user_clients)},
         )
+        self._additional_parameters = additional_parameters
+        # Resolves engine url of a lazy connection on the first query
+        self._engine_url_resolver = engine_url_resolver
+        self._engine_url_lock = self._create_engine_url_lock()
+        # Time in seconds, spent in each phase of connecting
+        self.bootstrap_timings: Dict[str, float] = {}
         self.api_endpoint = api_endpoint
         self.engine_url = engine_url
         self.database = database
         self._cursors: List[BaseCursor] = []
         self._is_closed = False
+        self._json_decoder = get_json_decoder(
+            additional_parameters.get("json_decoder", "auto")
+        )
+        self._compression = get_compression(additional_parameters.get("compression"))
+        # Default SET parameters of every cursor, validated on first query
+        self._set_parameters: Dict[str, Any] = dict(
+            additional_parameters.get("set_parameters") or {}
+        )
+        # (name, value) pairs of SET parameters, that passed validation
+        self._validated_set_parameters: Set[Tuple[str, Any]] = set()
+        self.result_cache = _get_result_cache(additional_parameters.get("result_cache"))
+        self._engine_url_cache = _get_engine_url_cache(
+            additional_parameters.get("engine_url_cache", True)
+        )
+
+    @staticmethod
+    def _create_engine_url_lock() -> Any:
+        return Lock()
 
-    def _cursor(self, **kwargs: Any) -> BaseCursor:
+    async def _ensure_engine_url(self) -> None:
+        """Resolve engine url of a lazy connection, if it's not resolved yet.
+
+        Concurrent first queries wait for a single resolution. If it fails,
+        it's retried by the next query.
+        """
+        if self._engine_url_resolver is None:
+            return
+        async with self._engine_url_lock:
+            if self._engine_url_resolver is not None:
+                with _timed(self.bootstrap_timings, "total"):
+                    engine_url = await self._engine_url_resolver(
+                        timings=self.bootstrap_timings
+                    )
+                self._set_engine_url(engine_url)
+
+    def _set_engine_url(self, engine_url: str) -> None:
+        self.engine_url = engine_url
+        self._client.base_url = engine_url
+        # Placeholder transport doesn't hold any resources, so it's not closed
+        self._client._transport = self._get_transport(
+            engine_url, self._additional_parameters
+        )
+        self._engine_url_resolver = None
+
+    def _create_transport(self, limits: Limits, http2: bool) -> AsyncHTTPTransport:
+        # Override tcp keepalive settings for connection
+        transport = AsyncHTTPTransport(
+            verify=ssl_context(http2), limits=limits, http2=http2
+        )
+        transport._pool._network_backend = OverriddenHttpBackend()
+        return transport
+
+    def _share_transport(
+        self, key: Tuple, create: Callable[[], AsyncHTTPTransport]
+    ) -> AsyncBaseTransport:
+        return transport_registry.async_transport(key, create)
+
+    def _get_transport(
+        self, engine_url: str, additional_parameters: Dict[str, Any]
+    ) -> AsyncBaseTransport:
+        """Borrow the transport of the engine, shared by its connections.
+
+        Transport holds a pool of keep-alive connections, so reusing it saves
+        TCP and TLS handshakes.
+        """
+        limits = _get_http_limits(additional_parameters.get("http_limits"))
+        http2 = bool(additional_parameters.get("http2", False))
+        create = partial(self._create_transport, limits, http2)
+        if not additional_parameters.get("shared_transport", True):
+            return create()
+        url = URL(engine_url)
+        key = (url.scheme, url.host, url.port, limits_key(limits), http2)
+        return self._share_transport(key, create)
+
+    def _cursor(self, cursor_class: Optional[type] = None, **kwargs: Any) -> BaseCursor:
         """
         Create new cursor object.
         """
@@ -340,31 +602,67 @@ class BaseConnection:
         if self.closed:
             raise ConnectionClosedError("Unable to create cursor: connection closed.")
 
-        c = self.cursor_class(self._client, self, **kwargs)
+        c = (cursor_class or self.cursor_class)(self._client, self, **kwargs)
         self._cursors.append(c)
         return c
 
+    def prepare(self, query: str) -> PreparedStatement:
+        """Parse a query once, to execute it many times with different parameters.
+
+        The returned statement can be passed to cursor's `execute` and
+        `executemany` instead of the query text.
+
+        Args:
+            query (str): SQL query with '?' placeholders
+
+        Returns:
+            PreparedStatement: Parsed query
+        """
+        return prepare_statement(query)
+
     async def _aclose(self) -> None:
         """Close connection and all underlying cursors."""
         if self.closed:
             return
 
-        # self._cursors is going to be changed during closing cursors
         # after this point no cursors would be added to _cursors, only removed since
         # closing lock is held, and later connection will be marked as closed
-        cursors = self._cursors[:]
-        for c in cursors:
-            # Here c can already be closed by another thread,
-            # but it shouldn't raise an error in this case
-            c.close()
+        await self._close_cursors()
         await self._client.aclose()
         self._is_closed = True
 
+    async def _close_cursors(self) -> None:
+        """Close all cursors, including result streams of streaming cursors."""
+        # self._cursors is going to be changed during closing cursors
+        for c in self._cursors[:]:
+            if isinstance(c, StreamingCursor):
+                await c.aclose()
+            else:
+                # Here c can already be closed by another thread,
+                # but it shouldn't raise an error in this case
+                c.close()
+
     @property
     def closed(self) -> bool:
         """`True` if connection is closed; `False` otherwise."""
         return self._is_closed
 
+    async def _is_alive(self) -> bool:
+        """Check that the engine responds to a `select 1` query.
+
+        Unlike a cursor query, the check bypasses the result cache.
+        """
+        if self.closed:
+            return False
+        cursor = self._cursor()
+        try:
+            resp = await cursor._api_request("select 1", use_set_parameters=False)
+            return resp.status_code == codes.OK
+        except (HTTPError, FireboltError):
+            return False
+        finally:
+            cursor.close()
+
     def _remove_cursor(self, cursor: Cursor) -> None:
         # This way it's atomic
         try:
@@ -411,6 +709,13 @@ class Connection(BaseConnection):
         assert isinstance(c, Cursor)  # typecheck
         return c
 
+    def streaming_cursor(self) -> StreamingCursor:
+        """Create a cursor, which reads query results from the server lazily,
+        as rows are fetched."""
+        c = super()._cursor(cursor_class=StreamingCursor)
+        assert isinstance(c, StreamingCursor)  # typecheck
+        return c
+
     # Context manager support
     async def __aenter__(self) -> Connection:
         if self.closed:
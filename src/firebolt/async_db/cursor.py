@@ -3,14 +3,20 @@ from __future__ import annotations
 import logging
 import re
 import time
+from codecs import getincrementaldecoder
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
+from json import loads as json_loads
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     Dict,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -19,17 +25,34 @@ from typing import (
 )
 
 from aiorwlock import RWLock
-from httpx import Response, codes
+from anyio import create_task_group
+from httpx import Request, Response, codes
 from pydantic import BaseModel
 
+from firebolt.async_db._columnar import (
+    columns_from_rows,
+    require_numpy,
+    require_pandas,
+    require_pyarrow,
+    to_arrow_batch,
+    to_arrow_table,
+    to_dataframe,
+    to_numpy_array,
+)
+from firebolt.async_db._json import decode_json_lines, decode_query_data
+from firebolt.async_db._tsv import split_tsv_header, tsv_rows_decoder
 from firebolt.async_db._types import (
     ColType,
     Column,
     ParameterType,
+    PreparedStatement,
     RawColType,
     SetParameter,
+    float_text_required,
+    format_insert_batches,
+    parse_column,
     parse_type,
-    parse_value,
+    row_parser,
     split_format_sql,
 )
 from firebolt.async_db.util import is_db_available, is_engine_running
@@ -39,11 +62,14 @@ from firebolt.utils.exception import (
     CursorClosedError,
     DataError,
     EngineNotRunningError,
+    ExecuteManyError,
     FireboltDatabaseError,
+    NotSupportedError,
     OperationalError,
     ProgrammingError,
     QueryNotRunError,
 )
+from firebolt.utils.util import gc_disabled
 
 if TYPE_CHECKING:
     from firebolt.async_db.connection import Connection
@@ -52,6 +78,17 @@ logger = logging.getLogger(__name__)
 
 
 JSON_OUTPUT_FORMAT = "JSONCompact"
+# Row-per-line format, first two lines contain column names and types
+STREAMING_OUTPUT_FORMAT = "JSONCompactEachRowWithNamesAndTypes"
+# Tab separated values, first two lines contain column names and types
+TSV_OUTPUT_FORMAT = "TabSeparatedWithNamesAndTypes"
+OUTPUT_FORMATS = (JSON_OUTPUT_FORMAT, TSV_OUTPUT_FORMAT)
+
+# Only results of these statements are cached, leading comments are skipped
+_CACHEABLE_QUERY_RE = re.compile(
+    r"\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*(?:select|with)\b",
+    flags=re.IGNORECASE | re.DOTALL,
+)
 
 
 class CursorState(Enum):
@@ -88,6 +125,32 @@ class Statistics(BaseModel):
     scanned_bytes_storage: Optional[float]
 
 
+# Query result: row count, column descriptions, statistics and raw rows
+RowSet = Tuple[
+    int,
+    Optional[List[Column]],
+    Optional[Statistics],
+    Optional[List[List[RawColType]]],
+]
+
+
+def _query_text(query: Union[str, PreparedStatement]) -> str:
+    return query if isinstance(query, str) else query.query
+
+
+def _leading_set_parameters(
+    queries: Sequence[Union[SetParameter, str]], start: int
+) -> List[SetParameter]:
+    """Consecutive SET parameters, starting from `start` query."""
+    parameters = []
+    for i in range(start, len(queries)):
+        query = queries[i]
+        if not isinstance(query, SetParameter):
+            break
+        parameters.append(query)
+    return parameters
+
+
 def check_not_closed(func: Callable) -> Callable:
     """(Decorator) ensure cursor is not closed before calling method."""
 
@@ -131,6 +194,10 @@ class BaseCursor:
         "_next_set_idx",
         "_set_parameters",
         "_query_id",
+        "_row_parser",
+        "_output_format",
+        "_bytes_received",
+        "_bytes_decoded",
     )
 
     default_arraysize = 1
@@ -139,10 +206,12 @@ class BaseCursor:
         self.connection = connection
         self._client = client
         self._arraysize = self.default_arraysize
+        self._output_format = JSON_OUTPUT_FORMAT
         # These fields initialized here for type annotations purpose
         self._rows: Optional[List[List[RawColType]]] = None
         self._descriptions: Optional[List[Column]] = None
         self._statistics: Optional[Statistics] = None
+        self._row_parser: Optional[Callable[[List[RawColType]], List[ColType]]] = None
         self._row_sets: List[
             Tuple[
                 int,
@@ -151,7 +220,7 @@ class BaseCursor:
                 Optional[List[List[RawColType]]],
             ]
         ] = []
-        self._set_parameters: Dict[str, Any] = dict()
+        self._set_parameters: Dict[str, Any] = dict(connection._set_parameters)
         self._rowcount = -1
         self._idx = 0
         self._next_set_idx = 0
@@ -196,6 +265,21 @@ class BaseCursor:
         """The query id of a query executed asynchronously."""
         return self._query_id
 
+    @property  # type: ignore
+    @check_not_closed
+    def bytes_received(self) -> int:
+        """Size of query responses, as transferred over the network.
+
+        Less than `bytes_decoded` if responses are compressed.
+        """
+        return self._bytes_received
+
+    @property  # type: ignore
+    @check_not_closed
+    def bytes_decoded(self) -> int:
+        """Size of query responses after decompression."""
+        return self._bytes_decoded
+
     @property
     def arraysize(self) -> int:
         """Default number of rows returned by fetchmany."""
@@ -210,6 +294,25 @@ class BaseCursor:
             )
         self._arraysize = value
 
+    @property
+    def output_format(self) -> str:
+        """Read/Write, format in which query results are requested from server.
+
+        One of "JSONCompact" (default) or "TabSeparatedWithNamesAndTypes".
+        Tab separated results are smaller and faster to parse, but don't include
+        query statistics.
+        """
+        return self._output_format
+
+    @output_format.setter
+    def output_format(self, value: str) -> None:
+        if value not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid output_format {value}, expected one of "
+                f"{', '.join(OUTPUT_FORMATS)}"
+            )
+        self._output_format = value
+
     @property
     def closed(self) -> bool:
         """True if connection is closed, False otherwise."""
@@ -244,12 +347,21 @@ class BaseCursor:
             self._statistics,
             self._rows,
         ) = self._row_sets[self._next_set_idx]
+        self._set_row_parser()
         self._idx = 0
         self._next_set_idx += 1
         return True
 
+    def _set_row_parser(self) -> None:
+        """Precompile row parser for current result set column types."""
+        self._row_parser = (
+            row_parser([d.type_code for d in self._descriptions])
+            if self._descriptions is not None
+            else None
+        )
+
     def flush_parameters(self) -> None:
-        self._set_parameters = dict()
+        self._set_parameters = dict(self.connection._set_parameters)
 
     async def _raise_if_error(self, resp: Response) -> None:
         """Raise a proper error if any"""
@@ -258,7 +370,7 @@ class BaseCursor:
                 f"Error executing query:\n{resp.read().decode('utf-8')}"
             )
         if resp.status_code == codes.FORBIDDEN:
-            if not await is_db_available(self.connection, self.connection.database):
+            if not await self._is_db_available():
                 raise FireboltDatabaseError(
                     f"Database {self.connection.database} does not exist"
                 )
@@ -267,24 +379,46 @@ class BaseCursor:
             resp.status_code == codes.SERVICE_UNAVAILABLE
             or resp.status_code == codes.NOT_FOUND
         ):
-            if not await is_engine_running(self.connection, self.connection.engine_url):
+            # Engine might have been restarted with a different URL
+            if self.connection._engine_url_cache is not None:
+                self.connection._engine_url_cache.invalidate(self.connection.engine_url)
+            if not await self._is_engine_running():
                 raise EngineNotRunningError(
                     f"Firebolt engine {self.connection.engine_url} "
                     "needs to be running to run queries against it."
                 )
         resp.raise_for_status()
 
+    async def _is_db_available(self) -> bool:
+        return await is_db_available(self.connection, self.connection.database)
+
+    async def _is_engine_running(self) -> bool:
+        return await is_engine_running(self.connection, self.connection.engine_url)
+
     def _reset(self) -> None:
         """Clear all data stored from previous query."""
         self._state = CursorState.NONE
         self._rows = None
         self._descriptions = None
         self._statistics = None
+        self._row_parser = None
         self._rowcount = -1
         self._idx = 0
         self._row_sets = []
         self._next_set_idx = 0
         self._query_id = ""
+        self._bytes_received = 0
+        self._bytes_decoded = 0
+
+    def _count_response_bytes(self, response: Response, decoded: int) -> None:
+        """Add size of a query response to the byte counts of executed query."""
+        self._bytes_received += response.num_bytes_downloaded
+        self._bytes_decoded += decoded
+        logger.debug(
+            "Query response: %d bytes received, %d bytes decoded",
+            response.num_bytes_downloaded,
+            decoded,
+        )
 
     def _row_set_from_response(
         self, response: Response
@@ -299,9 +433,12 @@ class BaseCursor:
         # Empty response is returned for insert query
         if response.headers.get("content-length", "") == "0":
             return (-1, None, None, None)
+        if self._output_format == TSV_OUTPUT_FORMAT:
+            return self._row_set_from_tsv(response)
         try:
-            # Skip parsing floats to properly parse them later
-            query_data = response.json(parse_float=str)
+            query_data = decode_query_data(
+                response.content, self.connection._json_decoder
+            )
             rowcount = int(query_data["rows"])
             descriptions = [
                 Column(d["name"], parse_type(d["type"]), None, None, None, None, None)
@@ -314,6 +451,25 @@ class BaseCursor:
         except (KeyError, ValueError) as err:
             raise DataError(f"Invalid query data format: {str(err)}")
 
+    def _row_set_from_tsv(self, response: Response) -> RowSet:
+        """Fetch information about executed query from tab separated response."""
+        with gc_disabled():
+            lines = response.content.decode("utf-8").split("\n")
+            # Last line break is followed by an empty string
+            if lines[-1] == "":
+                lines.pop()
+            if len(lines) < 2:
+                raise DataError(
+                    "Invalid query data format: column names and types expected"
+                )
+            names, types = split_tsv_header(lines[0]), split_tsv_header(lines[1])
+            descriptions = [
+                Column(name, parse_type(raw_type), None, None, None, None, None)
+                for name, raw_type in zip(names, types)
+            ]
+            rows = tsv_rows_decoder(types)(lines[2:])
+        return (len(rows), descriptions, None, rows)
+
     def _append_row_set(
         self,
         row_set: Tuple[
@@ -335,10 +491,39 @@ class BaseCursor:
         parameters: Optional[dict[str, Any]] = {},
         path: Optional[str] = "",
         use_set_parameters: Optional[bool] = True,
+        stream: bool = False,
     ) -> Response:
         """
         Query API, return Response object.
 
+        Args:
+            query (str): SQL query
+            parameters (Optional[Sequence[ParameterType]]): A sequence of substitution
+                parameters. Used to replace '?' placeholders inside a query with
+                actual values. Note: In order to "output_format" dict value, it
+                    must be an empty string. If no value not specified,
+                    JSON_OUTPUT_FORMAT will be used.
+            path (str): endpoint suffix, for example "cancel" or "status"
+            use_set_parameters: Optional[bool]: Some queries will fail if additional
+                set parameters are sent. Setting this to False will allow
+                self._set_parameters to be ignored.
+            stream (bool): Don't read the response body. It should be read
+                and closed by the caller.
+        """
+        await self.connection._ensure_engine_url()
+        request = self._build_api_request(query, parameters, path, use_set_parameters)
+        return await self._client.send(request, stream=stream)
+
+    def _build_api_request(
+        self,
+        query: Optional[str] = "",
+        parameters: Optional[dict[str, Any]] = {},
+        path: Optional[str] = "",
+        use_set_parameters: Optional[bool] = True,
+    ) -> Request:
+        """
+        Build a query API request.
+
         Args:
             query (str): SQL query
             parameters (Optional[Sequence[ParameterType]]): A sequence of substitution
@@ -353,7 +538,11 @@ class BaseCursor:
         """
         if use_set_parameters:
             parameters = {**(self._set_parameters or {}), **(parameters or {})}
-        return await self._client.request(
+        headers = {}
+        if self.connection._compression:
+            parameters = {"enable_http_compression": 1, **(parameters or {})}
+            headers["Accept-Encoding"] = self.connection._compression
+        return self._client.build_request(
             url=f"/{path}",
             method="POST",
             params={
@@ -361,6 +550,7 @@ class BaseCursor:
                 **(parameters or dict()),
             },
             content=query,
+            headers=headers,
         )
 
     async def _validate_set_parameter(self, parameter: SetParameter) -> None:
@@ -371,15 +561,51 @@ class BaseCursor:
                 "Instead, pass it as an argument to the execute() or "
                 "executemany() function."
             )
-        resp = await self._api_request("select 1", {parameter.name: parameter.value})
-        # Handle invalid set parameter
-        if resp.status_code == codes.BAD_REQUEST:
-            raise OperationalError(resp.text)
-        await self._raise_if_error(resp)
+        validated = self.connection._validated_set_parameters
+        if (parameter.name, parameter.value) not in validated:
+            resp = await self._api_request(
+                "select 1", {parameter.name: parameter.value}
+            )
+            # Handle invalid set parameter
+            if resp.status_code == codes.BAD_REQUEST:
+                raise OperationalError(resp.text)
+            await self._raise_if_error(resp)
+            validated.add((parameter.name, parameter.value))
 
         # set parameter passed validation
         self._set_parameters[parameter.name] = parameter.value
 
+    async def _validate_set_parameters(self, parameters: List[SetParameter]) -> None:
+        """Validate parameters, that weren't validated on this connection before,
+        with a single query. If it fails, validate them one by one to find the
+        invalid parameter."""
+        validated = self.connection._validated_set_parameters
+        pending = {
+            parameter.name: parameter.value
+            for parameter in parameters
+            if (parameter.name, parameter.value) not in validated
+        }
+        if (
+            len(pending) > 1
+            and len(pending) == len(parameters)
+            and "async_execution" not in pending
+        ):
+            resp = await self._api_request("select 1", pending)
+            if resp.status_code == codes.OK:
+                validated.update(pending.items())
+        for parameter in parameters:
+            await self._validate_set_parameter(parameter)
+
+    async def _validate_default_set_parameters(self) -> None:
+        """Validate connection default parameters, if it wasn't done yet."""
+        if self.connection._set_parameters:
+            await self._validate_set_parameters(
+                [
+                    SetParameter(name, value)
+                    for name, value in self.connection._set_parameters.items()
+                ]
+            )
+
     def _validate_server_side_async_settings(
         self,
         parameters: Sequence[Sequence[ParameterType]],
@@ -409,7 +635,7 @@ class BaseCursor:
 
     async def _do_execute(
         self,
-        raw_query: str,
+        raw_query: Union[str, PreparedStatement],
         parameters: Sequence[Sequence[ParameterType]],
         skip_parsing: bool = False,
         async_execution: Optional[bool] = False,
@@ -417,10 +643,15 @@ class BaseCursor:
         self._reset()
         # Allow users to manually skip parsing for performance improvement.
         queries: List[Union[SetParameter, str]] = (
-            [raw_query] if skip_parsing else split_format_sql(raw_query, parameters)
+            [_query_text(raw_query)]
+            if skip_parsing
+            else split_format_sql(raw_query, parameters)
         )
         try:
-            for query in queries:
+            # Result cache key depends on engine url
+            await self.connection._ensure_engine_url()
+            await self._validate_default_set_parameters()
+            for i, query in enumerate(queries):
 
                 start_time = time.time()
                 # Our CREATE EXTERNAL TABLE queries currently require credentials,
@@ -439,7 +670,11 @@ class BaseCursor:
                     Optional[List[List[RawColType]]],
                 ] = (-1, None, None, None)
                 if isinstance(query, SetParameter):
-                    await self._validate_set_parameter(query)
+                    # Consecutive SET statements are validated together
+                    if i == 0 or not isinstance(queries[i - 1], SetParameter):
+                        await self._validate_set_parameters(
+                            _leading_set_parameters(queries, i)
+                        )
                 elif async_execution:
                     self._validate_server_side_async_settings(
                         parameters,
@@ -465,11 +700,7 @@ class BaseCursor:
                         )
                     self._query_id = resp["query_id"]
                 else:
-                    resp = await self._api_request(
-                        query, {"output_format": JSON_OUTPUT_FORMAT}
-                    )
-                    await self._raise_if_error(resp)
-                    row_set = self._row_set_from_response(resp)
+                    row_set = await self._execute_query(query)
 
                 self._append_row_set(row_set)
 
@@ -484,10 +715,101 @@ class BaseCursor:
             self._state = CursorState.ERROR
             raise
 
+    async def _do_execute_concurrently(
+        self,
+        raw_query: Union[str, PreparedStatement],
+        parameters: Sequence[Sequence[ParameterType]],
+        concurrency: int,
+    ) -> None:
+        self._reset()
+        try:
+            queries = split_format_sql(raw_query, parameters)
+            # Result cache key depends on engine url
+            await self.connection._ensure_engine_url()
+            await self._validate_default_set_parameters()
+        except Exception:
+            self._state = CursorState.ERROR
+            raise
+        row_sets: List[RowSet] = [(-1, None, None, None)] * len(queries)
+        errors: List[Optional[Exception]] = [None] * len(queries)
+        start_time = time.time()
+        await self._execute_queries_concurrently(queries, row_sets, errors, concurrency)
+        logger.info(
+            f"Executed {len(queries)} queries in {time.time() - start_time} seconds."
+        )
+
+        for row_set in row_sets:
+            self._append_row_set(row_set)
+        if any(error is not None for error in errors):
+            self._state = CursorState.ERROR
+            raise ExecuteManyError(errors)
+        self._state = CursorState.DONE
+
+    async def _execute_queries_concurrently(
+        self,
+        queries: Sequence[Union[SetParameter, str]],
+        row_sets: List[RowSet],
+        errors: List[Optional[Exception]],
+        concurrency: int,
+    ) -> None:
+        """Execute queries with `concurrency` workers, store their results and
+        errors in query order."""
+        # Workers take queries one by one, so their order is preserved
+        pending = iter(enumerate(queries))
+
+        async def worker() -> None:
+            for i, query in pending:
+                assert isinstance(query, str)
+                logger.debug(f"Running query: {query}")
+                try:
+                    row_sets[i] = await self._execute_query(query)
+                except Exception as err:
+                    errors[i] = err
+
+        async with create_task_group() as task_group:
+            for _ in range(min(concurrency, len(queries))):
+                task_group.start_soon(worker)
+
+    def _result_cache_key(self, query: str) -> Optional[Hashable]:
+        """Result cache key of a query, None if its result can't be cached."""
+        if not _CACHEABLE_QUERY_RE.match(query):
+            return None
+        return (
+            self.connection.engine_url,
+            self.connection.database,
+            query,
+            tuple(sorted(self._set_parameters.items())),
+            self._output_format,
+        )
+
+    async def _execute_query(self, query: str) -> RowSet:
+        """Execute a query on server or take its result from the result cache."""
+        cache = self.connection.result_cache
+        key = self._result_cache_key(query) if cache is not None else None
+        # Statements only change data of their engine and database
+        scope = (self.connection.engine_url, self.connection.database)
+        if cache is not None and key is not None:
+            row_set = cache.get(key, scope)
+            if row_set is not None:
+                return row_set
+
+        resp = await self._api_request(query, {"output_format": self._output_format})
+        await self._raise_if_error(resp)
+        self._count_response_bytes(resp, len(resp.content))
+        row_set = self._row_set_from_response(resp)
+
+        if cache is not None:
+            if key is None:
+                # Query might have changed data
+                cache.invalidate(scope)
+            elif row_set[1] is not None:
+                cache.put(key, row_set, len(resp.content), scope)
+        return row_set
+
     @check_not_closed
     async def execute(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters: Optional[Sequence[ParameterType]] = None,
         skip_parsing: bool = False,
         async_execution: Optional[bool] = False,
@@ -507,7 +829,8 @@ class BaseCursor:
                 `flush_parameters` method call.
 
         Args:
-            query (str): SQL query to execute
+            query (Union[str, PreparedStatement]): SQL query to execute, or a
+                statement prepared with `connection.prepare`
             parameters (Optional[Sequence[ParameterType]]): A sequence of substitution
                 parameters. Used to replace '?' placeholders inside a query with
                 actual values
@@ -526,14 +849,16 @@ class BaseCursor:
     @check_not_closed
     async def executemany(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters_seq: Sequence[Sequence[ParameterType]],
         async_execution: Optional[bool] = False,
+        concurrency: int = 1,
     ) -> Union[int, str]:
         """Prepare and execute a database query.
 
         Supports providing multiple substitution parameter sets, executing them
-        as multiple statements sequentially.
+        as multiple statements sequentially, or concurrently if `concurrency`
+        is specified.
 
         Supported features:
             Parameterized queries: Placeholder characters ('?') are substituted
@@ -548,29 +873,81 @@ class BaseCursor:
                 `flush_parameters` method call.
 
         Args:
-            query (str): SQL query to execute.
+            query (Union[str, PreparedStatement]): SQL query to execute, or a
+                statement prepared with `connection.prepare`.
             parameters_seq (Sequence[Sequence[ParameterType]]): A sequence of
                substitution parameter sets. Used to replace '?' placeholders inside a
                query with actual values from each set in a sequence. Resulting queries
                for each subset are executed sequentially.
             async_execution (bool): flag to determine if query should be asynchronous
+            concurrency (int): Maximum number of statements executed at the same
+                time. Results are still available in parameter sets order. If
+                any statement fails, the others are executed anyway and
+                `ExecuteManyError` with all errors is raised. Default: 1
 
         Returns:
             int|str: Query row count for synchronous execution of queries,
             query ID string for asynchronous execution.
         """
+        if concurrency < 1:
+            raise ProgrammingError(
+                f"Invalid concurrency {concurrency}: positive value expected"
+            )
+        if concurrency > 1 and len(parameters_seq) > 1:
+            if async_execution:
+                raise NotSupportedError(
+                    "Concurrent execution of asynchronous queries is not supported."
+                )
+            await self._do_execute_concurrently(query, parameters_seq, concurrency)
+            return self.rowcount
         await self._do_execute(query, parameters_seq, async_execution=async_execution)
         if async_execution:
             return self.query_id
         else:
             return self.rowcount
 
+    @check_not_closed
+    async def insert_rows(
+        self,
+        table: str,
+        rows: Iterable[Sequence[ParameterType]],
+        columns: Optional[Sequence[str]] = None,
+        max_batch_rows: Optional[int] = None,
+        max_batch_bytes: int = 1024 * 1024,
+    ) -> int:
+        """Insert rows into a table with multi-row INSERT statements.
+
+        Rows are packed into `INSERT INTO table VALUES (...), (...)` statements,
+        which are executed sequentially. This takes a single request per batch
+        of rows instead of a request per row with `executemany`.
+
+        Args:
+            table (str): Name of the table to insert rows into
+            rows (Iterable[Sequence[ParameterType]]): Rows to insert. Values are
+                formatted the same way as query parameters
+            columns (Optional[Sequence[str]]): Names of the columns, all table
+                columns in their order are used if not provided
+            max_batch_rows (Optional[int]): Maximum number of rows in a single
+                statement, None for no limit. Default: None
+            max_batch_bytes (int): Maximum size of a single statement in bytes,
+                exceeded only by a statement with a single large row.
+                Default: 1 MiB
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        inserted = 0
+        for statement, count in format_insert_batches(
+            table, columns, rows, max_batch_rows, max_batch_bytes
+        ):
+            await self._do_execute(statement, [], skip_parsing=True)
+            inserted += count
+        return inserted
+
     def _parse_row(self, row: List[RawColType]) -> List[ColType]:
         """Parse a single data row based on query column types."""
-        assert len(row) == len(self.description)
-        return [
-            parse_value(col, self.description[i].type_code) for i, col in enumerate(row)
-        ]
+        assert self._row_parser is not None
+        return self._row_parser(row)
 
     def _get_next_range(self, size: int) -> Tuple[int, int]:
         """
@@ -608,8 +985,8 @@ class BaseCursor:
         size = size if size is not None else self.arraysize
         left, right = self._get_next_range(size)
         assert self._rows is not None
-        rows = self._rows[left:right]
-        return [self._parse_row(row) for row in rows]
+        assert self._row_parser is not None
+        return list(map(self._row_parser, self._rows[left:right]))
 
     @check_not_closed
     @check_query_executed
@@ -617,8 +994,129 @@ class BaseCursor:
         """Fetch all remaining rows of a query result."""
         left, right = self._get_next_range(self.rowcount)
         assert self._rows is not None
-        rows = self._rows[left:right]
-        return [self._parse_row(row) for row in rows]
+        assert self._row_parser is not None
+        return list(map(self._row_parser, self._rows[left:right]))
+
+    def _columns_to_lists(self, columns: List[tuple]) -> List[List[ColType]]:
+        assert self._descriptions is not None
+        return [
+            parse_column(values, d.type_code)
+            for values, d in zip(columns, self._descriptions)
+        ]
+
+    def _columns_to_numpy(self, columns: List[tuple]) -> List[Any]:
+        assert self._descriptions is not None
+        return [
+            to_numpy_array(values, d.type_code)
+            for values, d in zip(columns, self._descriptions)
+        ]
+
+    def _columns_to_arrow(self, columns: List[tuple]) -> Any:
+        assert self._descriptions is not None
+        return to_arrow_batch(columns, self._descriptions)
+
+    def _columns_to_dataframe(self, columns: List[tuple]) -> Any:
+        assert self._descriptions is not None
+        return to_dataframe(columns, self._descriptions)
+
+    def _fetch_raw_columns(self, size: Optional[int] = None) -> List[tuple]:
+        """
+        Fetch next `size` (all remaining if None) raw rows of a query result,
+        grouped by column.
+        """
+        left, right = self._get_next_range(size if size is not None else self.rowcount)
+        assert self._rows is not None
+        assert self._descriptions is not None
+        return columns_from_rows(self._rows[left:right], len(self._descriptions))
+
+    def _fetch_batch(
+        self, size: int, convert: Callable[[List[tuple]], Any]
+    ) -> Optional[Any]:
+        """
+        Fetch next `size` rows grouped by column and convert them with `convert`.
+        Return None if no rows left.
+        """
+        columns = self._fetch_raw_columns(size)
+        if not columns or not columns[0]:
+            return None
+        return convert(columns)
+
+    def _iter_batches(
+        self, size: int, convert: Callable[[List[tuple]], Any]
+    ) -> Iterator[Any]:
+        while True:
+            batch = self._fetch_batch(size, convert)
+            if batch is None:
+                return
+            yield batch
+
+    @check_not_closed
+    @check_query_executed
+    def fetch_columns(self) -> List[List[ColType]]:
+        """
+        Fetch all remaining rows of a query result as a list of columns,
+        in `description` order.
+        """
+        return self._columns_to_lists(self._fetch_raw_columns())
+
+    @check_not_closed
+    @check_query_executed
+    def fetch_numpy(self) -> List[Any]:
+        """
+        Fetch all remaining rows of a query result as a list of numpy arrays,
+        one per column in `description` order.
+
+        Integer, float, date and datetime columns are converted into typed arrays,
+        other columns into object arrays. Columns containing nulls are returned
+        as masked arrays. Requires numpy to be installed.
+        """
+        require_numpy()
+        return self._columns_to_numpy(self._fetch_raw_columns())
+
+    @check_not_closed
+    @check_query_executed
+    def fetch_arrow_table(self) -> Any:
+        """
+        Fetch all remaining rows of a query result as a `pyarrow.Table`.
+
+        Column types are mapped from `description` type codes to Arrow types.
+        Requires pyarrow to be installed.
+        """
+        require_pyarrow()
+        return to_arrow_table(self._fetch_raw_columns(), self._descriptions)
+
+    @check_not_closed
+    @check_query_executed
+    def iter_arrow_batches(self, batch_size: int) -> Iterator[Any]:
+        """
+        Iterate over remaining rows of a query result as `pyarrow.RecordBatch`
+        objects of up to `batch_size` rows. Requires pyarrow to be installed.
+        """
+        require_pyarrow()
+        return self._iter_batches(batch_size, self._columns_to_arrow)
+
+    @check_not_closed
+    @check_query_executed
+    def fetch_dataframe(self) -> Any:
+        """
+        Fetch all remaining rows of a query result as a `pandas.DataFrame`.
+
+        Column dtypes are mapped from `description` type codes: integers to nullable
+        Int64, floats to float64, dates and datetimes to datetime64[ns]; decimals,
+        arrays and strings are stored as objects. Requires pandas to be installed.
+        """
+        require_pandas()
+        return self._columns_to_dataframe(self._fetch_raw_columns())
+
+    @check_not_closed
+    @check_query_executed
+    def iter_dataframes(self, chunksize: int) -> Iterator[Any]:
+        """
+        Iterate over remaining rows of a query result as `pandas.DataFrame`
+        objects of up to `chunksize` rows. Requires pandas to be installed.
+        """
+        require_pandas()
+        return self._iter_batches(chunksize, self._columns_to_dataframe)
 
     @check_not_closed
     def setinputsizes(self, sizes: List[int]) -> None:
@@ -689,6 +1187,8 @@ class Cursor(BaseCursor):
         closed: True if connection is closed; False otherwise.
         arraysize: Read/Write, specifies the number of rows to fetch at a time
             with the :py:func:`fetchmany` method.
+        output_format: Read/Write, specifies the format in which query results
+            are requested from the server.
 
     """
 
@@ -701,7 +1201,7 @@ class Cursor(BaseCursor):
     @wraps(BaseCursor.execute)
     async def execute(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters: Optional[Sequence[ParameterType]] = None,
         skip_parsing: bool = False,
         async_execution: Optional[bool] = False,
@@ -714,16 +1214,33 @@ class Cursor(BaseCursor):
     @wraps(BaseCursor.executemany)
     async def executemany(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters_seq: Sequence[Sequence[ParameterType]],
         async_execution: Optional[bool] = False,
+        concurrency: int = 1,
     ) -> int:
         """
         Prepare and execute a database query against all parameter
         sequences provided.
         """
         async with self._async_query_lock.writer:
-            return await super().executemany(query, parameters_seq, async_execution)
+            return await super().executemany(
+                query, parameters_seq, async_execution, concurrency
+            )
+
+    @wraps(BaseCursor.insert_rows)
+    async def insert_rows(
+        self,
+        table: str,
+        rows: Iterable[Sequence[ParameterType]],
+        columns: Optional[Sequence[str]] = None,
+        max_batch_rows: Optional[int] = None,
+        max_batch_bytes: int = 1024 * 1024,
+    ) -> int:
+        async with self._async_query_lock.writer:
+            return await super().insert_rows(
+                table, rows, columns, max_batch_rows, max_batch_bytes
+            )
 
     @wraps(BaseCursor.fetchone)
     async def fetchone(self) -> Optional[List[ColType]]:
@@ -746,6 +1263,56 @@ class Cursor(BaseCursor):
             """Fetch all remaining rows of a query result."""
             return super().fetchall()
 
+    @wraps(BaseCursor.fetch_columns)
+    async def fetch_columns(self) -> List[List[ColType]]:
+        async with self._async_query_lock.reader:
+            return super().fetch_columns()
+
+    @wraps(BaseCursor.fetch_numpy)
+    async def fetch_numpy(self) -> List[Any]:
+        async with self._async_query_lock.reader:
+            return super().fetch_numpy()
+
+    @wraps(BaseCursor.fetch_arrow_table)
+    async def fetch_arrow_table(self) -> Any:
+        async with self._async_query_lock.reader:
+            return super().fetch_arrow_table()
+
+    @check_not_closed
+    @check_query_executed
+    def iter_arrow_batches(self, batch_size: int) -> AsyncIterator[Any]:
+        """
+        Iterate over remaining rows of a query result as `pyarrow.RecordBatch`
+        objects of up to `batch_size` rows. Requires pyarrow to be installed.
+        """
+        require_pyarrow()
+        return self._aiter_batches(batch_size, self._columns_to_arrow)
+
+    @wraps(BaseCursor.fetch_dataframe)
+    async def fetch_dataframe(self) -> Any:
+        async with self._async_query_lock.reader:
+            return super().fetch_dataframe()
+
+    @check_not_closed
+    @check_query_executed
+    def iter_dataframes(self, chunksize: int) -> AsyncIterator[Any]:
+        """
+        Iterate over remaining rows of a query result as `pandas.DataFrame`
+        objects of up to `chunksize` rows. Requires pandas to be installed.
+        """
+        require_pandas()
+        return self._aiter_batches(chunksize, self._columns_to_dataframe)
+
+    async def _aiter_batches(
+        self, size: int, convert: Callable[[List[tuple]], Any]
+    ) -> AsyncIterator[Any]:
+        while True:
+            async with self._async_query_lock.reader:
+                batch = self._fetch_batch(size, convert)
+            if batch is None:
+                return
+            yield batch
+
     @wraps(BaseCursor.nextset)
     async def nextset(self) -> None:
         async with self._async_query_lock.reader:
@@ -764,3 +1331,306 @@ class Cursor(BaseCursor):
         if row is None:
             raise StopAsyncIteration
         return row
+
+
+async def _aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Iterate over lines of a response body.
+
+    Unlike `Response.aiter_lines`, which decodes lines char by char and treats
+    '\\r' as a line break, split lines only by '\\n', since it's always escaped
+    inside values.
+    """
+    decoder = getincrementaldecoder("utf-8")()
+    tail = ""
+    async for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line
+    tail += decoder.decode(b"", True)
+    if tail:
+        yield tail
+
+
+class StreamingCursor(Cursor):
+    """
+    Executes async queries to Firebolt Database, reading result rows from the
+    server only when they are fetched. Memory usage doesn't depend on the result
+    size, which makes it suitable for large exports.
+    Should not be created directly;
+    use :py:func:`connection.streaming_cursor
+    <firebolt.async_db.connection.Connection>`
+
+    Note:
+        Only a single non-SET statement per query is supported. `rowcount` is
+        unknown (-1) until all rows are fetched, and `statistics` are not
+        available. The result stream stays open until all rows are fetched,
+        another query is executed, or the cursor is closed with `aclose`.
+    """
+
+    __slots__ = Cursor.__slots__ + (
+        "_response",
+        "_lines",
+        "_streamed_rows",
+        "_rows_decoder",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._response: Optional[Response] = None
+        self._lines: Optional[AsyncIterator[str]] = None
+        self._streamed_rows = 0
+        self._rows_decoder: Optional[
+            Callable[[List[str]], List[List[RawColType]]]
+        ] = None
+        super().__init__(*args, **kwargs)
+
+    async def _close_stream(self) -> None:
+        """Close currently open result stream, if any."""
+        response, self._response, self._lines = self._response, None, None
+        if response is not None:
+            await response.aclose()
+
+    async def _aiter_chunks(self, response: Response) -> AsyncIterator[bytes]:
+        """Iterate over decoded chunks of the result stream, counting their size."""
+        async for chunk in response.aiter_bytes():
+            self._bytes_received = response.num_bytes_downloaded
+            self._bytes_decoded += len(chunk)
+            yield chunk
+
+    async def _next_line(self) -> Optional[str]:
+        """Read next line from the result stream."""
+        if self._lines is None:
+            return None
+        async for line in self._lines:
+            return line
+        await self._close_stream()
+        return None
+
+    async def _open_stream(self, query: str) -> None:
+        """Execute query and read result columns metadata from the stream."""
+        tsv = self._output_format == TSV_OUTPUT_FORMAT
+        self._response = await self._api_request(
+            query,
+            {"output_format": TSV_OUTPUT_FORMAT if tsv else STREAMING_OUTPUT_FORMAT},
+            stream=True,
+        )
+        if self._response.status_code != codes.OK:
+            await self._response.aread()
+            await self._raise_if_error(self._response)
+        cache = self.connection.result_cache
+        if cache is not None and self._result_cache_key(query) is None:
+            # Query might have changed data, cached results of other cursors
+            # are stale
+            cache.invalidate((self.connection.engine_url, self.connection.database))
+        self._lines = _aiter_lines(self._aiter_chunks(self._response))
+
+        names_line = await self._next_line()
+        # Empty response is returned for insert query
+        if names_line is None:
+            return
+        types_line = await self._next_line()
+        try:
+            if tsv:
+                names = split_tsv_header(names_line)
+                types = split_tsv_header(types_line or "")
+            else:
+                names, types = json_loads(names_line), json_loads(types_line or "")
+            self._descriptions = [
+                Column(name, parse_type(raw_type), None, None, None, None, None)
+                for name, raw_type in zip(names, types)
+            ]
+            self._set_row_parser()
+            if tsv:
+                self._rows_decoder = tsv_rows_decoder(types)
+            else:
+                # Float values of decimal columns must be decoded from exact text
+                json_decoder = (
+                    None
+                    if any(float_text_required(raw_type) for raw_type in types)
+                    else self.connection._json_decoder
+                )
+                self._rows_decoder = partial(decode_json_lines, decoder=json_decoder)
+        except (TypeError, ValueError) as err:
+            raise DataError(f"Invalid query data format: {str(err)}")
+        self._rows = []
+
+    async def _do_execute(
+        self,
+        raw_query: Union[str, PreparedStatement],
+        parameters: Sequence[Sequence[ParameterType]],
+        skip_parsing: bool = False,
+        async_execution: Optional[bool] = False,
+    ) -> None:
+        if async_execution:
+            raise NotSupportedError(
+                "Server-side asynchronous execution is not supported "
+                "by streaming cursor."
+            )
+        await self._close_stream()
+        self._reset()
+        self._streamed_rows = 0
+        queries: List[Union[SetParameter, str]] = (
+            [_query_text(raw_query)]
+            if skip_parsing
+            else split_format_sql(raw_query, parameters)
+        )
+        try:
+            if sum(not isinstance(query, SetParameter) for query in queries) > 1:
+                raise NotSupportedError(
+                    "Multi-statement queries are not supported by streaming cursor."
+                )
+            await self.connection._ensure_engine_url()
+            await self._validate_default_set_parameters()
+            for i, query in enumerate(queries):
+                if isinstance(query, SetParameter):
+                    if i == 0 or not isinstance(queries[i - 1], SetParameter):
+                        await self._validate_set_parameters(
+                            _leading_set_parameters(queries, i)
+                        )
+                else:
+                    logger.debug(f"Running streaming query: {query}")
+                    await self._open_stream(query)
+            self._state = CursorState.DONE
+        except Exception:
+            await self._close_stream()
+            self._state = CursorState.ERROR
+            raise
+
+    async def _do_execute_concurrently(
+        self,
+        raw_query: Union[str, PreparedStatement],
+        parameters: Sequence[Sequence[ParameterType]],
+        concurrency: int,
+    ) -> None:
+        # Multi-statement queries are not supported, _do_execute raises an error
+        await self._do_execute(raw_query, parameters)
+
+    async def _read_raw_rows(self, size: Optional[int]) -> List[List[RawColType]]:
+        """Read up to `size` raw rows (all if None) from the result stream."""
+        if self._rows is None:
+            # No elements to take
+            raise DataError("no rows to fetch")
+        lines: List[str] = []
+        while size is None or len(lines) < size:
+            line = await self._next_line()
+            if line is None:
+                self._rowcount = self._streamed_rows + len(lines)
+                break
+            lines.append(line)
+        self._streamed_rows += len(lines)
+        assert self._rows_decoder is not None
+        try:
+            return self._rows_decoder(lines)
+        except ValueError as err:
+            raise DataError(f"Invalid query data format: {str(err)}")
+
+    async def _fetch_rows(self, size: Optional[int]) -> List[List[ColType]]:
+        """Read and parse up to `size` rows (all if None) from the result stream."""
+        rows = await self._read_raw_rows(size)
+        assert self._row_parser is not None
+        return list(map(self._row_parser, rows))
+
+    async def _fetch_raw_stream_columns(self) -> List[tuple]:
+        """Read all remaining raw values from the result stream, grouped by column."""
+        rows = await self._read_raw_rows(None)
+        assert self._descriptions is not None
+        return columns_from_rows(rows, len(self._descriptions))
+
+    @check_not_closed
+    @check_query_executed
+    async def fetchone(self) -> Optional[List[ColType]]:
+        """Fetch the next row of a query result set."""
+        async with self._async_query_lock.writer:
+            rows = await self._fetch_rows(1)
+            return rows[0] if rows else None
+
+    @check_not_closed
+    @check_query_executed
+    async def fetchmany(self, size: Optional[int] = None) -> List[List[ColType]]:
+        """
+        Fetch the next set of rows of a query result;
+        size is cursor.arraysize by default.
+        """
+        async with self._async_query_lock.writer:
+            return await self._fetch_rows(size if size is not None else self.arraysize)
+
+    @check_not_closed
+    @check_query_executed
+    async def fetchall(self) -> List[List[ColType]]:
+        """Fetch all remaining rows of a query result."""
+        async with self._async_query_lock.writer:
+            return await self._fetch_rows(None)
+
+    @check_not_closed
+    @check_query_executed
+    async def fetch_columns(self) -> List[List[ColType]]:
+        """
+        Fetch all remaining rows of a query result as a list of columns,
+        in `description` order.
+        """
+        async with self._async_query_lock.writer:
+            return self._columns_to_lists(await self._fetch_raw_stream_columns())
+
+    @check_not_closed
+    @check_query_executed
+    async def fetch_numpy(self) -> List[Any]:
+        """
+        Fetch all remaining rows of a query result as a list of numpy arrays,
+        one per column in `description` order.
+        """
+        require_numpy()
+        async with self._async_query_lock.writer:
+            return self._columns_to_numpy(await self._fetch_raw_stream_columns())
+
+    @check_not_closed
+    @check_query_executed
+    async def fetch_arrow_table(self) -> Any:
+        """Fetch all remaining rows of a query result as a `pyarrow.Table`."""
+        require_pyarrow()
+        async with self._async_query_lock.writer:
+            columns = await self._fetch_raw_stream_columns()
+            return to_arrow_table(columns, self._descriptions)
+
+    @check_not_closed
+    @check_query_executed
+    async def fetch_dataframe(self) -> Any:
+        """Fetch all remaining rows of a query result as a `pandas.DataFrame`."""
+        require_pandas()
+        async with self._async_query_lock.writer:
+            return self._columns_to_dataframe(await self._fetch_raw_stream_columns())
+
+    async def _aiter_batches(
+        self, size: int, convert: Callable[[List[tuple]], Any]
+    ) -> AsyncIterator[Any]:
+        while True:
+            async with self._async_query_lock.writer:
+                rows = await self._read_raw_rows(size)
+                if not rows:
+                    return
+                assert self._descriptions is not None
+                columns = columns_from_rows(rows, len(self._descriptions))
+            yield convert(columns)
+
+    @check_not_closed
+    @check_query_executed
+    async def nextset(self) -> None:
+        """Discard remaining rows. Streaming cursor has only one result set."""
+        async with self._async_query_lock.writer:
+            await self._close_stream()
+            return None
+
+    async def aclose(self) -> None:
+        """Close the result stream, if any, and mark cursor as closed."""
+        await self._close_stream()
+        self.close()
+
+    # Async context manager support
+    async def __aenter__(self) -> StreamingCursor:
+        if self.closed:
+            raise CursorClosedError(method_name="__aenter__")
+        return self
+
+    async def __aexit__(
+        self, exc_type: type, exc_val: Exception, exc_tb: TracebackType
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from time import monotonic
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from anyio import CancelScope, Condition, move_on_after
+
+from firebolt.async_db.connection import BaseConnection, Connection, connect
+from firebolt.utils.exception import (
+    ConnectionClosedError,
+    InterfaceError,
+    PoolTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+TConnection = TypeVar("TConnection", bound=BaseConnection)
+
+
+class PoolStats(NamedTuple):
+    """Connection pool usage statistics.
+
+    Args:
+        in_use (int): Number of connections, acquired from the pool
+        idle (int): Number of connections, waiting in the pool to be acquired
+        waiting (int): Number of callers, waiting for a connection
+        acquisitions (int): Total number of acquired connections
+        creations (int): Total number of created connections
+        evictions (int): Total number of connections, closed because they
+            expired, were idle for too long or failed a liveness check
+        wait_time (float): Total time in seconds callers waited for a connection
+    """
+
+    in_use: int
+    idle: int
+    waiting: int
+    acquisitions: int
+    creations: int
+    evictions: int
+    wait_time: float
+
+
+class _PoolEntry(Generic[TConnection]):
+    __slots__ = ("connection", "created_at", "released_at")
+
+    def __init__(self, connection: TConnection):
+        self.connection = connection
+        self.created_at = self.released_at = monotonic()
+
+
+class BaseConnectionPool(Generic[TConnection]):
+    """Connection bookkeeping, shared by synchronous and asynchronous pools.
+
+    Methods, that change pool state, should be called with the pool lock held,
+    or between awaits by the asynchronous pool.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: Optional[float] = 30.0,
+        max_lifetime: Optional[float] = 3600.0,
+        max_idle_time: Optional[float] = 600.0,
+        check_idle_time: Optional[float] = 60.0,
+        **connect_kwargs: Any,
+    ):
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(
+                f"Invalid pool size {min_size}..{max_size}: "
+                "0 <= min_size <= max_size and max_size >= 1 expected"
+            )
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle_time = max_idle_time
+        self.check_idle_time = check_idle_time
+        self._connect_kwargs = connect_kwargs
+        # Most recently released connections are at the end
+        self._idle: Deque[_PoolEntry[TConnection]] = deque()
+        self._in_use: Dict[int, _PoolEntry[TConnection]] = {}
+        # Number of idle, in use and being created connections
+        self._size = 0
+        self._closed = False
+        self._waiting = 0
+        self._acquisitions = 0
+        self._creations = 0
+        self._evictions = 0
+        self._wait_time = 0.0
+
+    @property
+    def closed(self) -> bool:
+        """`True` if pool is closed; `False` otherwise."""
+        return self._closed
+
+    @property
+    def stats(self) -> PoolStats:
+        """Pool usage statistics."""
+        return PoolStats(
+            len(self._in_use),
+            len(self._idle),
+            self._waiting,
+            self._acquisitions,
+            self._creations,
+            self._evictions,
+            self._wait_time,
+        )
+
+    def _expired(self, entry: _PoolEntry[TConnection], now: float) -> bool:
+        return entry.connection.closed or (
+            self.max_lifetime is not None
+            and now - entry.created_at >= self.max_lifetime
+        )
+
+    def _evict(self) -> List[_PoolEntry[TConnection]]:
+        """Remove expired idle connections and connections, idle for too long,
+        while there are more than `min_size` connections."""
+        now = monotonic()
+        evicted = [entry for entry in self._idle if self._expired(entry, now)]
+        if evicted:
+            self._idle = deque(entry for entry in self._idle if entry not in evicted)
+        # Least recently released connections are evicted first
+        while (
+            self._idle
+            and self.max_idle_time is not None
+            and self._size - len(evicted) > self.min_size
+            and now - self._idle[0].released_at >= self.max_idle_time
+        ):
+            evicted.append(self._idle.popleft())
+        self._size -= len(evicted)
+        self._evictions += len(evicted)
+        return evicted
+
+    def _take(
+        self,
+    ) -> Tuple[Optional[_PoolEntry[TConnection]], bool, List[_PoolEntry[TConnection]]]:
+        """Take an idle connection or reserve a slot for a new one.
+
+        Returns:
+            Tuple[Optional[_PoolEntry], bool, List[_PoolEntry]]: Idle connection,
+                whether a new connection should be created and evicted
+                connections to close
+        """
+        if self._closed:
+            raise ConnectionClosedError("Connection pool is closed.")
+        evicted = self._evict()
+        if self._idle:
+            return self._idle.pop(), False, evicted
+        if self._size < self.max_size:
+            self._size += 1
+            return None, True, evicted
+        return None, False, evicted
+
+    def _needs_check(self, entry: _PoolEntry[TConnection]) -> bool:
+        return (
+            self.check_idle_time is not None
+            and monotonic() - entry.released_at >= self.check_idle_time
+        )
+
+    def _check_out(self, entry: _PoolEntry[TConnection], start: float) -> TConnection:
+        self._in_use[id(entry.connection)] = entry
+        self._acquisitions += 1
+        self._wait_time += monotonic() - start
+        return entry.connection
+
+    def _check_in(self, connection: TConnection) -> Optional[_PoolEntry[TConnection]]:
+        """Return a connection to the pool.
+
+        Returns:
+            Optional[_PoolEntry]: Connection to close, if it can't be reused
+        """
+        entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            raise InterfaceError("Connection doesn't belong to the pool.")
+        entry.released_at = monotonic()
+        if self._closed or self._expired(entry, entry.released_at):
+            self._size -= 1
+            return entry
+        self._idle.append(entry)
+        return None
+
+    def _discard(self) -> None:
+        """Forget a connection, that failed a liveness check."""
+        self._size -= 1
+        self._evictions += 1
+
+    def _add_created(self, connection: TConnection) -> _PoolEntry[TConnection]:
+        self._creations += 1
+        return _PoolEntry(connection)
+
+    def _take_all_idle(self) -> List[_PoolEntry[TConnection]]:
+        idle = list(self._idle)
+        self._idle.clear()
+        self._size -= len(idle)
+        return idle
+
+
+class ConnectionPool(BaseConnectionPool[Connection]):
+    """Pool of asynchronous connections, reused between callers.
+
+    Connections are created on demand, up to `max_size`, and returned to the pool
+    when they're released. Connections, that exceed `max_lifetime` or stay idle
+    for longer than `max_idle_time`, are closed. Connections, that stayed idle for
+    longer than `check_idle_time`, are checked with a `select 1` query before
+    they're handed out, and are replaced if the check fails.
+
+    Args:
+        min_size (int): Number of connections, created by `open()` and kept in
+            the pool regardless of `max_idle_time`. Default: 0
+        max_size (int): Maximum number of connections. Default: 10
+        timeout (Optional[float]): Time in seconds to wait for a connection, if
+            all of them are in use, None to wait indefinitely. Default: 30
+        max_lifetime (Optional[float]): Time in seconds after which a connection
+            is closed, None for no limit. Default: 3600
+        max_idle_time (Optional[float]): Time in seconds an unused connection is
+            kept in the pool, None for no limit. Default: 600
+        check_idle_time (Optional[float]): Idle time in seconds after which a
+            connection is checked before it's handed out, None to never check
+            connections. Default: 60
+        **connect_kwargs: `connect` arguments
+
+    Examples:
+        ```
+        async with ConnectionPool(auth=auth, database="db", engine_name="e") as pool:
+            async with pool.connection() as connection:
+                cursor = connection.cursor()
+                await cursor.execute("select 1")
+        ```
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._condition = Condition()
+
+    async def _create(self) -> _PoolEntry[Connection]:
+        """Create a connection in a reserved slot."""
+        try:
+            connection = await connect(**self._connect_kwargs)
+        except BaseException:
+            with CancelScope(shield=True):
+                async with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+            raise
+        return self._add_created(connection)
+
+    async def _check(self, entry: _PoolEntry[Connection]) -> bool:
+        """Check an idle connection, discard it if the check fails."""
+        alive = False
+        try:
+            alive = await entry.connection._is_alive()
+        finally:
+            if not alive:
+                logger.debug("Pooled connection failed liveness check, replacing.")
+                with CancelScope(shield=True):
+                    async with self._condition:
+                        self._discard()
+                        self._condition.notify()
+                    await entry.connection.aclose()
+        return alive
+
+    @staticmethod
+    async def _close(entries: List[_PoolEntry[Connection]]) -> None:
+        # Connections should be closed even if the caller is cancelled
+        with CancelScope(shield=True):
+            for entry in entries:
+                await entry.connection.aclose()
+
+    async def open(self) -> None:
+        """Create `min_size` connections."""
+        async with self._condition:
+            if self._closed:
+                raise ConnectionClosedError("Connection pool is closed.")
+            count = max(self.min_size - self._size, 0)
+            self._size += count
+        for _ in range(count):
+            entry = await self._create()
+            self._idle.append(entry)
+            async with self._condition:
+                self._condition.notify()
+
+    async def acquire(self) -> Connection:
+        """Take a connection from the pool, create a new one or wait until one
+        is released.
+
+        Raises:
+            PoolTimeoutError: No connection became available within `timeout`
+            ConnectionClosedError: Pool is closed
+        """
+        start = monotonic()
+        with move_on_after(self.timeout):
+            while True:
+                async with self._condition:
+                    entry, create, evicted = self._take()
+                    while entry is None and not create:
+                        self._waiting += 1
+                        try:
+                            await self._condition.wait()
+                        finally:
+                            self._waiting -= 1
+                        entry, create, evicted = self._take()
+                    # Pool state is only changed between awaits, so a taken
+                    # connection is checked out right away and isn't lost if
+                    # the caller is cancelled
+                    if entry is not None and not self._needs_check(entry):
+                        connection = self._check_out(entry, start)
+                        break
+                await self._close(evicted)
+                if entry is None:
+                    entry = await self._create()
+                elif not await self._check(entry):
+                    continue
+                return self._check_out(entry, start)
+            await self._close(evicted)
+            return connection
+        raise PoolTimeoutError(
+            f"No connection became available in {self.timeout} seconds."
+        )
+
+    async def release(self, connection: Connection) -> None:
+        """Return a connection to the pool and close its cursors."""
+        # Connection should be returned even if the caller is cancelled
+        with CancelScope(shield=True):
+            await connection._close_cursors()
+            async with self._condition:
+                entry = self._check_in(connection)
+                self._condition.notify()
+            if entry is not None:
+                await entry.connection.aclose()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Connection]:
+        """Acquire a connection and release it on exit."""
+        connection = await self.acquire()
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+    async def aclose(self) -> None:
+        """Close idle connections. Connections in use are closed on release."""
+        async with self._condition:
+            self._closed = True
+            idle = self._take_all_idle()
+            self._condition.notify_all()
+        await self._close(idle)
+
+    # Async context manager support
+    async def __aenter__(self) -> ConnectionPool:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self, exc_type: type, exc_val: Exception, exc_tb: TracebackType
+    ) -> None:
+        await self.aclose()
@@ -1,17 +1,70 @@
-from time import time
-from typing import Generator, Optional
+import logging
+from threading import Lock
+from time import perf_counter, time
+from typing import (
+    Any,
+    AsyncGenerator,
+    Generator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from httpx import Auth as HttpxAuth
 from httpx import Request, Response, codes
 
+from firebolt.utils.event import ThreadSafeEvent
 from firebolt.utils.token_storage import TokenSecureStorage
 from firebolt.utils.util import cached_property
 
+logger = logging.getLogger(__name__)
+
+# Part of token lifetime, after which it's refreshed
+TOKEN_REFRESH_RATIO = 0.8
+
 
 class AuthRequest(Request):
     """Class to distinguish auth requests from regular"""
 
 
+class TokenRefreshStats(NamedTuple):
+    """Token refresh statistics.
+
+    Args:
+        refreshes (int): Number of acquired tokens
+        proactive_refreshes (int): Number of tokens, acquired ahead of
+            expiration of the previous one
+        failures (int): Number of failed refreshes
+        last_latency (float): Time in seconds of the last refresh
+        total_latency (float): Total time in seconds of all refreshes
+    """
+
+    refreshes: int
+    proactive_refreshes: int
+    failures: int
+    last_latency: float
+    total_latency: float
+
+
+class _TokenRefresh:
+    """Token refresh, that's in progress."""
+
+    __slots__ = ("done", "refreshed", "error")
+
+    def __init__(self) -> None:
+        self.done = ThreadSafeEvent()
+        self.refreshed = False
+        self.error: Optional[Exception] = None
+
+    def wait(self) -> None:
+        self.done.wait()
+
+    async def async_wait(self) -> None:
+        # Refresh might run in a different thread or event loop
+        await self.done.async_wait()
+
+
 class Auth(HttpxAuth):
     """Base authentication class for Firebolt database.
 
@@ -26,6 +79,14 @@ class Auth(HttpxAuth):
         "_token",
         "_expires",
         "_use_token_cache",
+        "_refresh_at",
+        "_refresh",
+        "_refresh_lock",
+        "_refreshes",
+        "_proactive_refreshes",
+        "_refresh_failures",
+        "_last_refresh_latency",
+        "_total_refresh_latency",
     )
 
     requires_response_body = True
@@ -35,6 +96,15 @@ class Auth(HttpxAuth):
         self._use_token_cache = use_token_cache
         self._token: Optional[str] = self._get_cached_token()
         self._expires: Optional[int] = None
+        # Time to refresh the token ahead of expiration
+        self._refresh_at: Optional[float] = None
+        self._refresh: Optional[_TokenRefresh] = None
+        self._refresh_lock = Lock()
+        self._refreshes = 0
+        self._proactive_refreshes = 0
+        self._refresh_failures = 0
+        self._last_refresh_latency = 0.0
+        self._total_refresh_latency = 0.0
 
     def copy(self) -> "Auth":
         """Make another auth object with same credentials.
@@ -96,26 +166,192 @@ class Auth(HttpxAuth):
     def get_new_token_generator(self) -> Generator[Request, Response, None]:
         """Generate requests needed to create a new token session."""
 
-    def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
-        """Add authorization token to request headers.
+    @property
+    def refresh_stats(self) -> TokenRefreshStats:
+        """Token refresh statistics."""
+        with self._refresh_lock:
+            return TokenRefreshStats(
+                self._refreshes,
+                self._proactive_refreshes,
+                self._refresh_failures,
+                self._last_refresh_latency,
+                self._total_refresh_latency,
+            )
 
-        Overrides ``httpx.Auth.auth_flow``
+    @property
+    def _refresh_due(self) -> bool:
+        """Check if current token should be refreshed ahead of expiration."""
+        return self._refresh_at is not None and self._refresh_at <= time()
+
+    def _begin_refresh(
+        self, stale_token: Optional[str]
+    ) -> Tuple[Optional[_TokenRefresh], bool]:
+        """Join the refresh in progress or start a new one.
 
         Args:
-            request (Request): Request object to update
+            stale_token (Optional[str]): Token to replace
 
-        Yields:
-            Request: Request required for auth flow
+        Returns:
+            Tuple[Optional[_TokenRefresh], bool]: Refresh, None if the token was
+                already replaced, and whether the caller should perform it
         """
-        if not self.token or self.expired:
+        with self._refresh_lock:
+            if self._refresh is not None:
+                return self._refresh, False
+            if self._token != stale_token:
+                return None, False
+            self._refresh = _TokenRefresh()
+            return self._refresh, True
+
+    def _run_refresh(
+        self, refresh: _TokenRefresh, proactive: bool
+    ) -> Generator[Request, Response, None]:
+        """Get a new token and wake up the requests, waiting for it.
+
+        If the refresh is abandoned without an error, e.g. on cancellation,
+        waiting requests retry it.
+        """
+        start, issued_at = perf_counter(), time()
+        error: Optional[Exception] = None
+        refreshed = False
+        try:
             yield from self.get_new_token_generator()
             self._cache_token()
+            refreshed = True
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            latency = perf_counter() - start
+            with self._refresh_lock:
+                self._refresh = None
+                if error is not None:
+                    self._refresh_failures += 1
+                elif refreshed:
+                    self._refreshes += 1
+                    self._proactive_refreshes += proactive
+                    self._last_refresh_latency = latency
+                    self._total_refresh_latency += latency
+                    self._refresh_at = (
+                        issued_at + (self._expires - issued_at) * TOKEN_REFRESH_RATIO
+                        if self._expires is not None
+                        else None
+                    )
+            refresh.refreshed, refresh.error = refreshed, error
+            refresh.done.set()
+
+    def _token_flow(self) -> Generator[Union[Request, _TokenRefresh], Any, None]:
+        """Make sure a valid token is acquired.
+
+        Only one request per auth object gets a new token, others wait for it.
+        Once `TOKEN_REFRESH_RATIO` of token lifetime passed, the token is
+        refreshed by the next request, while others keep using the current one.
 
-        request.headers["Authorization"] = f"Bearer {self.token}"
+        Yields:
+            Union[Request, _TokenRefresh]: Request required for auth flow or
+                refresh to wait for
+        """
+        token = self.token
+        if not token or self.expired:
+            yield from self._replace_token(token)
+        elif self._refresh_due:
+            refresh, leader = self._begin_refresh(token)
+            if leader:
+                assert refresh is not None
+                try:
+                    yield from self._run_refresh(refresh, proactive=True)
+                except Exception as e:
+                    # Current token is still valid
+                    logger.warning(f"Unable to refresh token: {e}")
+
+    def _replace_token(
+        self, stale_token: Optional[str]
+    ) -> Generator[Union[Request, _TokenRefresh], Any, None]:
+        """Get a new token instead of a stale one, or wait until another
+        request gets it."""
+        while True:
+            refresh, leader = self._begin_refresh(stale_token)
+            if refresh is None:
+                return
+            if leader:
+                yield from self._run_refresh(refresh, proactive=False)
+                return
+            yield refresh
+            if refresh.error is not None:
+                raise refresh.error
+            if refresh.refreshed:
+                return
+
+    def _request_flow(
+        self, request: Request
+    ) -> Generator[Union[Request, _TokenRefresh], Any, None]:
+        yield from self._token_flow()
+        token = self.token
+        request.headers["Authorization"] = f"Bearer {token}"
 
         response = yield request
 
         if response.status_code == codes.UNAUTHORIZED:
-            yield from self.get_new_token_generator()
+            # Token might've been already replaced by another request
+            yield from self._replace_token(token)
             request.headers["Authorization"] = f"Bearer {self.token}"
             yield request
+
+    def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        """Add authorization token to request headers.
+
+        Overrides ``httpx.Auth.auth_flow``
+
+        Args:
+            request (Request): Request object to update
+
+        Yields:
+            Request: Request required for auth flow
+        """
+        flow = self._request_flow(request)
+        try:
+            step = next(flow)
+            while True:
+                if isinstance(step, _TokenRefresh):
+                    step.wait()
+                    response = None
+                else:
+                    response = yield step
+                step = flow.send(response)
+        except StopIteration:
+            pass
+        finally:
+            # Wake up requests, waiting for an abandoned refresh
+            flow.close()
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        """Add authorization token to request headers, waiting for a token
+        refresh without blocking the event loop.
+
+        Overrides ``httpx.Auth.async_auth_flow``
+
+        Args:
+            request (Request): Request object to update
+
+        Yields:
+            Request: Request required for auth flow
+        """
+        flow = self._request_flow(request)
+        try:
+            step = next(flow)
+            while True:
+                if isinstance(step, _TokenRefresh):
+                    await step.async_wait()
+                    response = None
+                else:
+                    response = yield step
+                    if self.requires_response_body:
+                        await response.aread()
+                step = flow.send(response)
+        except StopIteration:
+            pass
+        finally:
+            # Wake up requests, waiting for an abandoned refresh
+            flow.close()
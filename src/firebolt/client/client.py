@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from anyio._core._eventloop import get_asynclib
 from httpx import URL
@@ -10,7 +10,9 @@ from httpx._types import AuthTypes
 
 from firebolt.client.auth import Auth
 from firebolt.client.auth.base import AuthRequest
+from firebolt.client.compression import set_content_decoder
 from firebolt.client.constants import DEFAULT_API_URL
+from firebolt.utils.account_id_cache import account_id_cache, auth_user_key
 from firebolt.utils.exception import AccountNotFoundError
 from firebolt.utils.urls import ACCOUNT_BY_NAME_URL, ACCOUNT_URL
 from firebolt.utils.util import (
@@ -65,6 +67,15 @@ class FireboltClientMixin(FireboltClientMixinBase):
             return auth
         raise TypeError(f'Invalid "auth" argument: {auth!r}')
 
+    @property
+    def _account_id_cache_key(self) -> Tuple[str, str, str]:
+        # Default account depends on the user
+        return (
+            str(self._api_endpoint),
+            self.account_name or "",
+            auth_user_key(self.auth),
+        )
+
     def _merge_auth_request(self, request: Request) -> Request:
         if isinstance(request, AuthRequest):
             request.url = merge_urls(self._api_endpoint, request.url)
@@ -85,7 +96,8 @@ class Client(FireboltClientMixin, HttpxClient):
         """User account ID.
 
         If account_name was provided during Client construction, returns its ID;
-        gets default account otherwise.
+        gets default account otherwise. Account IDs are cached and shared
+        between clients.
 
         Returns:
             str: Account ID
@@ -93,6 +105,9 @@ class Client(FireboltClientMixin, HttpxClient):
         Raises:
             AccountNotFoundError: No account found with provided name
         """
+        return account_id_cache.get(self._account_id_cache_key, self._get_account_id)
+
+    def _get_account_id(self) -> str:
         if self.account_name:
             response = self.get(
                 url=ACCOUNT_BY_NAME_URL, params={"account_name": self.account_name}
@@ -109,9 +124,11 @@ class Client(FireboltClientMixin, HttpxClient):
     def _send_handling_redirects(
         self, request: Request, *args: Any, **kwargs: Any
     ) -> Response:
-        return super()._send_handling_redirects(
+        response = super()._send_handling_redirects(
             self._merge_auth_request(request), *args, **kwargs
         )
+        set_content_decoder(response)
+        return response
 
 
 class AsyncClient(FireboltClientMixin, HttpxAsyncClient):
@@ -122,12 +139,13 @@ class AsyncClient(FireboltClientMixin, HttpxAsyncClient):
     FireboltAuth instance.
     """
 
-    @cached_property
+    @property
     async def account_id(self) -> str:
         """User account id.
 
         If account_name was provided during AsyncClient construction, returns its ID;
-        gets default account otherwise.
+        gets default account otherwise. Account IDs are cached and shared
+        between clients.
 
         Returns:
             str: Account ID
@@ -135,6 +153,11 @@ class AsyncClient(FireboltClientMixin, HttpxAsyncClient):
         Raises:
             AccountNotFoundError: No account found with provided name
         """
+        return await account_id_cache.async_get(
+            self._account_id_cache_key, self._get_account_id
+        )
+
+    async def _get_account_id(self) -> str:
         if self.account_name:
             response = await self.get(
                 url=ACCOUNT_BY_NAME_URL, params={"account_name": self.account_name}
@@ -148,9 +171,42 @@ class AsyncClient(FireboltClientMixin, HttpxAsyncClient):
         # account_name isn't set; use the default account.
         return (await self.get(url=ACCOUNT_URL)).json()["account"]["id"]
 
+    async def authenticate(self) -> None:
+        """Acquire an access token, unless a valid one is already present,
+        or wait until another request acquires it.
+
+        Tokens are otherwise acquired by the first request, this allows
+        to measure and handle authentication separately.
+
+        Raises:
+            AuthenticationError: Error while authenticating with provided
+                credentials
+        """
+        auth = self.auth
+        if not isinstance(auth, Auth):
+            return
+        flow = auth._token_flow()
+        try:
+            step = next(flow)
+            while True:
+                response: Optional[Response] = None
+                if isinstance(step, Request):
+                    response = await self.send(step, auth=None)
+                    await response.aread()
+                else:
+                    await step.async_wait()
+                step = flow.send(response)
+        except StopIteration:
+            pass
+        finally:
+            # Wake up requests, waiting for an abandoned refresh
+            flow.close()
+
     async def _send_handling_redirects(
         self, request: Request, *args: Any, **kwargs: Any
     ) -> Response:
-        return await super()._send_handling_redirects(
+        response = await super()._send_handling_redirects(
             self._merge_auth_request(request), *args, **kwargs
         )
+        set_content_decoder(response)
+        return response
@@ -0,0 +1,97 @@
+from typing import Any, Dict, Optional, Type
+
+from httpx import DecodingError, Response
+from httpx._decoders import SUPPORTED_DECODERS, ContentDecoder, MultiDecoder
+
+from firebolt.utils.exception import ConfigurationError
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+COMPRESSIONS = ("gzip", "deflate", "br", "zstd")
+_COMPRESSION_PACKAGES = {"br": "brotli", "zstd": "zstandard"}
+
+
+class ZStandardDecoder(ContentDecoder):
+    """Handle 'zstd' response decoding, which is not supported by httpx."""
+
+    def __init__(self) -> None:
+        self.decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decode(self, data: bytes) -> bytes:
+        output = []
+        try:
+            output.append(self.decompressor.decompress(data))
+            # Response might consist of multiple frames
+            while self.decompressor.eof and self.decompressor.unused_data:
+                unused_data = self.decompressor.unused_data
+                self.decompressor = zstandard.ZstdDecompressor().decompressobj()
+                output.append(self.decompressor.decompress(unused_data))
+        except zstandard.ZstdError as exc:
+            raise DecodingError(str(exc)) from exc
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        if not self.decompressor.eof:
+            raise DecodingError("Truncated zstd response")
+        return b""
+
+
+# Decoders of firebolt clients. httpx decoders are not extended, so other
+# httpx clients aren't affected
+DECODERS: Dict[str, Type[ContentDecoder]] = dict(SUPPORTED_DECODERS)
+if zstandard is not None:
+    DECODERS["zstd"] = ZStandardDecoder
+
+
+def set_content_decoder(response: Response) -> None:
+    """Make an unread response decode encodings, not supported by httpx.
+
+    Args:
+        response (Response): Response, which content is not read yet
+    """
+    encodings = [
+        value.strip().lower()
+        for value in response.headers.get_list("content-encoding", split_commas=True)
+    ]
+    if all(encoding in SUPPORTED_DECODERS for encoding in encodings):
+        return
+    decoders = [DECODERS[encoding]() for encoding in encodings if encoding in DECODERS]
+    if len(decoders) == 1:
+        response._decoder = decoders[0]
+    elif decoders:
+        response._decoder = MultiDecoder(children=decoders)
+
+
+def get_compression(compression: Any) -> Optional[str]:
+    """Resolve `compression` connection parameter into a response encoding.
+
+    Args:
+        compression (Union[bool, str, None]): One of "gzip", "deflate", "br",
+            "zstd", True to pick the best supported encoding, or None/False to
+            receive uncompressed responses.
+
+    Returns:
+        Optional[str]: Response encoding, None if compression is disabled
+    """
+    if compression is None or compression is False:
+        return None
+    if compression is True:
+        for encoding in ("zstd", "br"):
+            if encoding in DECODERS:
+                return encoding
+        return "gzip"
+    if compression not in COMPRESSIONS:
+        raise ConfigurationError(
+            f"Invalid compression {compression}: expected one of "
+            f"{', '.join(COMPRESSIONS)} or a bool"
+        )
+    if compression not in DECODERS:
+        package = _COMPRESSION_PACKAGES[compression]
+        raise ImportError(
+            f"{package} is required to use {compression} compression. "
+            f"Install it with `pip install {package}`"
+        )
+    return compression
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import socket
+from ssl import SSLContext
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from httpcore.backends.base import NetworkStream
+from httpcore.backends.sync import SyncBackend
+from httpx import (
+    AsyncBaseTransport,
+    BaseTransport,
+    Limits,
+    Request,
+    Response,
+    create_ssl_context,
+)
+
+from firebolt.utils.event import current_event_loop
+from firebolt.utils.exception import InterfaceError
+
+KEEPALIVE_FLAG: int = 1
+KEEPIDLE_RATE: int = 60  # seconds
+
+# SSL contexts of HTTP/1.1 and HTTP/2 transports
+_ssl_contexts: Dict[bool, SSLContext] = {}
+
+
+def ssl_context(http2: bool = False) -> SSLContext:
+    """SSL context, shared by all transports.
+
+    Loading CA certificates takes tens of milliseconds, so it's done once.
+    httpcore sets ALPN protocols of a context on each connect, so HTTP/1.1
+    and HTTP/2 transports need separate contexts.
+    """
+    context = _ssl_contexts.get(http2)
+    if context is None:
+        context = _ssl_contexts.setdefault(http2, create_ssl_context(http2=http2))
+    return context
+
+
+def set_keepalive(sock: socket.socket) -> None:
+    """Enable TCP keepalive with 60 seconds idle time on a socket."""
+    # Enable keepalive
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, KEEPALIVE_FLAG)
+    # MacOS does not have TCP_KEEPIDLE
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        keepidle = socket.TCP_KEEPIDLE
+    else:
+        keepidle = 0x10  # TCP_KEEPALIVE on mac
+
+    # Set keepalive to 60 seconds
+    sock.setsockopt(socket.IPPROTO_TCP, keepidle, KEEPIDLE_RATE)
+
+
+class OverriddenSyncHttpBackend(SyncBackend):
+    """Synchronous counterpart of `OverriddenHttpBackend`, which enables TCP
+    keepalive on connection sockets.
+
+    Unlike the asynchronous backend, httpcore's synchronous backend doesn't
+    disable Nagle's algorithm, so request headers and body, written separately,
+    would be delayed until the server acknowledges the first write.
+    """
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+    ) -> NetworkStream:
+        stream = super().connect_tcp(
+            host, port, timeout=timeout, local_address=local_address
+        )
+        sock = stream.get_extra_info("socket")
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        set_keepalive(sock)
+        return stream
+
+
+def limits_key(limits: Limits) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """Hashable representation of `httpx.Limits`."""
+    return (
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+    )
+
+
+class _RegistryEntry:
+    __slots__ = ("transport", "references")
+
+    def __init__(self, transport: Any):
+        self.transport = transport
+        self.references = 0
+
+
+class TransportRegistry:
+    """Reference counted HTTP transports, shared between connections.
+
+    Connections to the same engine borrow the same transport, so they share
+    its pool of keep-alive connections. A transport is closed once the last
+    connection, that borrowed it, is closed.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, _RegistryEntry] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def references(self, key: Hashable) -> int:
+        """Number of connections, that borrowed a transport."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.references if entry is not None else 0
+
+    def _acquire(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _RegistryEntry(create())
+            entry.references += 1
+            return entry.transport
+
+    def _release(self, key: Hashable) -> Optional[Any]:
+        """Return a borrowed transport.
+
+        Returns:
+            Optional[Any]: Transport to close, if it's no longer used
+        """
+        with self._lock:
+            entry = self._entries[key]
+            entry.references -= 1
+            if entry.references > 0:
+                return None
+            del self._entries[key]
+            return entry.transport
+
+    def async_transport(
+        self, key: Hashable, create: Callable[[], AsyncBaseTransport]
+    ) -> SharedAsyncTransport:
+        """Borrow an asynchronous transport of the running event loop.
+
+        Args:
+            key (Hashable): Transport key
+            create (Callable[[], AsyncBaseTransport]): Transport factory, called
+                if there is no transport with this key
+
+        Returns:
+            SharedAsyncTransport: Transport, which is returned on close
+        """
+        key = (SharedAsyncTransport, current_event_loop(), key)
+        return SharedAsyncTransport(self, key, self._acquire(key, create))
+
+    def transport(
+        self, key: Hashable, create: Callable[[], BaseTransport]
+    ) -> SharedTransport:
+        """Borrow a synchronous transport.
+
+        Args:
+            key (Hashable): Transport key
+            create (Callable[[], BaseTransport]): Transport factory, called if
+                there is no transport with this key
+
+        Returns:
+            SharedTransport: Transport, which is returned on close
+        """
+        key = (SharedTransport, key)
+        return SharedTransport(self, key, self._acquire(key, create))
+
+
+class UnresolvedTransport(AsyncBaseTransport, BaseTransport):
+    """Placeholder transport of a lazy connection, which engine url isn't
+    resolved yet."""
+
+    def handle_request(self, request: Request) -> Response:
+        raise InterfaceError("Engine url is not resolved.")
+
+    async def handle_async_request(self, request: Request) -> Response:
+        raise InterfaceError("Engine url is not resolved.")
+
+
+class SharedAsyncTransport(AsyncBaseTransport):
+    """Asynchronous transport, borrowed from `TransportRegistry`."""
+
+    def __init__(
+        self, registry: TransportRegistry, key: Hashable, transport: AsyncBaseTransport
+    ):
+        self.registry = registry
+        self.key = key
+        self.transport = transport
+        self._closed = False
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = self.registry._release(self.key)
+        if transport is not None:
+            await transport.aclose()
+
+
+class SharedTransport(BaseTransport):
+    """Synchronous transport, borrowed from `TransportRegistry`."""
+
+    def __init__(
+        self, registry: TransportRegistry, key: Hashable, transport: BaseTransport
+    ):
+        self.registry = registry
+        self.key = key
+        self.transport = transport
+        self._closed = False
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        transport = self.registry._release(self.key)
+        if transport is not None:
+            transport.close()
+
+
+transport_registry = TransportRegistry()
@@ -31,6 +31,7 @@ class Settings(BaseSettings):
         server (Optional[str]): Environment api endpoint (Advanced)
             Default api endpoint is used if none provided
         default_region (str): Default region for provisioning
+        http2 (bool): Use HTTP/2, so concurrent requests share one connection
     """
 
     auth: Auth = Field(None)
@@ -44,6 +45,7 @@ class Settings(BaseSettings):
     server: str = Field(..., env="FIREBOLT_SERVER")
     default_region: str = Field(..., env="FIREBOLT_DEFAULT_REGION")
     use_token_cache: bool = Field(True)
+    http2: bool = Field(False, env="FIREBOLT_HTTP2")
 
     class Config:
         """Internal pydantic config."""
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from functools import wraps
+from threading import Lock
 from types import TracebackType
-from typing import Any
+from typing import Any, Callable, Tuple
 from warnings import warn
 
+from httpx import BaseTransport, HTTPTransport, Limits
 from readerwriterlock.rwlock import RWLockWrite
 
 from firebolt.async_db.connection import BaseConnection as AsyncBaseConnection
-from firebolt.async_db.connection import async_connect_factory
+from firebolt.async_db.connection import _timed, async_connect_factory
+from firebolt.client import Client
+from firebolt.client.transport import (
+    OverriddenSyncHttpBackend,
+    ssl_context,
+    transport_registry,
+)
 from firebolt.db.cursor import Cursor
 from firebolt.utils.exception import ConnectionClosedError
 from firebolt.utils.util import async_to_sync
@@ -33,6 +41,8 @@ class Connection(AsyncBaseConnection):
 
     __slots__ = AsyncBaseConnection.__slots__ + ("_closing_lock",)
 
+    # Queries are sent with a blocking client, without an event loop
+    client_class = Client
     cursor_class = Cursor
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -47,10 +57,47 @@ class Connection(AsyncBaseConnection):
             assert isinstance(c, Cursor)  # typecheck
             return c
 
+    @staticmethod
+    def _create_engine_url_lock() -> Any:
+        return Lock()
+
+    async def _ensure_engine_url(self) -> None:
+        # Queries run without an event loop, engine url is resolved on the
+        # background one
+        if self._engine_url_resolver is None:
+            return
+        with self._engine_url_lock:
+            if self._engine_url_resolver is not None:
+                with _timed(self.bootstrap_timings, "total"):
+                    engine_url = async_to_sync(self._engine_url_resolver)(
+                        timings=self.bootstrap_timings
+                    )
+                self._set_engine_url(engine_url)
+
+    def _create_transport(  # type: ignore[override]
+        self, limits: Limits, http2: bool
+    ) -> HTTPTransport:
+        # Override tcp keepalive settings for connection
+        transport = HTTPTransport(verify=ssl_context(http2), limits=limits, http2=http2)
+        transport._pool._network_backend = OverriddenSyncHttpBackend()
+        return transport
+
+    def _share_transport(  # type: ignore[override]
+        self, key: Tuple, create: Callable[[], HTTPTransport]
+    ) -> BaseTransport:
+        return transport_registry.transport(key, create)
+
     @wraps(AsyncBaseConnection._aclose)
     def close(self) -> None:
         with self._closing_lock.gen_wlock():
-            async_to_sync(self._aclose)()
+            if self.closed:
+                return
+
+            # self._cursors is going to be changed during closing cursors
+            for c in self._cursors[:]:
+                c.close()
+            self._client.close()
+            self._is_closed = True
 
     # Context manager support
     def __enter__(self) -> Connection:
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from threading import Lock
-from typing import Any, Generator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from httpx import Response
 from readerwriterlock.rwlock import RWLockWrite
 
 from firebolt.async_db._types import ColType
 from firebolt.async_db.cursor import BaseCursor as AsyncBaseCursor
 from firebolt.async_db.cursor import (
     ParameterType,
+    PreparedStatement,
     QueryStatus,
+    RowSet,
+    SetParameter,
     check_not_closed,
     check_query_executed,
 )
-from firebolt.utils.util import async_to_sync
+from firebolt.client import Client
+from firebolt.db.util import is_db_available, is_engine_running
+from firebolt.utils.util import run_coroutine_sync
+
+logger = logging.getLogger(__name__)
 
 
 class Cursor(AsyncBaseCursor):
@@ -29,6 +49,8 @@ class Cursor(AsyncBaseCursor):
         closed: True if connection is closed, False otherwise
         arraysize: Read/Write, specifies the number of rows to fetch at a time
             with the :py:func:`fetchmany` method
+        output_format: Read/Write, specifies the format in which query results
+            are requested from the server
     """
 
     __slots__ = AsyncBaseCursor.__slots__ + (
@@ -36,34 +58,100 @@ class Cursor(AsyncBaseCursor):
         "_idx_lock",
     )
 
+    _client: Client  # type: ignore[assignment]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._query_lock = RWLockWrite()
         self._idx_lock = Lock()
         super().__init__(*args, **kwargs)
 
+    # Query logic of the asynchronous cursor is reused with a blocking client,
+    # so its coroutines never suspend and are run without an event loop
+
+    async def _api_request(
+        self,
+        query: Optional[str] = "",
+        parameters: Optional[dict[str, Any]] = {},
+        path: Optional[str] = "",
+        use_set_parameters: Optional[bool] = True,
+        stream: bool = False,
+    ) -> Response:
+        await self.connection._ensure_engine_url()
+        request = self._build_api_request(query, parameters, path, use_set_parameters)
+        return self._client.send(request, stream=stream)
+
+    async def _is_db_available(self) -> bool:
+        return is_db_available(self.connection, self.connection.database)
+
+    async def _is_engine_running(self) -> bool:
+        return is_engine_running(self.connection, self.connection.engine_url)
+
+    async def _execute_queries_concurrently(
+        self,
+        queries: Sequence[Union[SetParameter, str]],
+        row_sets: List[RowSet],
+        errors: List[Optional[Exception]],
+        concurrency: int,
+    ) -> None:
+        def execute_query(i: int) -> None:
+            query = queries[i]
+            assert isinstance(query, str)
+            logger.debug(f"Running query: {query}")
+            try:
+                row_sets[i] = run_coroutine_sync(self._execute_query(query))
+            except Exception as err:
+                errors[i] = err
+
+        # Blocking queries run in threads instead of tasks
+        with ThreadPoolExecutor(min(concurrency, len(queries)) or 1) as executor:
+            for _ in executor.map(execute_query, range(len(queries))):
+                pass
+
+    def _count_response_bytes(self, response: Response, decoded: int) -> None:
+        # Responses of concurrent queries are counted from different threads
+        with self._idx_lock:
+            super()._count_response_bytes(response, decoded)
+
     @wraps(AsyncBaseCursor.execute)
     def execute(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters: Optional[Sequence[ParameterType]] = None,
         skip_parsing: bool = False,
         async_execution: Optional[bool] = False,
     ) -> Union[int, str]:
         with self._query_lock.gen_wlock():
-            return async_to_sync(super().execute)(
-                query, parameters, skip_parsing, async_execution
+            return run_coroutine_sync(
+                super().execute(query, parameters, skip_parsing, async_execution)
             )
 
     @wraps(AsyncBaseCursor.executemany)
     def executemany(
         self,
-        query: str,
+        query: Union[str, PreparedStatement],
         parameters_seq: Sequence[Sequence[ParameterType]],
         async_execution: Optional[bool] = False,
+        concurrency: int = 1,
     ) -> Union[int, str]:
         with self._query_lock.gen_wlock():
-            return async_to_sync(super().executemany)(
-                query, parameters_seq, async_execution
+            return run_coroutine_sync(
+                super().executemany(query, parameters_seq, async_execution, concurrency)
+            )
+
+    @wraps(AsyncBaseCursor.insert_rows)
+    def insert_rows(
+        self,
+        table: str,
+        rows: Iterable[Sequence[ParameterType]],
+        columns: Optional[Sequence[str]] = None,
+        max_batch_rows: Optional[int] = None,
+        max_batch_bytes: int = 1024 * 1024,
+    ) -> int:
+        with self._query_lock.gen_wlock():
+            return run_coroutine_sync(
+                super().insert_rows(
+                    table, rows, columns, max_batch_rows, max_batch_bytes
+                )
             )
 
     @wraps(AsyncBaseCursor._get_next_range)
@@ -86,6 +174,33 @@ class Cursor(AsyncBaseCursor):
         with self._query_lock.gen_rlock():
             return super().fetchall()
 
+    @wraps(AsyncBaseCursor.fetch_columns)
+    def fetch_columns(self) -> List[List[ColType]]:
+        with self._query_lock.gen_rlock():
+            return super().fetch_columns()
+
+    @wraps(AsyncBaseCursor.fetch_numpy)
+    def fetch_numpy(self) -> List[Any]:
+        with self._query_lock.gen_rlock():
+            return super().fetch_numpy()
+
+    @wraps(AsyncBaseCursor.fetch_arrow_table)
+    def fetch_arrow_table(self) -> Any:
+        with self._query_lock.gen_rlock():
+            return super().fetch_arrow_table()
+
+    @wraps(AsyncBaseCursor.fetch_dataframe)
+    def fetch_dataframe(self) -> Any:
+        with self._query_lock.gen_rlock():
+            return super().fetch_dataframe()
+
+    @wraps(AsyncBaseCursor._fetch_batch)
+    def _fetch_batch(
+        self, size: int, convert: Callable[[List[tuple]], Any]
+    ) -> Optional[Any]:
+        with self._query_lock.gen_rlock():
+            return super()._fetch_batch(size, convert)
+
     @wraps(AsyncBaseCursor.nextset)
     def nextset(self) -> None:
         with self._query_lock.gen_rlock(), self._idx_lock:
@@ -104,9 +219,9 @@ class Cursor(AsyncBaseCursor):
     @wraps(AsyncBaseCursor.get_status)
     def get_status(self, query_id: str) -> QueryStatus:
         with self._query_lock.gen_rlock():
-            return async_to_sync(super().get_status)(query_id)
+            return run_coroutine_sync(super().get_status(query_id))
 
     @wraps(AsyncBaseCursor.cancel)
     def cancel(self, query_id: str) -> None:
         with self._query_lock.gen_rlock():
-            return async_to_sync(super().cancel)(query_id)
+            run_coroutine_sync(super().cancel(query_id))
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from threading import Condition
+from time import monotonic
+from types import TracebackType
+from typing import Any, Iterator, List
+
+from firebolt.async_db.pool import BaseConnectionPool, PoolStats, _PoolEntry
+from firebolt.db.connection import Connection, connect
+from firebolt.utils.exception import ConnectionClosedError, PoolTimeoutError
+from firebolt.utils.util import run_coroutine_sync
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool(BaseConnectionPool[Connection]):
+    """Thread-safe pool of connections, reused between callers.
+
+    Connections are created on demand, up to `max_size`, and returned to the pool
+    when they're released. Connections, that exceed `max_lifetime` or stay idle
+    for longer than `max_idle_time`, are closed. Connections, that stayed idle for
+    longer than `check_idle_time`, are checked with a `select 1` query before
+    they're handed out, and are replaced if the check fails.
+
+    Args:
+        min_size (int): Number of connections, created by `open()` and kept in
+            the pool regardless of `max_idle_time`. Default: 0
+        max_size (int): Maximum number of connections. Default: 10
+        timeout (Optional[float]): Time in seconds to wait for a connection, if
+            all of them are in use, None to wait indefinitely. Default: 30
+        max_lifetime (Optional[float]): Time in seconds after which a connection
+            is closed, None for no limit. Default: 3600
+        max_idle_time (Optional[float]): Time in seconds an unused connection is
+            kept in the pool, None for no limit. Default: 600
+        check_idle_time (Optional[float]): Idle time in seconds after which a
+            connection is checked before it's handed out, None to never check
+            connections. Default: 60
+        **connect_kwargs: `connect` arguments
+
+    Examples:
+        ```
+        with ConnectionPool(auth=auth, database="db", engine_name="e") as pool:
+            with pool.connection() as connection:
+                connection.cursor().execute("select 1")
+        ```
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._condition = Condition()
+
+    @property
+    def stats(self) -> PoolStats:
+        """Pool usage statistics."""
+        with self._condition:
+            return super().stats
+
+    def _create(self) -> _PoolEntry[Connection]:
+        """Create a connection in a reserved slot."""
+        try:
+            connection = connect(**self._connect_kwargs)
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            return self._add_created(connection)
+
+    @staticmethod
+    def _close(entries: List[_PoolEntry[Connection]]) -> None:
+        for entry in entries:
+            entry.connection.close()
+
+    def open(self) -> None:
+        """Create `min_size` connections."""
+        with self._condition:
+            if self._closed:
+                raise ConnectionClosedError("Connection pool is closed.")
+            count = max(self.min_size - self._size, 0)
+            self._size += count
+        for _ in range(count):
+            entry = self._create()
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def acquire(self) -> Connection:
+        """Take a connection from the pool, create a new one or wait until one
+        is released.
+
+        Raises:
+            PoolTimeoutError: No connection became available within `timeout`
+            ConnectionClosedError: Pool is closed
+        """
+        start = monotonic()
+        deadline = start + self.timeout if self.timeout is not None else None
+        while True:
+            with self._condition:
+                entry, create, evicted = self._take()
+                while entry is None and not create:
+                    remaining = deadline - monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No connection became available in {self.timeout} "
+                            "seconds."
+                        )
+                    self._waiting += 1
+                    try:
+                        self._condition.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                    entry, create, evicted = self._take()
+            self._close(evicted)
+            if entry is None:
+                entry = self._create()
+            elif self._needs_check(entry) and not run_coroutine_sync(
+                entry.connection._is_alive()
+            ):
+                logger.debug("Pooled connection failed liveness check, replacing.")
+                with self._condition:
+                    self._discard()
+                    self._condition.notify()
+                self._close([entry])
+                continue
+            with self._condition:
+                return self._check_out(entry, start)
+
+    def release(self, connection: Connection) -> None:
+        """Return a connection to the pool and close its cursors."""
+        for cursor in connection._cursors[:]:
+            cursor.close()
+        with self._condition:
+            entry = self._check_in(connection)
+            self._condition.notify()
+        if entry is not None:
+            self._close([entry])
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """Acquire a connection and release it on exit."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close idle connections. Connections in use are closed on release."""
+        with self._condition:
+            self._closed = True
+            idle = self._take_all_idle()
+            self._condition.notify_all()
+        self._close(idle)
+
+    # Context manager support
+    def __enter__(self) -> ConnectionPool:
+        self.open()
+        return self
+
+    def __exit__(
+        self, exc_type: type, exc_val: Exception, exc_tb: TracebackType
+    ) -> None:
+        self.close()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from httpx import URL, Response
+
+from firebolt.utils.urls import DATABASES_URL, ENGINES_URL
+
+if TYPE_CHECKING:
+    from firebolt.async_db.connection import BaseConnection
+
+
+def is_db_available(connection: BaseConnection, database_name: str) -> bool:
+    """
+    Verify that the database exists.
+
+    Args:
+        connection (firebolt.db.connection.Connection)
+    """
+    resp = _filter_request(
+        connection, DATABASES_URL, {"filter.name_contains": database_name}
+    )
+    return len(resp.json()["edges"]) > 0
+
+
+def is_engine_running(connection: BaseConnection, engine_url: str) -> bool:
+    """
+    Verify that the engine is running.
+
+    Args:
+        connection (firebolt.db.connection.Connection): connection.
+    """
+    # Url is not guaranteed to be of this structure,
+    # but for the sake of error checking this is sufficient.
+    engine_name = URL(engine_url).host.split(".")[0].replace("-", "_")
+    resp = _filter_request(
+        connection,
+        ENGINES_URL,
+        {
+            "filter.name_contains": engine_name,
+            "filter.current_status_eq": "ENGINE_STATUS_RUNNING_REVISION_SERVING",
+        },
+    )
+    return len(resp.json()["edges"]) > 0
+
+
+def _filter_request(
+    connection: BaseConnection, endpoint: str, filters: dict
+) -> Response:
+    resp = connection._client.request(
+        # Full url overrides the client url, which contains engine as a prefix.
+        url=connection.api_endpoint + endpoint,
+        method="GET",
+        params=filters,
+    )
+    resp.raise_for_status()
+    return resp
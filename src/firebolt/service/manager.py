@@ -1,9 +1,10 @@
 from typing import Optional
 
-from httpx import Timeout
+from httpx import HTTPTransport, Timeout
 
 from firebolt.client import Client, log_request, log_response, raise_on_4xx_5xx
 from firebolt.client.auth import Token, UsernamePassword
+from firebolt.client.transport import OverriddenSyncHttpBackend, ssl_context
 from firebolt.common import Settings
 from firebolt.service.provider import get_provider_id
 from firebolt.utils.util import fix_url_schema
@@ -48,6 +49,7 @@ class ResourceManager:
             account_name=self.settings.account_name,
             api_endpoint=self.settings.server,
             timeout=Timeout(DEFAULT_TIMEOUT_SECONDS),
+            transport=self._create_transport(),
             event_hooks={
                 "request": [log_request],
                 "response": [raise_on_4xx_5xx, log_response],
@@ -56,6 +58,14 @@ class ResourceManager:
         self.account_id = self.client.account_id
         self._init_services()
 
+    def _create_transport(self) -> HTTPTransport:
+        # Override tcp keepalive settings for connection
+        transport = HTTPTransport(
+            verify=ssl_context(self.settings.http2), http2=self.settings.http2
+        )
+        transport._pool._network_backend = OverriddenSyncHttpBackend()
+        return transport
+
     def _init_services(self) -> None:
         # avoid circular import
         from firebolt.service.binding import BindingService
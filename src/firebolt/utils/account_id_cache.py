@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from firebolt.utils.event import ThreadSafeEvent
+
+
+def auth_user_key(auth: Any) -> str:
+    """Identify the user of an auth object, to separate cached values of
+    different users.
+
+    Tokens are hashed, so they're never used as is.
+    """
+    user = getattr(auth, "username", None) or getattr(auth, "client_id", None)
+    if user is None:
+        token = getattr(auth, "token", None) or ""
+        user = sha256(token.encode("utf-8")).hexdigest()
+    return user
+
+
+class _Flight:
+    """Account ID lookup, that's in progress."""
+
+    __slots__ = ("done", "account_id", "error")
+
+    def __init__(self) -> None:
+        self.done = ThreadSafeEvent()
+        self.account_id: Optional[str] = None
+        self.error: Optional[Exception] = None
+
+
+class AccountIdCache:
+    """Process-wide cache of account IDs, shared by all clients.
+
+    Concurrent lookups of the same account, from threads or tasks, are
+    combined into a single request. Its error is raised by all of them, and
+    isn't cached.
+
+    Args:
+        ttl (float): Time in seconds an account ID stays valid. Default: 3600
+    """
+
+    def __init__(self, ttl: float = 3600.0):
+        if ttl <= 0:
+            raise ValueError(
+                f"Invalid account id cache ttl {ttl}: positive value expected"
+            )
+        self.ttl = ttl
+        # Key -> account ID and its expiration time
+        self._entries: Dict[Hashable, Tuple[str, float]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_or_join(self, key: Hashable) -> Tuple[Optional[str], _Flight, bool]:
+        """Get a cached account ID, join the lookup in progress or start a new one.
+
+        Returns:
+            Tuple[Optional[str], _Flight, bool]: Cached account ID, lookup and
+                whether the caller should perform it
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > monotonic():
+                    return entry[0], _Flight(), False
+                del self._entries[key]
+            flight = self._flights.get(key)
+            if flight is not None:
+                return None, flight, False
+            flight = self._flights[key] = _Flight()
+            return None, flight, True
+
+    def _finish(
+        self,
+        key: Hashable,
+        flight: _Flight,
+        account_id: Optional[str],
+        error: Optional[Exception],
+    ) -> None:
+        """Store the lookup result and wake up the waiting callers.
+
+        If neither an account ID nor an error is set, the lookup was
+        cancelled and the waiting callers retry it.
+        """
+        with self._lock:
+            del self._flights[key]
+            if account_id is not None:
+                self._entries[key] = (account_id, monotonic() + self.ttl)
+        flight.account_id, flight.error = account_id, error
+        flight.done.set()
+
+    @staticmethod
+    def _result(flight: _Flight) -> Optional[str]:
+        if flight.error is not None:
+            raise flight.error
+        return flight.account_id
+
+    def get(self, key: Hashable, resolve: Callable[[], str]) -> str:
+        """Get a cached account ID, or resolve it if it's not cached or expired.
+
+        Args:
+            key (Hashable): Cache key
+            resolve (Callable[[], str]): Account ID lookup
+
+        Returns:
+            str: Account ID
+        """
+        while True:
+            account_id, flight, leader = self._get_or_join(key)
+            if account_id is not None:
+                return account_id
+            if not leader:
+                flight.done.wait()
+                account_id = self._result(flight)
+                if account_id is not None:
+                    return account_id
+                continue
+            account_id, error = None, None
+            try:
+                account_id = resolve()
+                return account_id
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._finish(key, flight, account_id, error)
+
+    async def async_get(
+        self, key: Hashable, resolve: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Get a cached account ID, or resolve it asynchronously if it's not
+        cached or expired.
+
+        Args:
+            key (Hashable): Cache key
+            resolve (Callable[[], Awaitable[str]]): Account ID lookup
+
+        Returns:
+            str: Account ID
+        """
+        while True:
+            account_id, flight, leader = self._get_or_join(key)
+            if account_id is not None:
+                return account_id
+            if not leader:
+                # The lookup might run in a different thread or event loop
+                await flight.done.async_wait()
+                account_id = self._result(flight)
+                if account_id is not None:
+                    return account_id
+                continue
+            account_id, error = None, None
+            try:
+                account_id = await resolve()
+                return account_id
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._finish(key, flight, account_id, error)
+
+    def clear(self) -> None:
+        """Invalidate all cached account IDs."""
+        with self._lock:
+            self._entries.clear()
+
+
+account_id_cache = AccountIdCache()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from json import JSONDecodeError
+from json import dump as json_dump
+from json import load as json_load
+from os import makedirs, path, remove, replace
+from tempfile import mkstemp
+from threading import Lock
+from time import monotonic, time
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from appdirs import user_data_dir
+
+from firebolt.utils.token_storage import APPNAME
+
+_FILE_NAME = "engine_urls.json"
+
+
+class EngineUrlCacheStats(NamedTuple):
+    """Engine URL cache usage statistics.
+
+    Args:
+        hits (int): Number of engine URLs, served from cache
+        misses (int): Number of engine URLs, not found in cache
+        invalidations (int): Number of entries, removed because their engine
+            didn't respond
+        entries (int): Number of cached engine URLs
+    """
+
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+
+class EngineUrlCache:
+    """Cache of resolved engine URLs, used by `connect` to skip engine
+    resolution requests.
+
+    URLs expire `ttl` seconds after they're resolved, and are invalidated
+    once a query to them fails with 404 or 503 status. If `persist` is set,
+    URLs are also stored in a file, so they're reused by other processes and
+    after a restart.
+
+    Args:
+        ttl (float): Time in seconds a URL stays valid. Default: 3600
+        persist (bool): Store URLs in a file. Default: False
+        file (Optional[str]): File to store URLs in. Default: `engine_urls.json`
+            in the user data directory
+    """
+
+    def __init__(
+        self, ttl: float = 3600.0, persist: bool = False, file: Optional[str] = None
+    ):
+        if ttl <= 0:
+            raise ValueError(
+                f"Invalid engine url cache ttl {ttl}: positive value expected"
+            )
+        self.ttl = ttl
+        self.file = None
+        if persist or file:
+            self.file = file or path.join(user_data_dir(appname=APPNAME), _FILE_NAME)
+        # Key -> URL and its expiration time
+        self._entries: Dict[Hashable, Tuple[str, float]] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> EngineUrlCacheStats:
+        """Cache usage statistics."""
+        with self._lock:
+            return EngineUrlCacheStats(
+                self._hits, self._misses, self._invalidations, len(self._entries)
+            )
+
+    @staticmethod
+    def _file_key(key: Hashable) -> str:
+        # Keys contain user names, which shouldn't be stored as is
+        return sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def _read(self) -> Dict[str, List]:
+        assert self.file is not None
+        try:
+            with open(self.file) as f:
+                data = json_load(f)
+        except (OSError, JSONDecodeError):
+            # File is missing or corrupted
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: Dict[str, List]) -> None:
+        """Replace the file atomically, so other processes never read
+        a partially written one."""
+        assert self.file is not None
+        directory = path.dirname(self.file) or "."
+        try:
+            makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_file = mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with open(fd, "w") as f:
+                json_dump(data, f)
+            replace(tmp_file, self.file)
+        except OSError:
+            try:
+                remove(tmp_file)
+            except OSError:
+                pass
+
+    def _load(self, key: Hashable) -> Optional[Tuple[str, float]]:
+        """Load a URL and its remaining time to live from the file."""
+        entry = self._read().get(self._file_key(key))
+        try:
+            url, expires_at = entry  # type: ignore[misc]
+        except (TypeError, ValueError):
+            return None
+        ttl = expires_at - time()
+        if not isinstance(url, str) or ttl <= 0:
+            return None
+        return url, ttl
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Get cached engine URL, None if it's not cached or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._hits += 1
+                return entry[0]
+
+        loaded = self._load(key) if self.file is not None else None
+        with self._lock:
+            if loaded is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            url, ttl = loaded
+            self._entries[key] = (url, monotonic() + min(ttl, self.ttl))
+            return url
+
+    def put(self, key: Hashable, url: str) -> None:
+        """Cache a resolved engine URL."""
+        with self._lock:
+            self._entries[key] = (url, monotonic() + self.ttl)
+        if self.file is not None:
+            now = time()
+            data = {
+                file_key: entry
+                for file_key, entry in self._read().items()
+                if isinstance(entry, list) and len(entry) == 2 and entry[1] > now
+            }
+            data[self._file_key(key)] = [url, now + self.ttl]
+            self._write(data)
+
+    def invalidate(self, url: str) -> None:
+        """Remove all entries, resolved to an engine URL."""
+        with self._lock:
+            keys = [key for key, (cached, _) in self._entries.items() if cached == url]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+        if self.file is not None:
+            data = self._read()
+            remaining = {
+                file_key: entry
+                for file_key, entry in data.items()
+                if not (isinstance(entry, list) and entry and entry[0] == url)
+            }
+            if len(remaining) != len(data):
+                self._write(remaining)
+
+    def clear(self) -> None:
+        """Invalidate all cached engine URLs."""
+        with self._lock:
+            self._entries.clear()
+        if self.file is not None:
+            self._write({})
+
+
+# Engine URLs are shared by all connections of a process unless a different
+# cache is passed to `connect`
+default_engine_url_cache = EngineUrlCache()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from threading import Event, Lock
+from typing import Any, Callable, List, Optional, Tuple
+
+from anyio import Event as AsyncEvent
+from sniffio import AsyncLibraryNotFoundError, current_async_library
+from trio import RunFinishedError
+from trio.lowlevel import current_trio_token
+
+
+def current_event_loop() -> Any:
+    """Identify the running event loop.
+
+    Asynchronous transports hold sockets and locks of the event loop, they've
+    been created in, so they can't be shared between event loops.
+    """
+    if current_async_library() == "trio":
+        return current_trio_token()
+    return get_running_loop()
+
+
+def _running_event_loop() -> Optional[Any]:
+    try:
+        return current_event_loop()
+    except (AsyncLibraryNotFoundError, RuntimeError):
+        return None
+
+
+def _call_soon(loop: Any, callback: Callable[[], Any]) -> None:
+    """Run a callback in an event loop, from any thread."""
+    if loop is _running_event_loop():
+        callback()
+        return
+    try:
+        if hasattr(loop, "run_sync_soon"):
+            loop.run_sync_soon(callback)
+        else:
+            loop.call_soon_threadsafe(callback)
+    except (RunFinishedError, RuntimeError):
+        # Event loop is closed, nobody is waiting anymore
+        pass
+
+
+class ThreadSafeEvent:
+    """Event, that can be set from any thread or event loop.
+
+    Threads wait for it with `wait`, tasks with `async_wait`. Tasks wait
+    on an event of their own event loop, so no thread is blocked per waiting
+    task.
+    """
+
+    def __init__(self) -> None:
+        self._event = Event()
+        self._lock = Lock()
+        # Event loops and events of waiting tasks
+        self._waiters: List[Tuple[Any, AsyncEvent]] = []
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def set(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            waiters, self._waiters = self._waiters, []
+        for loop, event in waiters:
+            _call_soon(loop, event.set)
+
+    def wait(self) -> None:
+        self._event.wait()
+
+    async def async_wait(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            waiter = (current_event_loop(), AsyncEvent())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1].wait()
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
@@ -1,3 +1,6 @@
+from typing import List, Optional
+
+
 class FireboltError(Exception):
     """Base class for all Firebolt errors."""
 
@@ -77,6 +80,10 @@ class ConnectionClosedError(ConnectionError):
     """Connection operations are unavailable since it's closed."""
 
 
+class PoolTimeoutError(ConnectionError):
+    """No connection became available in a connection pool within the timeout."""
+
+
 class CursorError(FireboltError):
     """Base class for cursor related errors."""
 
@@ -224,6 +231,27 @@ class ConfigurationError(InterfaceError):
     """Invalid configuration error."""
 
 
+class ExecuteManyError(DatabaseError):
+    """Some statements of a concurrent `executemany` call failed.
+
+    Args:
+        errors (List[Optional[Exception]]): Error of each statement, in parameter
+            sets order, None for succeeded statements
+
+    Attributes:
+        errors (List[Optional[Exception]]): Error of each statement, in parameter
+            sets order, None for succeeded statements
+    """
+
+    def __init__(self, errors: List[Optional[Exception]]):
+        failed = [error for error in errors if error is not None]
+        super().__init__(
+            f"{len(failed)} of {len(errors)} statements failed, "
+            f"first error: {failed[0]}"
+        )
+        self.errors = errors
+
+
 class AsyncExecutionUnavailableError(ProgrammingError):
     """
     If `use_standard_sql` is specified the query status endpoint returns a JSON
@@ -0,0 +1,599 @@
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from datetime import date, datetime
+from hashlib import sha256
+from json import dumps as json_dumps
+from json import loads as json_loads
+from mmap import ACCESS_READ, mmap
+from os import listdir, makedirs, path, remove, replace, rmdir, stat, utime
+from struct import Struct
+from struct import error as StructError
+from sys import byteorder
+from tempfile import mkstemp
+from threading import Lock
+from time import monotonic, time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from appdirs import user_data_dir
+
+from firebolt.utils.token_storage import APPNAME
+from firebolt.utils.util import gc_disabled
+
+if TYPE_CHECKING:
+    from firebolt.async_db.cursor import RowSet
+
+# Format marker, format version, expiration timestamp, number of rows and
+# size of JSON metadata, followed by metadata and encoded columns
+_HEADER = Struct("<4sHdQI")
+_MAGIC = b"FBRC"
+_VERSION = 1
+_FILE_SUFFIX = ".result"
+
+# Column encodings
+_JSON_COLUMN = 0
+_INT_COLUMN = 1
+_FLOAT_COLUMN = 2
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_TYPE_NAMES = {
+    int: "Int64",
+    float: "Float64",
+    str: "String",
+    date: "Date",
+    datetime: "DateTime",
+}
+
+
+class ResultCacheStats(NamedTuple):
+    """Result cache usage statistics.
+
+    Args:
+        hits (int): Number of queries, served from cache
+        misses (int): Number of queries, not found in cache
+        evictions (int): Number of entries, evicted to fit cache size limits
+        entries (int): Number of cached results
+        rows (int): Total number of cached rows
+        bytes (int): Total size of cached query responses
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    rows: int
+    bytes: int
+
+
+class _Entry(NamedTuple):
+    row_set: Any
+    rows: int
+    size: int
+    expires_at: float
+    scope: Hashable
+
+
+class ResultCache:
+    """In-memory cache of query results.
+
+    Results expire `ttl` seconds after they're cached. When total cached rows or
+    bytes exceed the limits, least recently used results are evicted. Results
+    are grouped by scope, e.g. engine and database, which is invalidated at
+    once.
+
+    Args:
+        ttl (float): Time in seconds a result stays valid. Default: 60
+        max_rows (Optional[int]): Maximum total number of cached rows, None for
+            no limit. Default: 1 000 000
+        max_bytes (Optional[int]): Maximum total size of cached query responses,
+            None for no limit. Default: None
+        disk_cache (Optional[DiskResultCache]): Second cache tier, which is
+            checked if a result is not found in memory. Default: None
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_rows: Optional[int] = 1_000_000,
+        max_bytes: Optional[int] = None,
+        disk_cache: Optional[DiskResultCache] = None,
+    ):
+        if ttl <= 0:
+            raise ValueError(f"Invalid result cache ttl {ttl}: positive value expected")
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = Lock()
+        self._rows = 0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        """Cache usage statistics."""
+        with self._lock:
+            return ResultCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._rows,
+                self._bytes,
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._rows -= entry.rows
+        self._bytes -= entry.size
+
+    def _exceeds_limits(self, rows: int, size: int) -> bool:
+        return (self.max_rows is not None and rows > self.max_rows) or (
+            self.max_bytes is not None and size > self.max_bytes
+        )
+
+    def get(self, key: Hashable, scope: Hashable = None) -> Optional[RowSet]:
+        """Get cached result, None if it's not cached or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.row_set
+
+        loaded = (
+            self.disk_cache.load(key, scope) if self.disk_cache is not None else None
+        )
+        with self._lock:
+            if loaded is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        row_set, size, ttl = loaded
+        self._store(key, row_set, size, min(ttl, self.ttl), scope)
+        return row_set
+
+    def _store(
+        self, key: Hashable, row_set: RowSet, size: int, ttl: float, scope: Hashable
+    ) -> None:
+        rows = len(row_set[3] or ())
+        # Result is too large to be cached
+        if self._exceeds_limits(rows, size):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(row_set, rows, size, monotonic() + ttl, scope)
+            self._rows += rows
+            self._bytes += size
+            while self._exceeds_limits(self._rows, self._bytes):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def put(
+        self, key: Hashable, row_set: RowSet, size: int, scope: Hashable = None
+    ) -> None:
+        """Cache a result.
+
+        Args:
+            key (Hashable): Cache key
+            row_set (RowSet): Query result
+            size (int): Size of query response in bytes
+            scope (Hashable): Group of results, invalidated together
+        """
+        self._store(key, row_set, size, self.ttl, scope)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, row_set, size, scope)
+
+    def invalidate(self, scope: Hashable = None) -> None:
+        """Invalidate results of a scope in memory and on disk."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.scope == scope]
+            for key in keys:
+                self._remove(key)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(scope)
+
+    def clear(self) -> None:
+        """Invalidate all results, cached in memory.
+
+        Results on disk are shared with other processes, they're cleared with
+        `disk_cache.clear()`.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            self._bytes = 0
+
+
+def _type_name(type_code: Any) -> str:
+    """Firebolt type name, which is parsed back into the same type code."""
+    from firebolt.async_db._types import ARRAY, DATETIME64, DECIMAL
+
+    if isinstance(type_code, ARRAY):
+        return f"Array({_type_name(type_code.subtype)})"
+    if isinstance(type_code, (DECIMAL, DATETIME64)):
+        return str(type_code)
+    return _TYPE_NAMES[type_code]
+
+
+def _to_bytes(values: array) -> bytes:
+    # Files are little-endian, so they're portable between machines
+    if byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: memoryview) -> List[Any]:
+    values = array(typecode)
+    values.frombytes(data)
+    if byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+def _encode_column(values: Sequence[Any]) -> Tuple[int, bool, bytes]:
+    """Encode column values.
+
+    Integer and float columns are stored as packed arrays, other columns as
+    JSON, which decodes strings faster than slicing them from packed text.
+
+    Returns:
+        Tuple[int, bool, bytes]: Column encoding, whether column contains nulls
+            and encoded values, preceded by a null mask if it does
+    """
+    kinds = set(map(type, values))
+    has_nulls = type(None) in kinds
+    kinds.discard(type(None))
+    mask = bytes(value is None for value in values) if has_nulls else b""
+    present = [value for value in values if value is not None] if has_nulls else values
+    if kinds == {int} and _INT64_MIN <= min(present) and max(present) <= _INT64_MAX:
+        ints = array("q", (0 if value is None else value for value in values))
+        return _INT_COLUMN, has_nulls, mask + _to_bytes(ints)
+    if kinds == {float}:
+        floats = array("d", (0.0 if value is None else value for value in values))
+        return _FLOAT_COLUMN, has_nulls, mask + _to_bytes(floats)
+    data = json_dumps(list(values), ensure_ascii=False, separators=(",", ":"))
+    return _JSON_COLUMN, False, data.encode("utf-8")
+
+
+def _decode_column(
+    kind: int, has_nulls: bool, rows: int, data: memoryview
+) -> List[Any]:
+    if kind == _JSON_COLUMN:
+        return json_loads(str(data, "utf-8"))
+    nulls = bytes(data[:rows]) if has_nulls else b""
+    data = data[len(nulls) :]
+    if kind == _INT_COLUMN:
+        values = _from_bytes("q", data)
+    elif kind == _FLOAT_COLUMN:
+        values = _from_bytes("d", data)
+    else:
+        raise ValueError(f"Unknown column encoding {kind}")
+    if len(values) != rows:
+        raise ValueError("Invalid column size")
+    if has_nulls:
+        values = [None if null else value for value, null in zip(values, nulls)]
+    return values
+
+
+def _encode_row_set(row_set: RowSet) -> Optional[Tuple[int, bytes, List[bytes]]]:
+    """Encode a result column by column.
+
+    Returns:
+        Optional[Tuple[int, bytes, List[bytes]]]: Number of rows, metadata and
+            encoded columns, None if result can't be encoded
+    """
+    rowcount, descriptions, statistics, rows = row_set
+    rows = rows or []
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        return None
+    try:
+        columns = (
+            [[column.name, _type_name(column.type_code)] for column in descriptions]
+            if descriptions is not None
+            else None
+        )
+        encoded = [_encode_column(values) for values in zip(*rows)]
+    except (KeyError, TypeError, ValueError):
+        # Unknown type or value, that can't be stored
+        return None
+    meta = {
+        "rowcount": rowcount,
+        "columns": columns,
+        "statistics": statistics.dict() if statistics is not None else None,
+        "has_rows": row_set[3] is not None,
+        "width": width,
+        "sections": [[kind, has_nulls, len(data)] for kind, has_nulls, data in encoded],
+    }
+    meta_data = json_dumps(meta, separators=(",", ":")).encode("utf-8")
+    return len(rows), meta_data, [data for _, _, data in encoded]
+
+
+def _decode_row_set(rows: int, meta: Dict[str, Any], data: memoryview) -> RowSet:
+    # firebolt.async_db imports this module
+    from firebolt.async_db._types import Column, parse_type
+    from firebolt.async_db.cursor import Statistics
+
+    columns = []
+    offset = 0
+    for kind, has_nulls, size in meta["sections"]:
+        columns.append(
+            _decode_column(kind, has_nulls, rows, data[offset : offset + size])
+        )
+        offset += size
+    descriptions = (
+        [
+            Column(name, parse_type(type_name), None, None, None, None, None)
+            for name, type_name in meta["columns"]
+        ]
+        if meta["columns"] is not None
+        else None
+    )
+    statistics = (
+        Statistics(**meta["statistics"]) if meta["statistics"] is not None else None
+    )
+    if not meta["has_rows"]:
+        return meta["rowcount"], descriptions, statistics, None
+    if meta["width"]:
+        row_list = [list(row) for row in zip(*columns)]
+    else:
+        row_list = [[] for _ in range(rows)]
+    return meta["rowcount"], descriptions, statistics, row_list
+
+
+class DiskResultCache:
+    """File system cache of query results, shared between processes.
+
+    Each result is stored in a separate file in a compact binary format:
+    integer and float columns are packed arrays, other columns are JSON.
+    Files are memory mapped on read and written atomically, so concurrent
+    processes read either a complete result or none. Results of each scope
+    are stored in a separate subdirectory. When total size of cached files
+    exceeds the limit, least recently used results are removed.
+
+    Args:
+        directory (Optional[str]): Cache directory. Default: `result_cache`
+            subdirectory of the user data directory
+        ttl (float): Time in seconds a result stays valid. Default: 3600
+        max_bytes (Optional[int]): Maximum total size of cached files, None
+            for no limit. Default: 256 MiB
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = 3600.0,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+    ):
+        if ttl <= 0:
+            raise ValueError(f"Invalid result cache ttl {ttl}: positive value expected")
+        self.directory = directory or path.join(
+            user_data_dir(appname=APPNAME), "result_cache"
+        )
+        makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _hash(value: Hashable) -> str:
+        return sha256(repr(value).encode("utf-8")).hexdigest()
+
+    def _scope_directory(self, scope: Hashable) -> str:
+        return path.join(self.directory, self._hash(scope))
+
+    def _file(self, key: Hashable, scope: Hashable = None) -> str:
+        return path.join(self._scope_directory(scope), self._hash(key) + _FILE_SUFFIX)
+
+    @staticmethod
+    def _list(directory: str) -> List[str]:
+        try:
+            return [path.join(directory, name) for name in listdir(directory)]
+        except OSError:
+            # Removed by another process
+            return []
+
+    def _files(
+        self, scope_directory: Optional[str] = None
+    ) -> List[Tuple[str, float, int]]:
+        """List cached files of a scope or all scopes with their modification
+        time and size."""
+        directories = (
+            [scope_directory]
+            if scope_directory is not None
+            else [
+                directory
+                for directory in self._list(self.directory)
+                if path.isdir(directory)
+            ]
+        )
+        files = []
+        for directory in directories:
+            for file in self._list(directory):
+                if not file.endswith(_FILE_SUFFIX):
+                    continue
+                try:
+                    info = stat(file)
+                except OSError:
+                    # Removed by another process
+                    continue
+                files.append((file, info.st_mtime, info.st_size))
+        return files
+
+    @staticmethod
+    def _remove_file(file: str) -> None:
+        try:
+            remove(file)
+        except OSError:
+            # Removed by another process or still open on Windows
+            pass
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        """Cache usage statistics of current process and cached files."""
+        files = self._files()
+        rows = 0
+        for file, _, _ in files:
+            try:
+                with open(file, "rb") as f:
+                    magic, version, _, file_rows, _ = _HEADER.unpack(
+                        f.read(_HEADER.size)
+                    )
+            except (OSError, StructError):
+                continue
+            if magic == _MAGIC and version == _VERSION:
+                rows += file_rows
+        with self._lock:
+            return ResultCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(files),
+                rows,
+                sum(size for _, _, size in files),
+            )
+
+    def _read(self, file: str) -> Optional[Tuple[RowSet, int, float]]:
+        try:
+            with open(file, "rb") as f, mmap(f.fileno(), 0, access=ACCESS_READ) as m:
+                magic, version, expires_at, rows, meta_size = _HEADER.unpack_from(m)
+                ttl = expires_at - time()
+                if magic != _MAGIC or version != _VERSION or ttl <= 0:
+                    return None
+                with memoryview(m) as data:
+                    meta_end = _HEADER.size + meta_size
+                    meta = json_loads(str(data[_HEADER.size : meta_end], "utf-8"))
+                    with gc_disabled():
+                        row_set = _decode_row_set(rows, meta, data[meta_end:])
+                return row_set, len(m), ttl
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Empty, corrupted or written by an incompatible version. Reading
+            # a cached result must never fail a query.
+            return None
+
+    def load(
+        self, key: Hashable, scope: Hashable = None
+    ) -> Optional[Tuple[RowSet, int, float]]:
+        """Load cached result with its size and remaining time to live.
+
+        Returns None if result is not cached or expired.
+        """
+        file = self._file(key, scope)
+        loaded = self._read(file)
+        with self._lock:
+            if loaded is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if loaded is None:
+            if path.exists(file):
+                # Expired or corrupted
+                self._remove_file(file)
+            return None
+        try:
+            # Mark as recently used
+            utime(file)
+        except OSError:
+            pass
+        return loaded
+
+    def get(self, key: Hashable, scope: Hashable = None) -> Optional[RowSet]:
+        """Get cached result, None if it's not cached or expired."""
+        loaded = self.load(key, scope)
+        return loaded[0] if loaded is not None else None
+
+    def put(
+        self, key: Hashable, row_set: RowSet, size: int = 0, scope: Hashable = None
+    ) -> None:
+        """Cache a result.
+
+        Args:
+            key (Hashable): Cache key
+            row_set (RowSet): Query result
+            size (int): Size of query response in bytes, not used
+            scope (Hashable): Group of results, invalidated together
+        """
+        encoded = _encode_row_set(row_set)
+        # Result contains values, that can't be stored
+        if encoded is None:
+            return
+        rows, meta, columns = encoded
+        header = _HEADER.pack(_MAGIC, _VERSION, time() + self.ttl, rows, len(meta))
+        file_size = len(header) + len(meta) + sum(len(data) for data in columns)
+        # Result is too large to be cached
+        if self.max_bytes is not None and file_size > self.max_bytes:
+            return
+        directory = self._scope_directory(scope)
+        try:
+            makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_file = mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with open(fd, "wb") as f:
+                f.write(header)
+                f.write(meta)
+                for data in columns:
+                    f.write(data)
+            replace(tmp_file, self._file(key, scope))
+        except OSError:
+            self._remove_file(tmp_file)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used files to fit size limit."""
+        if self.max_bytes is None:
+            return
+        files = sorted(self._files(), key=lambda file: file[1])
+        total = sum(size for _, _, size in files)
+        for file, _, size in files:
+            if total <= self.max_bytes:
+                break
+            self._remove_file(file)
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def invalidate(self, scope: Hashable = None) -> None:
+        """Invalidate cached results of a scope."""
+        directory = self._scope_directory(scope)
+        for file, _, _ in self._files(directory):
+            self._remove_file(file)
+        try:
+            rmdir(directory)
+        except OSError:
+            # Missing, or another process stored a result in the meantime
+            pass
+
+    def clear(self) -> None:
+        """Invalidate all cached results of all scopes."""
+        for file, _, _ in self._files():
+            self._remove_file(file)
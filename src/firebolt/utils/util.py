@@ -1,5 +1,19 @@
+import gc
+from atexit import register as register_atexit
+from contextlib import contextmanager
 from functools import lru_cache, partial, wraps
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+from os import getpid
+from threading import Event, Lock, Thread, current_thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 import trio
 from httpx import URL
@@ -70,9 +84,76 @@ def fix_url_schema(url: str) -> str:
     return url if url.startswith("http") else f"https://{url}"
 
 
+class EventLoopThread:
+    """Trio event loop, running in a daemon thread.
+
+    Coroutines, submitted from any thread, run concurrently on the same loop, so
+    HTTP connections opened by one call are kept alive and reused by the next
+    ones, and there is no cost of starting a new loop per call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._pid: Optional[int] = None
+        self._token: Optional[trio.lowlevel.TrioToken] = None
+        self._stop_event: Optional[trio.Event] = None
+
+    def _run_loop(self, started: Event) -> None:
+        async def main() -> None:
+            self._token = trio.lowlevel.current_trio_token()
+            self._stop_event = trio.Event()
+            started.set()
+            await self._stop_event.wait()
+
+        trio.run(main)
+
+    def _start(self) -> trio.lowlevel.TrioToken:
+        with self._lock:
+            # Threads don't survive fork, child process needs its own loop
+            if self._thread is None or self._pid != getpid():
+                started = Event()
+                self._thread = Thread(
+                    target=self._run_loop,
+                    args=(started,),
+                    name="firebolt-event-loop",
+                    daemon=True,
+                )
+                self._pid = getpid()
+                self._thread.start()
+                started.wait()
+            assert self._token is not None
+            return self._token
+
+    def run(self, f: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a coroutine function on the loop and wait for its result."""
+        if current_thread() is self._thread:
+            # Waiting for the loop from its own thread would be a deadlock
+            return trio.run(partial(f, *args, **kwargs))
+        return trio.from_thread.run(
+            partial(f, *args, **kwargs), trio_token=self._start()
+        )
+
+    def stop(self) -> None:
+        """Stop the loop. It's started again on the next `run` call."""
+        with self._lock:
+            if self._thread is None or self._pid != getpid():
+                return
+            assert self._token is not None and self._stop_event is not None
+            trio.from_thread.run_sync(self._stop_event.set, trio_token=self._token)
+            self._thread.join()
+            self._thread = None
+
+
+_event_loop = EventLoopThread()
+register_atexit(_event_loop.stop)
+
+
 def async_to_sync(f: Callable) -> Callable:
     """Convert async function to sync.
 
+    The function runs on a shared event loop in a background thread.
+
     Args:
         f (Callable): function to convert
 
@@ -82,11 +163,34 @@ def async_to_sync(f: Callable) -> Callable:
 
     @wraps(f)
     def sync(*args: Any, **kwargs: Any) -> Any:
-        return trio.run(partial(f, *args, **kwargs))
+        return _event_loop.run(f, *args, **kwargs)
 
     return sync
 
 
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine, that never suspends, without an event loop.
+
+    Synchronous connections reuse query logic of asynchronous cursors with
+    blocking I/O, so their coroutines complete on the first step.
+
+    Args:
+        coroutine (Coroutine): coroutine to run
+
+    Returns:
+        T: coroutine result
+
+    Raises:
+        RuntimeError: coroutine suspended, so it requires an event loop
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+    coroutine.close()
+    raise RuntimeError("Coroutine suspended, it can only run in an event loop")
+
+
 def merge_urls(base: URL, merge: URL) -> URL:
     """Merge a base and merge urls.
 
@@ -103,3 +207,36 @@ def merge_urls(base: URL, merge: URL) -> URL:
         merge_raw_path = base.raw_path + merge.raw_path.lstrip(b"/")
         return base.copy_with(raw_path=merge_raw_path)
     return merge
+
+
+# Number of active gc_disabled contexts and whether garbage collection was
+# enabled before the first of them
+_gc_disabled_count = 0
+_gc_was_enabled = False
+_gc_lock = Lock()
+
+
+@contextmanager
+def gc_disabled() -> Iterator[None]:
+    """Disable garbage collection inside the context.
+
+    Decoding a large query result creates millions of objects, which triggers
+    garbage collection many times, although decoded objects can't have reference
+    cycles.
+
+    Contexts may overlap in different threads: garbage collection is disabled
+    by the first context and its original state is restored by the last one.
+    """
+    global _gc_disabled_count, _gc_was_enabled
+    with _gc_lock:
+        if _gc_disabled_count == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_disabled_count += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_disabled_count -= 1
+            if _gc_disabled_count == 0 and _gc_was_enabled:
+                gc.enable()
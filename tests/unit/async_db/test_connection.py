@@ -1,22 +1,39 @@
+import zlib
+from gzip import compress
+from json import loads
 from re import Pattern
-from typing import Callable, List
+from typing import Any, Callable, List
 from unittest.mock import patch
 
-from httpx import codes
+from anyio import create_task_group
+from httpx import URL, AsyncByteStream, Limits, Request, Response, codes
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark, raises
 from pytest_httpx import HTTPXMock
 
 from firebolt.async_db._types import ColType
-from firebolt.async_db.connection import Connection, connect
+from firebolt.async_db.connection import (
+    Connection,
+    OverriddenHttpBackend,
+    connect,
+)
 from firebolt.client.auth import Auth, Token, UsernamePassword
+from firebolt.client.transport import (
+    SharedAsyncTransport,
+    ssl_context,
+    transport_registry,
+)
 from firebolt.common.settings import Settings
+from firebolt.utils.engine_url_cache import EngineUrlCache
 from firebolt.utils.exception import (
     AccountNotFoundError,
+    AuthenticationError,
     ConfigurationError,
     ConnectionClosedError,
+    EngineNotRunningError,
     FireboltEngineError,
 )
+from firebolt.utils.result_cache import ResultCache
 from firebolt.utils.token_storage import TokenSecureStorage
 from firebolt.utils.urls import ACCOUNT_ENGINE_ID_BY_NAME_URL
 
@@ -209,6 +226,260 @@ async def test_connect_engine_name(
         assert await connection.cursor().execute("select*") == len(python_query_data)
 
 
+async def test_connect_engine_url_cache(
+    settings: Settings,
+    db_name: str,
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_url: str,
+    account_id_url: Pattern,
+    account_id_callback: Callable,
+    engine_id: str,
+    get_engine_url_by_id_url: str,
+    get_engine_url_by_id_callback: Callable,
+    get_engines_url: str,
+    account_id: str,
+):
+    """Resolved engine urls are reused until a query to the engine fails."""
+    engine_name = settings.server.split(".")[0]
+    engine_id_url = (
+        f"https://{settings.server}"
+        + ACCOUNT_ENGINE_ID_BY_NAME_URL.format(account_id=account_id)
+        + f"?engine_name={engine_name}"
+    )
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(account_id_callback, url=account_id_url)
+    httpx_mock.add_response(
+        url=engine_id_url, json={"engine_id": {"engine_id": engine_id}}
+    )
+    httpx_mock.add_callback(get_engine_url_by_id_callback, url=get_engine_url_by_id_url)
+    httpx_mock.add_response(
+        status_code=codes.SERVICE_UNAVAILABLE, content="Engine error", url=query_url
+    )
+    httpx_mock.add_response(
+        json={"edges": []},
+        url=(
+            get_engines_url + "?filter.name_contains=api_dev"
+            "&filter.current_status_eq=ENGINE_STATUS_RUNNING_REVISION_SERVING"
+        ),
+    )
+
+    cache = EngineUrlCache()
+    kwargs = dict(
+        engine_name=engine_name,
+        database=db_name,
+        auth=UsernamePassword("u", "p"),
+        account_name=settings.account_name,
+        api_endpoint=settings.server,
+        additional_parameters={"engine_url_cache": cache},
+    )
+    for _ in range(2):
+        async with await connect(**kwargs) as connection:
+            assert connection.engine_url == f"https://{settings.server}"
+    assert len(httpx_mock.get_requests(url=engine_id_url)) == 1
+    assert cache.stats.hits == 1 and len(cache) == 1
+
+    async with await connect(**kwargs) as connection:
+        with raises(EngineNotRunningError):
+            await connection.cursor().execute("select*")
+    assert len(cache) == 0, "Engine url wasn't invalidated"
+
+    async with await connect(**kwargs) as connection:
+        pass
+    assert len(httpx_mock.get_requests(url=engine_id_url)) == 2
+
+    with raises(ConfigurationError):
+        await connect(**{**kwargs, "additional_parameters": {"engine_url_cache": 1}})
+
+    # Credentials are validated, although engine url is cached
+    httpx_mock.add_response(url=auth_url, status_code=codes.FORBIDDEN)
+    with raises(AuthenticationError):
+        await connect(
+            **{**kwargs, "auth": UsernamePassword("u", "wrong", use_token_cache=False)}
+        )
+    assert cache.stats.hits == 3
+
+
+async def test_connect_lazy(
+    settings: Settings,
+    db_name: str,
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    account_id_url: Pattern,
+    account_id_callback: Callable,
+    engine_id: str,
+    get_engine_url_by_id_url: str,
+    get_engine_url_by_id_callback: Callable,
+    account_id: str,
+):
+    """Lazy connection resolves engine url once, on the first queries."""
+    engine_name = settings.server.split(".")[0]
+    engine_id_url = (
+        f"https://{settings.server}"
+        + ACCOUNT_ENGINE_ID_BY_NAME_URL.format(account_id=account_id)
+        + f"?engine_name={engine_name}"
+    )
+
+    async with await connect(
+        engine_name=engine_name,
+        database=db_name,
+        auth=UsernamePassword("u", "p"),
+        account_name=settings.account_name,
+        api_endpoint=settings.server,
+        lazy=True,
+    ) as connection:
+        assert not httpx_mock.get_requests(), "Lazy connection sent requests"
+        assert connection.engine_url == ""
+
+        httpx_mock.add_callback(auth_callback, url=auth_url)
+        httpx_mock.add_callback(account_id_callback, url=account_id_url)
+        httpx_mock.add_response(
+            url=engine_id_url, json={"engine_id": {"engine_id": engine_id}}
+        )
+        httpx_mock.add_callback(
+            get_engine_url_by_id_callback, url=get_engine_url_by_id_url
+        )
+        httpx_mock.add_callback(query_callback, url=query_url)
+
+        async with create_task_group() as task_group:
+            for _ in range(3):
+                task_group.start_soon(connection.cursor().execute, "select*")
+        assert len(httpx_mock.get_requests(url=engine_id_url)) == 1
+        assert connection.engine_url == f"https://{settings.server}"
+        assert isinstance(connection._client._transport, SharedAsyncTransport)
+        assert {"authentication", "account", "engine", "total"} <= set(
+            connection.bootstrap_timings
+        )
+
+
+async def test_connect_bootstrap_timings(
+    settings: Settings,
+    db_name: str,
+    httpx_mock: HTTPXMock,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    account_id_url: Pattern,
+    account_id_callback: Callable,
+    engine_id: str,
+    get_engine_url_by_id_url: str,
+    get_engine_url_by_id_callback: Callable,
+    account_id: str,
+):
+    """connect authenticates once and reports time of each phase."""
+    engine_name = settings.server.split(".")[0]
+    httpx_mock.add_response(
+        url=auth_url, json={"access_token": "token", "expires_in": 2**32}
+    )
+    httpx_mock.add_callback(account_id_callback, url=account_id_url)
+    httpx_mock.add_response(
+        url=f"https://{settings.server}"
+        + ACCOUNT_ENGINE_ID_BY_NAME_URL.format(account_id=account_id)
+        + f"?engine_name={engine_name}",
+        json={"engine_id": {"engine_id": engine_id}},
+    )
+    httpx_mock.add_callback(get_engine_url_by_id_callback, url=get_engine_url_by_id_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    async with await connect(
+        engine_name=engine_name,
+        database=db_name,
+        auth=UsernamePassword("u", "p", use_token_cache=False),
+        account_name=settings.account_name,
+        api_endpoint=settings.server,
+    ) as connection:
+        await connection.cursor().execute("select*")
+        timings = connection.bootstrap_timings
+        assert set(timings) == {
+            "authentication",
+            "account",
+            "engine",
+            "connection",
+            "total",
+        }
+        assert all(value >= 0 for value in timings.values())
+        assert timings["total"] >= timings["authentication"] + timings["engine"]
+        # Token of the bootstrap is reused by queries
+        assert len(httpx_mock.get_requests(url=auth_url)) == 1
+        pool = connection._client._transport.transport._pool
+        assert pool._ssl_context is ssl_context()
+
+    # Engine url is cached, so it's not resolved again
+    async with await connect(
+        engine_name=engine_name,
+        database=db_name,
+        auth=UsernamePassword("u", "p", use_token_cache=False),
+        account_name=settings.account_name,
+        api_endpoint=settings.server,
+    ) as connection:
+        assert set(connection.bootstrap_timings) == {
+            "authentication",
+            "account",
+            "connection",
+            "total",
+        }
+
+
+async def test_connection_shared_transport(settings: Settings, db_name: str):
+    """Connections to the same engine share a transport until the last one
+    is closed."""
+    kwargs = dict(
+        engine_url=settings.server,
+        database=db_name,
+        auth=Token("token"),
+        api_endpoint=settings.server,
+    )
+    connection1 = await connect(**kwargs)
+    connection2 = await connect(**kwargs)
+    transport = connection1._client._transport
+    assert isinstance(transport, SharedAsyncTransport)
+    assert transport.transport is connection2._client._transport.transport
+    assert transport_registry.references(transport.key) == 2
+
+    limits = Limits(max_connections=5, keepalive_expiry=30)
+    connection3 = await connect(**kwargs, additional_parameters={"http_limits": limits})
+    assert connection3._client._transport.transport is not transport.transport
+    pool = connection3._client._transport.transport._pool
+    assert (pool._max_connections, pool._keepalive_expiry) == (5, 30)
+    await connection3.aclose()
+
+    connection4 = await connect(
+        **kwargs, additional_parameters={"shared_transport": False}
+    )
+    assert not isinstance(connection4._client._transport, SharedAsyncTransport)
+    await connection4.aclose()
+
+    await connection1.aclose()
+    assert transport_registry.references(transport.key) == 1
+    await connection2.aclose()
+    assert transport_registry.references(transport.key) == 0
+    assert len(transport_registry) == 0
+
+    with raises(ConfigurationError):
+        await connect(**kwargs, additional_parameters={"http_limits": 10})
+
+
+async def test_connection_http2(settings: Settings, db_name: str):
+    """HTTP/2 connections use a separate transport with keepalive settings."""
+    kwargs = dict(
+        engine_url=settings.server,
+        database=db_name,
+        auth=Token("token"),
+        api_endpoint=settings.server,
+    )
+    async with await connect(**kwargs) as connection1, await connect(
+        **kwargs, additional_parameters={"http2": True}
+    ) as connection2:
+        transport = connection2._client._transport.transport
+        assert transport is not connection1._client._transport.transport
+        assert transport._pool._http2
+        assert isinstance(transport._pool._network_backend, OverriddenHttpBackend)
+
+
 async def test_connect_default_engine(
     settings: Settings,
     db_name: str,
@@ -426,3 +697,173 @@ async def test_connect_no_user_agent(
         ) as connection:
             await connection.cursor().execute("select*")
         ut.assert_called_once_with([], [])
+
+
+@mark.parametrize("json_decoder", ["auto", "json", loads])
+async def test_connect_json_decoder(
+    httpx_mock: HTTPXMock,
+    settings: Settings,
+    db_name: str,
+    query_callback: Callable,
+    query_url: str,
+    access_token: str,
+    python_query_data: List[List[ColType]],
+    json_decoder: Any,
+) -> None:
+    """json_decoder parameter doesn't change query results."""
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    async with await connect(
+        auth=Token(access_token),
+        database=db_name,
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+        additional_parameters={"json_decoder": json_decoder},
+    ) as connection:
+        cursor = connection.cursor()
+        await cursor.execute("select*")
+        assert await cursor.fetchall() == python_query_data
+
+
+class CompressedStream(AsyncByteStream):
+    def __init__(self, content: bytes):
+        self._content = content
+
+    async def __aiter__(self):
+        yield self._content
+
+
+@mark.parametrize(
+    "compression,compress_content",
+    [("gzip", compress), ("deflate", zlib.compress)],
+)
+async def test_connect_compression(
+    httpx_mock: HTTPXMock,
+    settings: Settings,
+    db_name: str,
+    query_callback: Callable,
+    query_url: str,
+    access_token: str,
+    python_query_data: List[List[ColType]],
+    compression: str,
+    compress_content: Callable,
+) -> None:
+    """Query results are requested compressed and decoded."""
+
+    def compressed_query_callback(request: Request, **kwargs) -> Response:
+        assert request.headers["Accept-Encoding"] == compression
+        response = query_callback(request)
+        return Response(
+            status_code=codes.OK,
+            # Stream is decoded when it's read by the client
+            stream=CompressedStream(compress_content(response.content)),
+            headers={"Content-Encoding": compression},
+        )
+
+    httpx_mock.add_callback(
+        compressed_query_callback,
+        url=URL(query_url).copy_add_param("enable_http_compression", "1"),
+    )
+
+    async with await connect(
+        auth=Token(access_token),
+        database=db_name,
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+        additional_parameters={"compression": compression},
+    ) as connection:
+        cursor = connection.cursor()
+        await cursor.execute("select*")
+        assert await cursor.fetchall() == python_query_data
+        assert 0 < cursor.bytes_received < cursor.bytes_decoded
+
+
+async def test_connect_invalid_compression(
+    settings: Settings, db_name: str, access_token: str
+) -> None:
+    """Unknown compression raises an error."""
+    with raises(ConfigurationError):
+        await connect(
+            auth=Token(access_token),
+            database=db_name,
+            engine_url=settings.server,
+            api_endpoint=settings.server,
+            additional_parameters={"compression": "lz4"},
+        )
+
+
+async def test_connect_invalid_json_decoder(
+    settings: Settings, db_name: str, access_token: str
+) -> None:
+    """Unknown json_decoder raises an error."""
+    with raises(ConfigurationError):
+        await connect(
+            auth=Token(access_token),
+            database=db_name,
+            engine_url=settings.server,
+            api_endpoint=settings.server,
+            additional_parameters={"json_decoder": "yaml"},
+        )
+
+
+async def test_connect_result_cache(
+    settings: Settings, db_name: str, access_token: str
+) -> None:
+    """result_cache parameter enables result cache."""
+    cache = ResultCache()
+    for result_cache, check in (
+        (True, lambda c: isinstance(c, ResultCache)),
+        (cache, lambda c: c is cache),
+        (False, lambda c: c is None),
+    ):
+        async with await connect(
+            auth=Token(access_token),
+            database=db_name,
+            engine_url=settings.server,
+            api_endpoint=settings.server,
+            additional_parameters={"result_cache": result_cache},
+        ) as connection:
+            assert check(connection.result_cache), "Invalid result cache"
+
+    with raises(ConfigurationError):
+        await connect(
+            auth=Token(access_token),
+            database=db_name,
+            engine_url=settings.server,
+            api_endpoint=settings.server,
+            additional_parameters={"result_cache": 1},
+        )
+
+
+async def test_connect_set_parameters(
+    httpx_mock: HTTPXMock,
+    settings: Settings,
+    db_name: str,
+    query_callback: Callable,
+    query_url: str,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+    access_token: str,
+) -> None:
+    """set_parameters are inherited by all cursors and validated once."""
+    validate_url = f"{set_query_url}&a=b&c=d"
+    httpx_mock.add_callback(select_one_query_callback, url=validate_url)
+    httpx_mock.add_callback(
+        query_callback, url=URL(query_url).copy_merge_params({"a": "b", "c": "d"})
+    )
+
+    async with await connect(
+        auth=Token(access_token),
+        database=db_name,
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+        additional_parameters={"set_parameters": {"a": "b", "c": "d"}},
+    ) as connection:
+        for _ in range(2):
+            cursor = connection.cursor()
+            assert cursor._set_parameters == {"a": "b", "c": "d"}
+            await cursor.execute("select*")
+            cursor.flush_parameters()
+            assert cursor._set_parameters == {"a": "b", "c": "d"}
+
+    assert len(httpx_mock.get_requests(url=validate_url)) == 1
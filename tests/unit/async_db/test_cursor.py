@@ -1,22 +1,32 @@
+from importlib.util import find_spec
 from typing import Callable, Dict, List
 from unittest.mock import patch
 
-from httpx import HTTPStatusError, StreamError, codes
-from pytest import raises
+from httpx import HTTPStatusError, Request, Response, StreamError, codes
+from pytest import importorskip, raises
 from pytest_httpx import HTTPXMock
 
-from firebolt.async_db import Cursor
+from firebolt.async_db import Connection, Cursor
 from firebolt.async_db._types import Column
-from firebolt.async_db.cursor import ColType, CursorState, QueryStatus
+from firebolt.async_db.cursor import (
+    TSV_OUTPUT_FORMAT,
+    ColType,
+    CursorState,
+    QueryStatus,
+)
 from firebolt.utils.exception import (
     AsyncExecutionUnavailableError,
     CursorClosedError,
     DataError,
     EngineNotRunningError,
+    ExecuteManyError,
     FireboltDatabaseError,
+    NotSupportedError,
     OperationalError,
+    ProgrammingError,
     QueryNotRunError,
 )
+from firebolt.utils.result_cache import ResultCache
 from tests.unit.db_conftest import encode_param
 
 
@@ -374,6 +384,8 @@ async def test_cursor_server_side_async_execute_errors(
         httpx_mock.add_callback(auth_callback, url=auth_url)
         await cursor.execute("set use_standard_sql=1")
         httpx_mock.reset(True)
+        # Validate SET parameters again on the next iteration
+        cursor.connection._validated_set_parameters.clear()
 
 
 async def test_cursor_fetchone(
@@ -503,6 +515,307 @@ async def test_cursor_fetchall(
         await cursor.fetchall()
 
 
+async def test_cursor_fetch_columns(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_columns fetches all remaining rows grouped by column."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    await cursor.execute("sql")
+    await cursor.fetchone()
+    columns = await cursor.fetch_columns()
+    assert len(columns) == len(cursor.description), "Invalid columns count"
+    assert columns == [
+        list(c) for c in zip(*python_query_data[1:])
+    ], "Invalid columns returned by fetch_columns"
+    assert await cursor.fetch_columns() == [[]] * len(cursor.description)
+
+
+async def test_cursor_fetch_numpy(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_numpy converts columns into typed numpy arrays."""
+    np = importorskip("numpy")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    await cursor.execute("sql")
+    arrays = await cursor.fetch_numpy()
+    expected = list(zip(*python_query_data))
+    for i, dtype in (
+        (0, "int64"),
+        (7, "float64"),
+        (9, "datetime64[D]"),
+        (11, "datetime64[us]"),
+        (12, "datetime64[us]"),
+        (14, "object"),
+        (15, "object"),
+    ):
+        assert arrays[i].dtype == np.dtype(dtype), f"Invalid dtype for column {i}"
+        assert arrays[i].tolist() == list(expected[i]), f"Invalid column {i} values"
+    assert not any(isinstance(a, np.ma.MaskedArray) for a in arrays)
+
+
+async def test_cursor_fetch_arrow(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_arrow_table and iter_arrow_batches convert rows to Arrow."""
+    pa = importorskip("pyarrow")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    await cursor.execute("sql")
+    table = await cursor.fetch_arrow_table()
+    assert table.num_rows == len(python_query_data)
+    assert table.column_names == [c.name for c in python_query_description]
+    assert table.schema.field("int64").type == pa.int64()
+    assert table.schema.field("float64").type == pa.float64()
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("datetime64").type == pa.timestamp("us")
+    assert table.schema.field("array").type == pa.list_(pa.int64())
+    assert [list(r.values()) for r in table.to_pylist()] == python_query_data
+
+    await cursor.execute("sql")
+    batches = [b async for b in cursor.iter_arrow_batches(4)]
+    assert [b.num_rows for b in batches] == [4, 4, 2], "Invalid batches size"
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+async def test_cursor_fetch_dataframe(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_dataframe and iter_dataframes convert rows to DataFrames."""
+    pd = importorskip("pandas")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    await cursor.execute("sql")
+    frame = await cursor.fetch_dataframe()
+    assert frame.shape == (len(python_query_data), len(python_query_description))
+    assert list(frame.columns) == [c.name for c in python_query_description]
+    assert frame["int64"].dtype == "Int64"
+    assert frame["float64"].dtype == "float64"
+    assert frame["date"].dtype == "datetime64[ns]"
+    assert frame["string"].dtype == object
+    columns = list(zip(*python_query_data))
+    assert frame["uint8"].tolist() == list(columns[0])
+    assert frame["date"].dt.date.tolist() == list(columns[9])
+    assert frame["array"].tolist() == list(columns[14])
+
+    await cursor.execute("sql")
+    frames = [f async for f in cursor.iter_dataframes(4)]
+    assert [len(f) for f in frames] == [4, 4, 2], "Invalid chunks size"
+    assert pd.concat(frames, ignore_index=True).equals(frame)
+
+
+async def test_cursor_tsv_output_format(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    tsv_query_callback: Callable,
+    tsv_query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """Cursor requests and parses results in tab separated format."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(tsv_query_callback, url=tsv_query_url)
+
+    with raises(ValueError):
+        cursor.output_format = "CSV"
+
+    cursor.output_format = TSV_OUTPUT_FORMAT
+    assert await cursor.execute("select * from t") == len(python_query_data)
+    assert cursor.description == python_query_description
+    assert cursor.statistics is None
+    assert await cursor.fetchall() == python_query_data
+
+
+async def test_cursor_result_cache(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    insert_query_callback: Callable,
+    query_url: str,
+    connection: Connection,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """Results of repeated SELECT queries are taken from the result cache."""
+    requests = []
+
+    def counting_query_callback(request: Request, **kwargs) -> Response:
+        requests.append(request)
+        return query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(counting_query_callback, url=query_url)
+    httpx_mock.add_callback(counting_query_callback, url=f"{query_url}&a=b")
+    httpx_mock.add_callback(insert_query_callback, url=f"{query_url}&a=b")
+    httpx_mock.add_callback(counting_query_callback, url=f"{query_url}&a=b")
+    connection.result_cache = ResultCache()
+
+    for _ in range(3):
+        assert await cursor.execute("select * from t") == len(python_query_data)
+        assert await cursor.fetchall() == python_query_data
+    assert len(requests) == 1, "Cached query was sent to server"
+    assert connection.result_cache.stats.hits == 2
+    assert cursor.bytes_received == 0, "Cached query result was counted"
+
+    # Result depends on set parameters
+    cursor._set_parameters = {"a": "b"}
+    for _ in range(2):
+        await cursor.execute("-- comment\nselect * from t")
+    assert len(requests) == 2
+    assert connection.result_cache.stats.entries == 2
+
+    # Other statements invalidate cache
+    await cursor.execute("insert into t values (1)")
+    assert connection.result_cache.stats.entries == 0
+    await cursor.execute("-- comment\nselect * from t")
+    assert len(requests) == 3
+
+
+async def test_cursor_prepared_statement(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    connection: Connection,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """Cursor executes statements, prepared by connection."""
+    queries = []
+
+    def recording_query_callback(request: Request, **kwargs) -> Response:
+        queries.append(request.read().decode())
+        return query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(recording_query_callback, url=query_url)
+
+    statement = connection.prepare("select * from t where a = ?")
+    assert await cursor.execute(statement, [1]) == len(python_query_data)
+    assert await cursor.fetchall() == python_query_data
+    await cursor.executemany(statement, [["a"], [None]])
+    await cursor.execute(statement, skip_parsing=True)
+    assert queries == [
+        "select * from t where a = 1",
+        "select * from t where a = 'a'",
+        "select * from t where a = NULL",
+        "select * from t where a = ?",
+    ], "Invalid prepared statement queries"
+
+
+async def test_cursor_executemany_concurrency(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    insert_query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """Concurrent executemany keeps results in order and collects errors."""
+
+    def failing_query_callback(request: Request, **kwargs) -> Response:
+        query = request.read().decode()
+        if query.endswith("(2)"):
+            return Response(status_code=codes.INTERNAL_SERVER_ERROR, content="failed")
+        if query.startswith("select"):
+            return query_callback(request, **kwargs)
+        return insert_query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(failing_query_callback, url=query_url)
+
+    query = "select * from t where a = ?"
+    assert await cursor.executemany(query, [[1], [3]], concurrency=2) == len(
+        python_query_data
+    )
+    assert await cursor.fetchall() == python_query_data
+    assert await cursor.nextset()
+    assert await cursor.fetchall() == python_query_data
+    assert await cursor.nextset() is None
+
+    with raises(ExecuteManyError) as exc_info:
+        await cursor.executemany(
+            "insert into t values (?)", [[1], [2], [3]], concurrency=2
+        )
+    errors = exc_info.value.errors
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], OperationalError), "Invalid statement error"
+
+    with raises(DataError):
+        await cursor.executemany(query, [[1, 2], [3]], concurrency=2)
+    assert cursor._state == CursorState.ERROR, "Invalid cursor state"
+
+    with raises(ProgrammingError):
+        await cursor.executemany(query, [[1], [3]], concurrency=0)
+    with raises(NotSupportedError):
+        await cursor.executemany(query, [[1], [3]], async_execution=True, concurrency=2)
+
+
+async def test_cursor_insert_rows(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    insert_query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+):
+    """insert_rows packs rows into multi-row INSERT statements."""
+    statements = []
+
+    def recording_insert_callback(request: Request, **kwargs) -> Response:
+        statements.append(request.read().decode())
+        return insert_query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(recording_insert_callback, url=query_url)
+
+    rows = ([i, f"name {i}"] for i in range(5))
+    assert await cursor.insert_rows("t", rows, ["id", "name"], max_batch_rows=2) == 5
+    assert statements == [
+        "INSERT INTO t (id, name) VALUES (0, 'name 0'),(1, 'name 1')",
+        "INSERT INTO t (id, name) VALUES (2, 'name 2'),(3, 'name 3')",
+        "INSERT INTO t (id, name) VALUES (4, 'name 4')",
+    ], "Invalid insert statements"
+    assert cursor.rowcount == -1
+
+
 async def test_cursor_multi_statement(
     httpx_mock: HTTPXMock,
     auth_callback: Callable,
@@ -634,6 +947,71 @@ async def test_cursor_set_statements(
     assert len(cursor._set_parameters) == 0
 
 
+async def test_cursor_set_statements_validated_once(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+    connection: Connection,
+):
+    """Validated set statements are not validated again by any connection cursor."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(select_one_query_callback, url=f"{set_query_url}&a=b")
+
+    for cursor in (connection.cursor(), connection.cursor()):
+        assert await cursor.execute("set a = b") == -1
+        assert cursor._set_parameters == {"a": "b"}
+
+    assert len(httpx_mock.get_requests(url=f"{set_query_url}&a=b")) == 1
+
+
+async def test_cursor_set_statements_batch(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+    cursor: Cursor,
+):
+    """Consecutive set statements are validated in a single request."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(
+        select_one_query_callback, url=f"{set_query_url}&a=b&c=d&e=f"
+    )
+
+    await cursor.execute("set a = b; set c = d; set e = f")
+    assert cursor._set_parameters == {"a": "b", "c": "d", "e": "f"}
+    assert len(cursor._row_sets) == 3
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_cursor_set_statements_batch_error(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    select_one_query_callback: Callable,
+    set_query_url: str,
+    cursor: Cursor,
+):
+    """If a batch of set statements fails, they are validated one by one."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(
+        lambda *args, **kwargs: Response(
+            status_code=codes.BAD_REQUEST, text="invalid parameter c"
+        ),
+        url=f"{set_query_url}&a=b&c=d",
+    )
+    httpx_mock.add_callback(select_one_query_callback, url=f"{set_query_url}&a=b")
+
+    with raises(OperationalError) as excinfo:
+        await cursor.execute("set a = b; set c = d")
+
+    assert str(excinfo.value) == "invalid parameter c"
+    assert cursor._set_parameters == {"a": "b"}
+    assert cursor.connection._validated_set_parameters == {("a", "b")}
+
+
 async def test_cursor_set_parameters_sent(
     httpx_mock: HTTPXMock,
     auth_callback: Callable,
@@ -816,3 +1194,168 @@ async def test_cursor_server_side_async_get_status_error(
             str(excinfo.value)
             == f"Asynchronous query {server_side_async_id} status check failed."
         ), f"Invalid get_status error message."
+
+
+async def test_streaming_cursor_fetch(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    streaming_query_callback: Callable,
+    streaming_query_url: str,
+    connection: Connection,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """Streaming cursor parses rows as they are fetched."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(streaming_query_callback, url=streaming_query_url)
+
+    async with connection.streaming_cursor() as cursor:
+        assert await cursor.execute("select * from t") == -1
+        assert cursor.description == python_query_description
+        assert cursor.statistics is None
+
+        assert await cursor.fetchone() == python_query_data[0]
+        assert await cursor.fetchmany(2) == python_query_data[1:3]
+        assert [r async for r in cursor] == python_query_data[3:]
+        assert await cursor.fetchone() is None
+        assert await cursor.fetchall() == []
+        assert cursor.rowcount == len(python_query_data)
+        assert cursor._response is None, "Stream wasn't closed after reading"
+        assert cursor.bytes_received == cursor.bytes_decoded > 0
+
+        await cursor.execute("select * from t")
+        assert await cursor.fetch_columns() == [
+            list(c) for c in zip(*python_query_data)
+        ], "Invalid columns returned by fetch_columns"
+
+        if find_spec("pyarrow"):
+            await cursor.execute("select * from t")
+            batches = [b async for b in cursor.iter_arrow_batches(3)]
+            assert [b.num_rows for b in batches] == [3, 3, 3, 1]
+
+        if find_spec("pandas"):
+            await cursor.execute("select * from t")
+            frames = [f async for f in cursor.iter_dataframes(4)]
+            assert [len(f) for f in frames] == [4, 4, 2]
+            await cursor.execute("select * from t")
+            assert len(await cursor.fetch_dataframe()) == len(python_query_data)
+
+    assert cursor.closed
+
+
+async def test_streaming_cursor_connection_close(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    streaming_query_callback: Callable,
+    streaming_query_url: str,
+    connection: Connection,
+):
+    """Closing a connection closes result streams of its streaming cursors."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(streaming_query_callback, url=streaming_query_url)
+
+    cursor = connection.streaming_cursor()
+    await cursor.execute("select * from t")
+    await cursor.fetchone()
+    assert cursor._response is not None
+
+    await connection.aclose()
+    assert cursor.closed
+    assert cursor._response is None, "Result stream wasn't closed"
+
+
+async def test_streaming_cursor_result_cache(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    streaming_query_url: str,
+    connection: Connection,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """Statements of streaming cursor invalidate the result cache."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+    connection.result_cache = ResultCache()
+
+    await cursor.execute("select * from t")
+    assert connection.result_cache.stats.entries == 1
+
+    # Empty response is returned for insert query
+    httpx_mock.add_response(content="", url=streaming_query_url)
+    async with connection.streaming_cursor() as streaming_cursor:
+        await streaming_cursor.execute("insert into t values (1)")
+    assert connection.result_cache.stats.entries == 0, "Stale result is cached"
+
+    await cursor.execute("select * from t")
+    assert await cursor.fetchall() == python_query_data
+    assert connection.result_cache.stats.hits == 0
+
+
+async def test_streaming_cursor_tsv_output_format(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    tsv_query_callback: Callable,
+    tsv_query_url: str,
+    connection: Connection,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """Streaming cursor reads results in tab separated format."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(tsv_query_callback, url=tsv_query_url)
+
+    async with connection.streaming_cursor() as cursor:
+        cursor.output_format = TSV_OUTPUT_FORMAT
+        await cursor.execute("select * from t")
+        assert cursor.description == python_query_description
+        assert await cursor.fetchmany(3) == python_query_data[:3]
+        assert await cursor.fetchall() == python_query_data[3:]
+        assert cursor.rowcount == len(python_query_data)
+
+
+async def test_streaming_cursor_errors(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    streaming_query_url: str,
+    connection: Connection,
+):
+    """Streaming cursor handles errors and unsupported queries."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    cursor = connection.streaming_cursor()
+
+    with raises(NotSupportedError):
+        await cursor.execute("select 1; select 2")
+    assert cursor._state == CursorState.ERROR
+
+    with raises(NotSupportedError):
+        await cursor.execute("select 1", async_execution=True)
+
+    httpx_mock.add_response(
+        status_code=codes.INTERNAL_SERVER_ERROR,
+        content="Query error message",
+        url=streaming_query_url,
+    )
+    with raises(OperationalError) as excinfo:
+        await cursor.execute("select 1")
+    assert str(excinfo.value) == "Error executing query:\nQuery error message"
+    assert cursor._response is None
+
+    # Empty response is returned for insert query
+    httpx_mock.add_response(content="", url=streaming_query_url)
+    await cursor.execute("insert into t values (1)")
+    assert cursor.description is None
+    with raises(DataError):
+        await cursor.fetchone()
+
+    httpx_mock.add_response(content='["a"]\n["Int8"]\n[1\n', url=streaming_query_url)
+    await cursor.execute("select 1")
+    with raises(DataError):
+        await cursor.fetchall()
+    await cursor.aclose()
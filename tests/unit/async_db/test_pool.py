@@ -0,0 +1,149 @@
+from typing import Any, Callable, Dict
+
+from anyio import create_task_group, sleep
+from httpx import Response, codes
+from pytest import fixture, raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.async_db.pool import ConnectionPool
+from firebolt.client.auth import Token
+from firebolt.common.settings import Settings
+from firebolt.utils.exception import (
+    ConnectionClosedError,
+    InterfaceError,
+    PoolTimeoutError,
+)
+
+
+@fixture
+def connect_kwargs(settings: Settings, db_name: str, access_token: str) -> Dict:
+    return dict(
+        auth=Token(access_token),
+        database=db_name,
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+    )
+
+
+async def test_pool_reuses_connections(
+    httpx_mock: HTTPXMock,
+    query_callback: Callable,
+    query_url: str,
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """Released connections are handed out again, their cursors are closed."""
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    async with ConnectionPool(**connect_kwargs) as pool:
+        async with pool.connection() as connection:
+            cursor = connection.cursor()
+            await cursor.execute("select*")
+            assert pool.stats.in_use == 1
+        assert cursor.closed, "Cursor wasn't closed on release"
+        assert pool.stats.idle == 1
+
+        async with pool.connection() as connection2:
+            assert connection2 is connection, "Connection wasn't reused"
+
+        stats = pool.stats
+        assert (stats.in_use, stats.idle) == (0, 1)
+        assert (stats.acquisitions, stats.creations, stats.evictions) == (2, 1, 0)
+
+    assert connection.closed, "Idle connection wasn't closed with pool"
+
+
+async def test_pool_min_size(connect_kwargs: Dict[str, Any]) -> None:
+    """open() creates min_size connections, which aren't evicted when idle."""
+    pool = ConnectionPool(min_size=2, max_idle_time=0, **connect_kwargs)
+    await pool.open()
+    assert pool.stats.idle == 2
+    connection = await pool.acquire()
+    await pool.release(connection)
+    assert pool.stats.idle == 2
+    assert pool.stats.creations == 2
+    await pool.aclose()
+
+
+async def test_pool_eviction(connect_kwargs: Dict[str, Any]) -> None:
+    """Expired and idle connections are closed and replaced."""
+    async with ConnectionPool(max_lifetime=0, **connect_kwargs) as pool:
+        connection = await pool.acquire()
+        await pool.release(connection)
+        assert connection.closed, "Expired connection wasn't closed"
+        assert pool.stats.idle == 0
+
+    async with ConnectionPool(max_idle_time=0, **connect_kwargs) as pool:
+        connection = await pool.acquire()
+        await pool.release(connection)
+        assert pool.stats.idle == 1
+        connection2 = await pool.acquire()
+        assert connection.closed, "Idle connection wasn't closed"
+        assert connection2 is not connection
+        await pool.release(connection2)
+        assert pool.stats.evictions == 1
+
+
+async def test_pool_liveness_check(
+    httpx_mock: HTTPXMock,
+    set_query_url: str,
+    select_one_query_callback: Callable,
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """Connections, that were idle for a while, are checked before handed out."""
+    httpx_mock.add_callback(select_one_query_callback, url=set_query_url)
+
+    async with ConnectionPool(check_idle_time=0, **connect_kwargs) as pool:
+        async with pool.connection() as connection:
+            pass
+        async with pool.connection() as connection2:
+            assert connection2 is connection
+        assert len(httpx_mock.get_requests(url=set_query_url)) == 1
+
+        httpx_mock.reset(True)
+        httpx_mock.add_response(
+            status_code=codes.INTERNAL_SERVER_ERROR, url=set_query_url
+        )
+        async with pool.connection() as connection3:
+            assert connection3 is not connection, "Dead connection was reused"
+        assert connection.closed
+        assert pool.stats.evictions == 1
+
+
+async def test_pool_timeout(connect_kwargs: Dict[str, Any]) -> None:
+    """Callers wait for a connection if all of them are in use."""
+    async with ConnectionPool(max_size=1, timeout=0.1, **connect_kwargs) as pool:
+        connection = await pool.acquire()
+        with raises(PoolTimeoutError):
+            await pool.acquire()
+
+        async def release_later() -> None:
+            await sleep(0.05)
+            await pool.release(connection)
+
+        async with create_task_group() as task_group:
+            task_group.start_soon(release_later)
+            assert await pool.acquire() is connection
+        assert pool.stats.wait_time > 0.05
+        await pool.release(connection)
+
+
+async def test_pool_closed(connect_kwargs: Dict[str, Any]) -> None:
+    """Connections in use are closed on release after pool is closed."""
+    pool = ConnectionPool(**connect_kwargs)
+    connection = await pool.acquire()
+    await pool.aclose()
+    assert not connection.closed
+    await pool.release(connection)
+    assert connection.closed
+
+    with raises(ConnectionClosedError):
+        await pool.acquire()
+    with raises(InterfaceError):
+        await pool.release(connection)
+
+
+def test_pool_invalid_size() -> None:
+    """Pool size is validated."""
+    for min_size, max_size in ((0, 0), (2, 1), (-1, 1)):
+        with raises(ValueError):
+            ConnectionPool(min_size=min_size, max_size=max_size)
@@ -7,10 +7,14 @@ from sqlparse import parse
 from sqlparse.sql import Statement
 
 from firebolt.async_db import DataError, InterfaceError, NotSupportedError
+from firebolt.async_db._sql import SQLStatement, split_sql
 from firebolt.async_db._types import (
+    PreparedStatement,
     SetParameter,
+    format_insert_batches,
     format_statement,
     format_value,
+    prepare_statement,
     split_format_sql,
     statement_to_set,
 )
@@ -112,6 +116,35 @@ def test_format_statement_errors() -> None:
     ), "Invalid not enought parameters error"
 
 
+def test_format_insert_batches() -> None:
+    rows = [(1, "a"), (2, None), (3, "it's")]
+    assert list(format_insert_batches("t", ["id", "name"], rows, None, 1000)) == [
+        ("INSERT INTO t (id, name) VALUES (1, 'a'),(2, NULL),(3, 'it\\'s')", 3)
+    ], "Invalid insert statement"
+
+    assert list(format_insert_batches("t", None, rows, 2, 1000)) == [
+        ("INSERT INTO t VALUES (1, 'a'),(2, NULL)", 2),
+        ("INSERT INTO t VALUES (3, 'it\\'s')", 1),
+    ], "Invalid batches by row count"
+
+    # Statement prefix takes 21 bytes, each row 9-13 bytes with a separator
+    batches = list(format_insert_batches("t", None, rows, None, 40))
+    assert [count for _, count in batches] == [2, 1], "Invalid batches by size"
+    assert all(len(statement) <= 40 for statement, _ in batches)
+    # Statement of a single row can exceed the limit
+    assert [count for _, count in format_insert_batches("t", None, rows, None, 1)] == [
+        1,
+        1,
+        1,
+    ]
+
+    assert list(format_insert_batches("t", None, [], None, 1000)) == []
+    with raises(DataError):
+        list(format_insert_batches("t", None, [(1,), (1, 2)], None, 1000))
+    with raises(DataError):
+        list(format_insert_batches("t", ["a", "b"], [(1,)], None, 1000))
+
+
 @mark.parametrize(
     "query,params,result",
     [
@@ -163,6 +196,109 @@ def test_split_format_error() -> None:
         split_format_sql("set a = ?", ((1,),))
 
 
+@mark.parametrize(
+    "query,result",
+    [
+        ("", []),
+        ("select 1;;", [SQLStatement("select 1", ["select 1;"], None)]),
+        (
+            "select ';?', \"?;\", `;?` /* ; ? */ -- ;?\n; ?",
+            [
+                SQLStatement(
+                    "select ';?', \"?;\", `;?` /* ; ? */ -- ;?\n",
+                    ["select ';?', \"?;\", `;?` /* ; ? */ -- ;?\n;"],
+                    None,
+                ),
+                SQLStatement("?", [" ", ""], None),
+            ],
+        ),
+        (
+            "select 'it''s', 'a\\'?', ?; -- comment",
+            [
+                SQLStatement(
+                    "select 'it''s', 'a\\'?', ?",
+                    ["select 'it''s', 'a\\'?', ", ";"],
+                    None,
+                )
+            ],
+        ),
+        (
+            "/* c */ SET a = 'b;c' -- c\n;settings",
+            [
+                SQLStatement(
+                    "/* c */ SET a = 'b;c' -- c\n",
+                    ["/* c */ SET a = 'b;c' -- c\n;"],
+                    ("a", "'b;c'"),
+                ),
+                SQLStatement("settings", ["settings"], None),
+            ],
+        ),
+        ("select 'unterminated", None),
+        ("select /* unterminated", None),
+        ("select $$a;b$$", None),
+        ("select :x", None),
+        ("select %s, %(x)s", None),
+        ("select $1", None),
+        (
+            "select a::int, ':x', '%s'",
+            [
+                SQLStatement(
+                    "select a::int, ':x', '%s'", ["select a::int, ':x', '%s'"], None
+                )
+            ],
+        ),
+    ],
+)
+def test_split_sql(query: str, result: Optional[List[SQLStatement]]) -> None:
+    assert split_sql(query) == result, "Invalid split sql result"
+
+
+def test_split_sql_errors() -> None:
+    for query in ("set a", "set a =", "set = b"):
+        with raises(InterfaceError):
+            split_sql(query)
+
+
+def test_prepared_statement() -> None:
+    query = "select * from t where id == ? and name == ?;"
+    statement = prepare_statement(query)
+    assert prepare_statement(query) is statement, "Prepared statement wasn't cached"
+    assert split_format_sql(statement, ((1, "a"), (2, None))) == [
+        "select * from t where id == 1 and name == 'a'",
+        "select * from t where id == 2 and name == NULL",
+    ], "Invalid prepared statement format result"
+    assert PreparedStatement(query).format(()) == [
+        "select * from t where id == ? and name == ?"
+    ], "Invalid prepared statement format result"
+
+    with raises(DataError) as exc_info:
+        statement.format(((1,),))
+    assert (
+        str(exc_info.value)
+        == "not enough parameters provided for substitution: given 1, found one more"
+    ), "Invalid not enough parameters error"
+    with raises(DataError) as exc_info:
+        statement.format(((1, 2, 3),))
+    assert (
+        str(exc_info.value)
+        == "too many parameters provided for substitution: given 3, used only 2"
+    ), "Invalid too many parameters error"
+
+    # Dollar-quoted strings are handled by sqlparse
+    assert PreparedStatement("select $$a;?$$, ?").format(((1,),)) == [
+        "select $$a;?$$, 1"
+    ], "Invalid fallback format result"
+    # Named and positional placeholders are substituted by sqlparse
+    for placeholder in (":x", "%s", "$1"):
+        assert split_format_sql(f"select * from t where a = {placeholder}", [[1]]) == [
+            "select * from t where a = 1"
+        ], "Invalid placeholder format result"
+
+    # Long queries are not cached
+    long_query = "select '" + "a" * 10000 + "', ?"
+    assert prepare_statement(long_query) is not prepare_statement(long_query)
+
+
 @mark.parametrize(
     "statement,result",
     [
@@ -2,7 +2,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict
 
-from pytest import raises
+from pytest import importorskip, raises
 
 from firebolt.async_db import (
     ARRAY,
@@ -11,7 +11,13 @@ from firebolt.async_db import (
     TimeFromTicks,
     TimestampFromTicks,
 )
-from firebolt.async_db._types import parse_type, parse_value
+from firebolt.async_db._types import (
+    DATETIME64,
+    float_text_required,
+    parse_type,
+    parse_value,
+    row_parser,
+)
 from firebolt.utils.exception import DataError, NotSupportedError
 
 
@@ -172,6 +178,54 @@ def test_parse_arrays() -> None:
         ), f"Error parsing array({str(t)}): None provided"
 
 
+def test_row_parser() -> None:
+    """row_parser produces the same values as parse_value for each column."""
+    ctypes = [
+        int,
+        int,
+        float,
+        float,
+        str,
+        str,
+        date,
+        datetime,
+        DATETIME64(4),
+        DECIMAL(38, 3),
+        ARRAY(int),
+        ARRAY(ARRAY(date)),
+    ]
+    row = [
+        1,
+        "922337203685477580",
+        "1.5",
+        1,
+        "text",
+        None,
+        "2021-12-31",
+        "2021-12-31 23:59:59",
+        "2020-07-31 01:01:01.1234",
+        "123.456",
+        [1, "2", None],
+        [["2021-12-31"], None, [None]],
+    ]
+    parse_row = row_parser(ctypes)
+    assert parse_row(row) == [
+        parse_value(value, ctype) for value, ctype in zip(row, ctypes)
+    ], "Error parsing row"
+    assert parse_row([None] * len(ctypes)) == [None] * len(ctypes)
+    assert parse_row(row) is not row, "Row should be copied"
+
+    with raises(DataError) as exc_info:
+        parse_row(row[:-1])
+    assert str(exc_info.value) == "Invalid row length: expected 12 values, got 11"
+
+    with raises(DataError):
+        row_parser([bool])
+
+    with raises(DataError):
+        row_parser([date])([1])
+
+
 def test_helpers() -> None:
     """All provided helper functions work properly."""
     d = date(2021, 12, 31)
@@ -185,3 +239,146 @@ def test_helpers() -> None:
 
     with raises(NotSupportedError):
         TimeFromTicks(0)
+
+
+def test_to_numpy_array() -> None:
+    """to_numpy_array converts column values into typed and masked arrays."""
+    np = importorskip("numpy")
+    from firebolt.async_db._columnar import to_numpy_array
+
+    array = to_numpy_array([1, "2", None], int)
+    assert isinstance(array, np.ma.MaskedArray), "Nulls should be masked"
+    assert array.dtype == np.int64
+    assert array.tolist() == [1, 2, None]
+
+    array = to_numpy_array(["18446744073709551615", 1], int)
+    assert array.dtype == np.uint64, "Large unsigned values should fit"
+
+    array = to_numpy_array(["1.5", None], float)
+    assert array.dtype == np.float64
+    assert array.tolist() == [1.5, None]
+
+    array = to_numpy_array(["2021-12-31", None], date)
+    assert array.dtype == np.dtype("datetime64[D]")
+    assert array.tolist() == [date(2021, 12, 31), None]
+
+    array = to_numpy_array(["2020-07-31 01:01:01.123456789"], DATETIME64(9))
+    assert array.dtype == np.dtype("datetime64[ns]")
+
+    array = to_numpy_array([[1, 2], [3]], ARRAY(int))
+    assert array.dtype == object
+    assert array.tolist() == [[1, 2], [3]]
+
+
+def test_to_arrow_array() -> None:
+    """to_arrow_array converts column values into Arrow arrays."""
+    pa = importorskip("pyarrow")
+    from firebolt.async_db._columnar import to_arrow_array
+
+    for values, ctype, arrow_type, result in (
+        ([1, None], int, pa.int64(), [1, None]),
+        (["1", 2], int, pa.int64(), [1, 2]),
+        (["18446744073709551615"], int, pa.uint64(), [2**64 - 1]),
+        (["1.5", None], float, pa.float64(), [1.5, None]),
+        ([1, "1.5"], float, pa.float64(), [1.0, 1.5]),
+        (["a", None], str, pa.string(), ["a", None]),
+        (["2021-12-31"], date, pa.date32(), [date(2021, 12, 31)]),
+        (
+            ["2021-12-31 23:59:59"],
+            datetime,
+            pa.timestamp("us"),
+            [datetime(2021, 12, 31, 23, 59, 59)],
+        ),
+        (["1.5"], DECIMAL(38, 3), pa.decimal128(38, 3), [Decimal("1.500")]),
+        (["1.5"], DECIMAL(76, 3), pa.decimal256(76, 3), [Decimal("1.500")]),
+        ([[1, None], None], ARRAY(int), pa.list_(pa.int64()), [[1, None], None]),
+    ):
+        array = to_arrow_array(values, ctype)
+        assert array.type == arrow_type, f"Invalid Arrow type for {ctype}"
+        assert array.to_pylist() == result, f"Invalid Arrow values for {ctype}"
+
+
+def test_to_pandas_series() -> None:
+    """to_pandas_series converts column values into pandas Series."""
+    pd = importorskip("pandas")
+    from firebolt.async_db._columnar import to_pandas_series
+
+    for values, ctype, dtype, result in (
+        ([1, None], int, "Int64", [1, pd.NA]),
+        (["18446744073709551615"], int, "UInt64", [2**64 - 1]),
+        (["1.5", None], float, "float64", [1.5, None]),
+        (["a", None], str, "object", ["a", None]),
+        (
+            ["2021-12-31", None],
+            date,
+            "datetime64[ns]",
+            [pd.Timestamp(2021, 12, 31), pd.NaT],
+        ),
+        (["2299-01-01"], date, "object", [date(2299, 1, 1)]),
+        (["1.5"], DECIMAL(38, 3), "object", [Decimal("1.500")]),
+        ([[1, None], None], ARRAY(int), "object", [[1, None], None]),
+    ):
+        series = to_pandas_series(values, ctype)
+        assert series.dtype == dtype, f"Invalid dtype for {ctype}"
+        assert series.equals(
+            pd.Series(result, dtype=dtype)
+        ), f"Invalid values for {ctype}"
+
+
+def test_float_text_required() -> None:
+    """float_text_required detects types that are parsed from exact float text."""
+    for raw_type in ("Float64", "Nullable(Int32)", "Array(Float32)", "DateTime64(3)"):
+        assert not float_text_required(raw_type), f"Invalid result for {raw_type}"
+    for raw_type in ("Decimal(38, 3)", "Array(Nullable(Decimal(38, 3)))", "Unknown"):
+        assert float_text_required(raw_type), f"Invalid result for {raw_type}"
+
+
+def test_decode_query_data() -> None:
+    """decode_query_data keeps exact float text for decimal columns."""
+    orjson = importorskip("orjson")
+    from firebolt.async_db._json import decode_query_data
+
+    def content(raw_type: str) -> bytes:
+        return (
+            b'{"meta": [{"name": "c", "type": "%s"}], "data": [[0.1], [null]]}'
+            % raw_type.encode()
+        )
+
+    for decoder in (None, orjson.loads):
+        data = decode_query_data(content("Decimal(38, 30)"), decoder)["data"]
+        assert data == [["0.1"], [None]], "Invalid decimal data decoded"
+
+    assert decode_query_data(content("Float64"), orjson.loads)["data"] == [
+        [0.1],
+        [None],
+    ], "Invalid float data decoded"
+
+
+def test_tsv_rows_decoder() -> None:
+    """tsv_rows_decoder unescapes values and parses arrays."""
+    from firebolt.async_db._tsv import tsv_rows_decoder
+
+    decode_rows = tsv_rows_decoder(
+        [
+            "Nullable(Int32)",
+            "Nullable(String)",
+            "Array(Nullable(String))",
+            "Array(Array(Nullable(Int32)))",
+        ]
+    )
+    assert decode_rows(
+        [
+            "1\ta\t[]\t[[1,NULL],[]]",
+            "\\N\t\\N\t[]\t[]",
+            "1\ta\\tb\\\\c\\nd\t['a,b','c\\'d\\\\',NULL]\t[]",
+        ]
+    ) == [
+        ["1", "a", [], [["1", None], []]],
+        [None, None, [], []],
+        ["1", "a\tb\\c\nd", ["a,b", "c'd\\", None], []],
+    ], "Invalid rows decoded"
+    assert decode_rows([]) == [], "Invalid empty rows decoded"
+
+    for line in ("1\ta", "1\ta\t[\t[]", "1\ta\t['a]\t[]", "1\ta\t[1]2\t[]"):
+        with raises(DataError):
+            decode_rows([line])
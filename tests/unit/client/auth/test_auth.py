@@ -1,3 +1,4 @@
+from time import time
 from types import MethodType
 from unittest.mock import PropertyMock, patch
 
@@ -7,6 +8,7 @@ from pytest import mark
 from pytest_httpx import HTTPXMock
 
 from firebolt.client.auth import Auth
+from firebolt.utils.exception import AuthenticationError
 from firebolt.utils.token_storage import TokenSecureStorage
 from tests.unit.util import execute_generator_requests
 
@@ -127,3 +129,46 @@ def test_auth_token_storage(
         assert (
             st.get_cached_token() is None
         ), "Token cached even though caching is disabled"
+
+
+def test_auth_proactive_refresh(
+    httpx_mock: HTTPXMock, test_token: str, test_token2: str
+) -> None:
+    """Auth refreshes the token ahead of expiration and keeps the current one
+    if the refresh fails."""
+    url = "https://host"
+    httpx_mock.add_response(status_code=codes.OK, url=url)
+
+    def set_token(token: str) -> callable:
+        def inner(self):
+            self._token = token
+            self._expires = 2**32
+            yield from ()
+
+        return inner
+
+    def fail(self):
+        raise AuthenticationError("login failed")
+        yield from ()
+
+    auth = Auth(use_token_cache=False)
+    auth.get_new_token_generator = MethodType(set_token(test_token), auth)
+    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    assert auth.refresh_stats[:3] == (1, 0, 0)
+    assert auth._refresh_at > time(), "Refresh is scheduled too early"
+
+    # Token lifetime is mostly passed
+    auth._refresh_at = time() - 1
+    auth.get_new_token_generator = MethodType(set_token(test_token2), auth)
+    execute_generator_requests(auth.auth_flow(Request("GET", url)))
+    assert auth.token == test_token2, "Token was not refreshed."
+    assert auth.refresh_stats[:3] == (2, 1, 0)
+
+    auth._refresh_at = time() - 1
+    auth.get_new_token_generator = MethodType(fail, auth)
+    flow = auth.auth_flow(Request("GET", url))
+    request = next(flow)
+    assert request.headers["authorization"] == f"Bearer {test_token2}"
+    stats = auth.refresh_stats
+    assert stats[:3] == (2, 1, 1)
+    assert 0 <= stats.last_latency <= stats.total_latency
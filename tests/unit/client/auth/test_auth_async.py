@@ -1,12 +1,21 @@
 from types import MethodType
 from unittest.mock import PropertyMock, patch
 
-from httpx import Request, codes
+from anyio import (
+    create_task_group,
+    fail_after,
+    run,
+    to_thread,
+    wait_all_tasks_blocked,
+)
+from httpx import Request, Response, codes
 from pyfakefs.fake_filesystem_unittest import Patcher
 from pytest import mark
 from pytest_httpx import HTTPXMock
 
 from firebolt.client import Auth
+from firebolt.client.auth import UsernamePassword
+from firebolt.client.auth.base import AuthRequest
 from firebolt.utils.token_storage import TokenSecureStorage
 from tests.unit.util import async_execute_generator_requests
 
@@ -134,3 +143,100 @@ async def test_auth_token_storage(
         assert (
             st.get_cached_token() is None
         ), "Token cached even though caching is disabled"
+
+
+async def test_auth_single_refresh(test_token: str) -> None:
+    """Concurrent requests wait for a single token refresh."""
+    auth = UsernamePassword("user", "password", use_token_cache=False)
+    flow = auth.async_auth_flow(Request("GET", "https://host"))
+    auth_request = await flow.__anext__()
+    assert isinstance(auth_request, AuthRequest)
+
+    requests = []
+
+    async def send_request() -> None:
+        requests.append(
+            await auth.async_auth_flow(Request("GET", "https://host")).__anext__()
+        )
+
+    async with create_task_group() as task_group:
+        for _ in range(3):
+            task_group.start_soon(send_request)
+        await wait_all_tasks_blocked()
+        requests.append(
+            await flow.asend(
+                Response(
+                    codes.OK,
+                    json={"access_token": test_token, "expires_in": 3600},
+                    request=auth_request,
+                )
+            )
+        )
+
+    assert len(requests) == 4
+    for request in requests:
+        assert request.headers["authorization"] == f"Bearer {test_token}"
+    assert auth.refresh_stats.refreshes == 1
+
+
+async def test_auth_refresh_cancelled_leader() -> None:
+    """Requests, waiting for a refresh, retry it if its request is cancelled."""
+    auth = UsernamePassword("user", "password", use_token_cache=False)
+    flow = auth.async_auth_flow(Request("GET", "https://host"))
+    await flow.__anext__()
+
+    requests = []
+
+    async def send_request() -> None:
+        requests.append(
+            await auth.async_auth_flow(Request("GET", "https://host")).__anext__()
+        )
+
+    with fail_after(5):
+        async with create_task_group() as task_group:
+            task_group.start_soon(send_request)
+            await wait_all_tasks_blocked()
+            # Request, that refreshes the token, is cancelled
+            await flow.aclose()
+
+    assert len(requests) == 1
+    assert isinstance(requests[0], AuthRequest), "Refresh was not retried"
+    assert auth.refresh_stats.refreshes == 0
+
+
+def test_auth_refresh_many_waiters_trio(test_token: str) -> None:
+    """Requests, waiting for a refresh, don't hold worker threads."""
+    auth = UsernamePassword("user", "password", use_token_cache=False)
+    requests = []
+
+    async def send_request() -> None:
+        requests.append(
+            await auth.async_auth_flow(Request("GET", "https://host")).__anext__()
+        )
+
+    async def main() -> None:
+        flow = auth.async_auth_flow(Request("GET", "https://host"))
+        auth_request = await flow.__anext__()
+        with fail_after(5):
+            async with create_task_group() as task_group:
+                # More waiters than trio's default worker thread limit
+                for _ in range(60):
+                    task_group.start_soon(send_request)
+                await wait_all_tasks_blocked()
+                # Auth request needs a worker thread for DNS resolution
+                await to_thread.run_sync(lambda: None)
+                requests.append(
+                    await flow.asend(
+                        Response(
+                            codes.OK,
+                            json={"access_token": test_token, "expires_in": 3600},
+                            request=auth_request,
+                        )
+                    )
+                )
+
+    run(main, backend="trio")
+    assert len(requests) == 61
+    for request in requests:
+        assert request.headers["authorization"] == f"Bearer {test_token}"
+    assert auth.refresh_stats.refreshes == 1
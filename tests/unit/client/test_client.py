@@ -109,3 +109,13 @@ def test_client_account_id(
         api_endpoint=settings.server,
     ) as c:
         assert c.account_id == account_id, "Invalid account id returned"
+
+    with Client(
+        auth=UsernamePassword(test_username, test_password),
+        base_url=fix_url_schema(settings.server),
+        api_endpoint=settings.server,
+    ) as c:
+        assert c.account_id == account_id, "Invalid account id returned"
+    assert (
+        len(httpx_mock.get_requests(url=account_id_url)) == 1
+    ), "Account id wasn't shared between clients"
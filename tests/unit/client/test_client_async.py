@@ -1,6 +1,7 @@
 from re import Pattern
 from typing import Callable
 
+from anyio import create_task_group
 from httpx import codes
 from pytest import raises
 from pytest_httpx import HTTPXMock
@@ -8,6 +9,7 @@ from pytest_httpx import HTTPXMock
 from firebolt.client import DEFAULT_API_URL, AsyncClient
 from firebolt.client.auth import Token, UsernamePassword
 from firebolt.common import Settings
+from firebolt.utils.account_id_cache import account_id_cache
 from firebolt.utils.urls import AUTH_URL
 from firebolt.utils.util import fix_url_schema
 
@@ -117,3 +119,27 @@ async def test_client_account_id(
         api_endpoint=settings.server,
     ) as c:
         assert await c.account_id == account_id, "Invalid account id returned."
+        assert await c.account_id == account_id, "Account id can't be reused."
+
+    # Account id is shared between clients, concurrent lookups are combined
+    account_id_cache.clear()
+    clients = [
+        AsyncClient(
+            auth=UsernamePassword(test_username, test_password),
+            base_url=fix_url_schema(settings.server),
+            api_endpoint=settings.server,
+        )
+        for _ in range(3)
+    ]
+    account_ids = []
+
+    async def get_account_id(client: AsyncClient) -> None:
+        account_ids.append(await client.account_id)
+
+    async with create_task_group() as task_group:
+        for client in clients:
+            task_group.start_soon(get_account_id, client)
+    assert account_ids == [account_id] * 3
+    assert len(httpx_mock.get_requests(url=account_id_url)) == 2
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,55 @@
+from httpx import AsyncClient as HttpxAsyncClient
+from httpx import Client as HttpxClient
+from httpx import DecodingError
+from pytest import importorskip, raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.client import AsyncClient, Client
+from firebolt.client.compression import ZStandardDecoder, get_compression
+from firebolt.utils.exception import ConfigurationError
+
+
+def test_get_compression():
+    """get_compression validates compression and picks the best supported one."""
+    assert get_compression(None) is None
+    assert get_compression(False) is None
+    assert get_compression("gzip") == "gzip"
+    assert get_compression(True) in ("zstd", "br", "gzip")
+
+    with raises(ConfigurationError):
+        get_compression("lz4")
+
+
+def test_zstd_decoder():
+    """ZStandardDecoder decodes multi-frame responses by chunks."""
+    zstandard = importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor()
+    data = compressor.compress(b"a" * 1000) + compressor.compress(b"b" * 1000)
+
+    decoder = ZStandardDecoder()
+    decoded = b"".join(decoder.decode(data[i : i + 7]) for i in range(0, len(data), 7))
+    assert decoded + decoder.flush() == b"a" * 1000 + b"b" * 1000
+    assert get_compression("zstd") == "zstd"
+
+    decoder = ZStandardDecoder()
+    decoder.decode(data[:10])
+    with raises(DecodingError):
+        decoder.flush()
+
+
+async def test_zstd_response_decoding(httpx_mock: HTTPXMock):
+    """Only firebolt clients decode zstd responses, other httpx clients
+    are unaffected."""
+    zstandard = importorskip("zstandard")
+    data = zstandard.ZstdCompressor().compress(b"data")
+    for _ in range(4):
+        httpx_mock.add_response(content=data, headers={"Content-Encoding": "zstd"})
+
+    with Client() as client:
+        assert client.get("https://url").content == b"data"
+    async with AsyncClient() as client:
+        assert (await client.get("https://url")).content == b"data"
+    with HttpxClient() as client:
+        assert client.get("https://url").content == data
+    async with HttpxAsyncClient() as client:
+        assert (await client.get("https://url")).content == data
@@ -1,9 +1,11 @@
+import gc
 from asyncio import run
-from threading import Thread
+from threading import Thread, current_thread
 
+import trio
 from pytest import raises
 
-from firebolt.utils.util import async_to_sync
+from firebolt.utils.util import _event_loop, async_to_sync, gc_disabled
 
 
 def test_async_to_sync_happy_path():
@@ -66,3 +68,46 @@ async def test_nested_loops() -> None:
 
     with raises(JobMarker):
         async_to_sync(task)()
+
+
+def test_async_to_sync_event_loop():
+    """async_to_sync runs all functions on the same loop in a background thread."""
+
+    async def task():
+        return current_thread(), trio.lowlevel.current_trio_token()
+
+    thread, token = async_to_sync(task)()
+    assert thread is not current_thread()
+    assert async_to_sync(task)() == (thread, token), "Event loop wasn't reused"
+
+    result = []
+    t = Thread(target=lambda: result.append(async_to_sync(task)()))
+    t.start()
+    t.join()
+    assert result == [(thread, token)], "Event loop wasn't shared between threads"
+
+    _event_loop.stop()
+    assert not thread.is_alive()
+    thread2, token2 = async_to_sync(task)()
+    assert thread2 is not thread and token2 is not token, "Loop wasn't restarted"
+
+
+def test_gc_disabled_overlapping():
+    """gc_disabled keeps garbage collection disabled until the last of
+    overlapping contexts, e.g. of different threads, exits."""
+    assert gc.isenabled()
+    first, second = gc_disabled(), gc_disabled()
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert not gc.isenabled(), "Garbage collection enabled by the first context"
+    second.__exit__(None, None, None)
+    assert gc.isenabled(), "Garbage collection state not restored"
+
+    gc.disable()
+    try:
+        with gc_disabled():
+            pass
+        assert not gc.isenabled(), "Disabled garbage collection enabled"
+    finally:
+        gc.enable()
@@ -12,6 +12,8 @@ from firebolt.client.auth import Auth, UsernamePassword
 from firebolt.common.settings import Settings
 from firebolt.model.provider import Provider
 from firebolt.model.region import Region, RegionKey
+from firebolt.utils.account_id_cache import account_id_cache
+from firebolt.utils.engine_url_cache import default_engine_url_cache
 from firebolt.utils.exception import (
     AccountNotFoundError,
     DatabaseError,
@@ -52,6 +54,13 @@ def global_fake_fs(request) -> None:
             yield
 
 
+@fixture(autouse=True)
+def clear_caches() -> None:
+    yield
+    default_engine_url_cache.clear()
+    account_id_cache.clear()
+
+
 @fixture
 def username() -> str:
     return "email@domain.com"
@@ -1,15 +1,17 @@
 import gc
 import warnings
 from re import Pattern
-from typing import Callable, List
+from typing import Any, Callable, List
 
 from httpx import codes
 from pyfakefs.fake_filesystem_unittest import Patcher
-from pytest import mark, raises, warns
+from pytest import MonkeyPatch, mark, raises, warns
 from pytest_httpx import HTTPXMock
 
 from firebolt.async_db._types import ColType
+from firebolt.client import Client
 from firebolt.client.auth import Auth, Token, UsernamePassword
+from firebolt.client.transport import SharedTransport, transport_registry
 from firebolt.common.settings import Settings
 from firebolt.db import Connection, connect
 from firebolt.utils.exception import (
@@ -20,6 +22,7 @@ from firebolt.utils.exception import (
 )
 from firebolt.utils.token_storage import TokenSecureStorage
 from firebolt.utils.urls import ACCOUNT_ENGINE_ID_BY_NAME_URL
+from firebolt.utils.util import _event_loop
 
 
 def test_closed_connection(connection: Connection) -> None:
@@ -262,6 +265,76 @@ def test_connection_no_warnings():
         gc.collect()
 
 
+def test_connection_native_sync_client(
+    connection: Connection,
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    python_query_data: List[List[ColType]],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Queries are executed with a blocking client, without an event loop."""
+
+    def no_event_loop(*args: Any, **kwargs: Any) -> None:
+        assert False, "Event loop shouldn't be used to execute queries"
+
+    monkeypatch.setattr(_event_loop, "run", no_event_loop)
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    assert isinstance(connection._client, Client)
+    cursor = connection.cursor()
+    assert cursor.execute("select*") == len(python_query_data)
+    assert cursor.fetchall() == python_query_data
+    connection.close()
+
+
+def test_connect_lazy(
+    settings: Settings,
+    db_name: str,
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    python_query_data: List[List[ColType]],
+) -> None:
+    """Lazy connection doesn't send requests until the first query."""
+    with connect(
+        database=db_name,
+        auth=UsernamePassword("u", "p"),
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+        lazy=True,
+    ) as connection:
+        assert not httpx_mock.get_requests(), "Lazy connection sent requests"
+        assert connection.engine_url == ""
+
+        httpx_mock.add_callback(auth_callback, url=auth_url)
+        httpx_mock.add_callback(query_callback, url=query_url)
+        assert connection.cursor().execute("select*") == len(python_query_data)
+        assert connection.engine_url == f"https://{settings.server}"
+
+
+def test_connection_shared_transport(settings: Settings, db_name: str) -> None:
+    """Connections to the same engine share a transport, which is closed
+    with the last one."""
+    kwargs = dict(
+        engine_url=settings.server,
+        database=db_name,
+        auth=Token("token"),
+        api_endpoint=settings.server,
+    )
+    with connect(**kwargs) as connection1, connect(**kwargs) as connection2:
+        transport = connection1._client._transport
+        assert isinstance(transport, SharedTransport)
+        assert transport.transport is connection2._client._transport.transport
+        assert transport_registry.references(transport.key) == 2
+    assert transport_registry.references(transport.key) == 0
+
+
 def test_connection_commit(connection: Connection):
     # nothing happens
     connection.commit()
@@ -1,16 +1,25 @@
 from typing import Callable, Dict, List
 from unittest.mock import patch
 
-from httpx import HTTPStatusError, StreamError, codes
-from pytest import raises
+from httpx import HTTPStatusError, Request, Response, StreamError, codes
+from pytest import importorskip, raises
 from pytest_httpx import HTTPXMock
 
-from firebolt.async_db.cursor import ColType, Column, CursorState, QueryStatus
+from firebolt.async_db.cursor import (
+    TSV_OUTPUT_FORMAT,
+    ColType,
+    Column,
+    CursorState,
+    QueryStatus,
+)
 from firebolt.db import Cursor
 from firebolt.utils.exception import (
     CursorClosedError,
     DataError,
+    ExecuteManyError,
+    NotSupportedError,
     OperationalError,
+    ProgrammingError,
     QueryNotRunError,
 )
 from tests.unit.db_conftest import encode_param
@@ -380,6 +389,222 @@ def test_cursor_fetchall(
         cursor.fetchall()
 
 
+def test_cursor_fetch_columns(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_columns fetches all remaining rows grouped by column."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    cursor.execute("sql")
+    cursor.fetchone()
+    columns = cursor.fetch_columns()
+    assert len(columns) == len(cursor.description), "Invalid columns count"
+    assert columns == [
+        list(c) for c in zip(*python_query_data[1:])
+    ], "Invalid columns returned by fetch_columns"
+    assert cursor.fetch_columns() == [[]] * len(cursor.description)
+
+
+def test_cursor_fetch_numpy(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_numpy converts columns into typed numpy arrays."""
+    np = importorskip("numpy")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    cursor.execute("sql")
+    arrays = cursor.fetch_numpy()
+    expected = list(zip(*python_query_data))
+    for i, dtype in (
+        (0, "int64"),
+        (7, "float64"),
+        (9, "datetime64[D]"),
+        (11, "datetime64[us]"),
+        (12, "datetime64[us]"),
+        (14, "object"),
+        (15, "object"),
+    ):
+        assert arrays[i].dtype == np.dtype(dtype), f"Invalid dtype for column {i}"
+        assert arrays[i].tolist() == list(expected[i]), f"Invalid column {i} values"
+    assert not any(isinstance(a, np.ma.MaskedArray) for a in arrays)
+
+
+def test_cursor_fetch_arrow(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_arrow_table and iter_arrow_batches convert rows to Arrow."""
+    pa = importorskip("pyarrow")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    cursor.execute("sql")
+    table = cursor.fetch_arrow_table()
+    assert table.num_rows == len(python_query_data)
+    assert table.column_names == [c.name for c in python_query_description]
+    assert table.schema.field("int64").type == pa.int64()
+    assert table.schema.field("float64").type == pa.float64()
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("datetime64").type == pa.timestamp("us")
+    assert table.schema.field("array").type == pa.list_(pa.int64())
+    assert [list(r.values()) for r in table.to_pylist()] == python_query_data
+
+    cursor.execute("sql")
+    batches = [b for b in cursor.iter_arrow_batches(4)]
+    assert [b.num_rows for b in batches] == [4, 4, 2], "Invalid batches size"
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+def test_cursor_fetch_dataframe(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """cursor fetch_dataframe and iter_dataframes convert rows to DataFrames."""
+    pd = importorskip("pandas")
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    cursor.execute("sql")
+    frame = cursor.fetch_dataframe()
+    assert frame.shape == (len(python_query_data), len(python_query_description))
+    assert list(frame.columns) == [c.name for c in python_query_description]
+    assert frame["int64"].dtype == "Int64"
+    assert frame["float64"].dtype == "float64"
+    assert frame["date"].dtype == "datetime64[ns]"
+    assert frame["string"].dtype == object
+    columns = list(zip(*python_query_data))
+    assert frame["uint8"].tolist() == list(columns[0])
+    assert frame["date"].dt.date.tolist() == list(columns[9])
+    assert frame["array"].tolist() == list(columns[14])
+
+    cursor.execute("sql")
+    frames = [f for f in cursor.iter_dataframes(4)]
+    assert [len(f) for f in frames] == [4, 4, 2], "Invalid chunks size"
+    assert pd.concat(frames, ignore_index=True).equals(frame)
+
+
+def test_cursor_tsv_output_format(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    tsv_query_callback: Callable,
+    tsv_query_url: str,
+    cursor: Cursor,
+    python_query_description: List[Column],
+    python_query_data: List[List[ColType]],
+):
+    """Cursor requests and parses results in tab separated format."""
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(tsv_query_callback, url=tsv_query_url)
+
+    with raises(ValueError):
+        cursor.output_format = "CSV"
+
+    cursor.output_format = TSV_OUTPUT_FORMAT
+    assert cursor.execute("select * from t") == len(python_query_data)
+    assert cursor.description == python_query_description
+    assert cursor.statistics is None
+    assert cursor.fetchall() == python_query_data
+
+
+def test_cursor_executemany_concurrency(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    query_callback: Callable,
+    insert_query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+    python_query_data: List[List[ColType]],
+):
+    """Concurrent executemany keeps results in order and collects errors."""
+
+    def failing_query_callback(request: Request, **kwargs) -> Response:
+        query = request.read().decode()
+        if query.endswith("(2)"):
+            return Response(status_code=codes.INTERNAL_SERVER_ERROR, content="failed")
+        if query.startswith("select"):
+            return query_callback(request, **kwargs)
+        return insert_query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(failing_query_callback, url=query_url)
+
+    query = "select * from t where a = ?"
+    assert cursor.executemany(query, [[1], [3]], concurrency=2) == len(
+        python_query_data
+    )
+    assert cursor.fetchall() == python_query_data
+    assert cursor.nextset()
+    assert cursor.fetchall() == python_query_data
+    assert cursor.nextset() is None
+
+    with raises(ExecuteManyError) as exc_info:
+        cursor.executemany("insert into t values (?)", [[1], [2], [3]], concurrency=2)
+    errors = exc_info.value.errors
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], OperationalError), "Invalid statement error"
+
+    with raises(ProgrammingError):
+        cursor.executemany(query, [[1], [3]], concurrency=0)
+    with raises(NotSupportedError):
+        cursor.executemany(query, [[1], [3]], async_execution=True, concurrency=2)
+
+
+def test_cursor_insert_rows(
+    httpx_mock: HTTPXMock,
+    auth_callback: Callable,
+    auth_url: str,
+    insert_query_callback: Callable,
+    query_url: str,
+    cursor: Cursor,
+):
+    """insert_rows packs rows into multi-row INSERT statements."""
+    statements = []
+
+    def recording_insert_callback(request: Request, **kwargs) -> Response:
+        statements.append(request.read().decode())
+        return insert_query_callback(request, **kwargs)
+
+    httpx_mock.add_callback(auth_callback, url=auth_url)
+    httpx_mock.add_callback(recording_insert_callback, url=query_url)
+
+    rows = ([i, f"name {i}"] for i in range(5))
+    assert cursor.insert_rows("t", rows, ["id", "name"], max_batch_rows=2) == 5
+    assert statements == [
+        "INSERT INTO t (id, name) VALUES (0, 'name 0'),(1, 'name 1')",
+        "INSERT INTO t (id, name) VALUES (2, 'name 2'),(3, 'name 3')",
+        "INSERT INTO t (id, name) VALUES (4, 'name 4')",
+    ], "Invalid insert statements"
+    assert cursor.rowcount == -1
+
+
 def test_cursor_multi_statement(
     httpx_mock: HTTPXMock,
     auth_callback: Callable,
@@ -0,0 +1,81 @@
+from threading import Timer
+from typing import Any, Callable, Dict
+
+from httpx import codes
+from pytest import fixture, raises
+from pytest_httpx import HTTPXMock
+
+from firebolt.client.auth import Token
+from firebolt.common.settings import Settings
+from firebolt.db.pool import ConnectionPool
+from firebolt.utils.exception import ConnectionClosedError, PoolTimeoutError
+
+
+@fixture
+def connect_kwargs(settings: Settings, db_name: str, access_token: str) -> Dict:
+    return dict(
+        auth=Token(access_token),
+        database=db_name,
+        engine_url=settings.server,
+        api_endpoint=settings.server,
+    )
+
+
+def test_pool_reuses_connections(
+    httpx_mock: HTTPXMock,
+    query_callback: Callable,
+    query_url: str,
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """Released connections are handed out again, their cursors are closed."""
+    httpx_mock.add_callback(query_callback, url=query_url)
+
+    with ConnectionPool(min_size=1, **connect_kwargs) as pool:
+        assert pool.stats.idle == 1
+        with pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("select*")
+            assert pool.stats.in_use == 1
+        assert cursor.closed, "Cursor wasn't closed on release"
+
+        with pool.connection() as connection2:
+            assert connection2 is connection, "Connection wasn't reused"
+
+        stats = pool.stats
+        assert (stats.in_use, stats.idle) == (0, 1)
+        assert (stats.acquisitions, stats.creations, stats.evictions) == (2, 1, 0)
+
+    assert connection.closed, "Idle connection wasn't closed with pool"
+
+
+def test_pool_liveness_check(
+    httpx_mock: HTTPXMock,
+    set_query_url: str,
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """Dead connections are replaced before handed out."""
+    httpx_mock.add_response(status_code=codes.INTERNAL_SERVER_ERROR, url=set_query_url)
+
+    with ConnectionPool(check_idle_time=0, **connect_kwargs) as pool:
+        with pool.connection() as connection:
+            pass
+        with pool.connection() as connection2:
+            assert connection2 is not connection, "Dead connection was reused"
+        assert connection.closed
+        assert pool.stats.evictions == 1
+
+
+def test_pool_timeout(connect_kwargs: Dict[str, Any]) -> None:
+    """Callers wait for a connection if all of them are in use."""
+    with ConnectionPool(max_size=1, timeout=0.1, **connect_kwargs) as pool:
+        connection = pool.acquire()
+        with raises(PoolTimeoutError):
+            pool.acquire()
+
+        Timer(0.05, pool.release, (connection,)).start()
+        assert pool.acquire() is connection
+        assert pool.stats.wait_time > 0.05
+        pool.release(connection)
+
+    with raises(ConnectionClosedError):
+        pool.acquire()
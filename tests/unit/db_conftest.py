@@ -6,7 +6,13 @@ from typing import Any, Callable, Dict, List
 from httpx import URL, Request, Response, codes
 from pytest import fixture
 
-from firebolt.async_db.cursor import JSON_OUTPUT_FORMAT, ColType, Column
+from firebolt.async_db.cursor import (
+    JSON_OUTPUT_FORMAT,
+    STREAMING_OUTPUT_FORMAT,
+    TSV_OUTPUT_FORMAT,
+    ColType,
+    Column,
+)
 from firebolt.common.settings import Settings
 from firebolt.db import ARRAY, DATETIME64, DECIMAL
 
@@ -342,3 +348,52 @@ def set_query_url(settings: Settings, db_name: str) -> str:
 def query_with_params_url(query_url: str, set_params: str) -> str:
     params_encoded = "&".join([f"{k}={encode_param(v)}" for k, v in set_params.items()])
     query_url = f"{query_url}&{params_encoded}"
+
+
+@fixture
+def streaming_query_url(settings: Settings, db_name: str) -> str:
+    return URL(
+        f"https://{settings.server}/?database={db_name}"
+        f"&output_format={STREAMING_OUTPUT_FORMAT}"
+    )
+
+
+@fixture
+def streaming_query_callback(
+    query_description: List[Column], query_data: List[List[ColType]]
+) -> Callable:
+    def do_query(request: Request, **kwargs) -> Response:
+        lines = [
+            jdumps([c.name for c in query_description]),
+            jdumps([c.type_code for c in query_description]),
+        ] + [jdumps(row) for row in query_data]
+        return Response(status_code=codes.OK, content="\n".join(lines) + "\n")
+
+    return do_query
+
+
+@fixture
+def tsv_query_url(settings: Settings, db_name: str) -> str:
+    return URL(
+        f"https://{settings.server}/?database={db_name}"
+        f"&output_format={TSV_OUTPUT_FORMAT}"
+    )
+
+
+@fixture
+def tsv_query_callback(
+    query_description: List[Column], query_data: List[List[ColType]]
+) -> Callable:
+    def to_tsv(value: Any) -> str:
+        if isinstance(value, list):
+            return f"[{','.join(map(str, value))}]"
+        return str(value)
+
+    def do_query(request: Request, **kwargs) -> Response:
+        lines = [
+            "\t".join(c.name for c in query_description),
+            "\t".join(c.type_code for c in query_description),
+        ] + ["\t".join(map(to_tsv, row)) for row in query_data]
+        return Response(status_code=codes.OK, content="\n".join(lines) + "\n")
+
+    return do_query
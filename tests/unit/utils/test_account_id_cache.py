@@ -0,0 +1,140 @@
+from threading import Event, Thread
+from unittest.mock import patch
+
+from anyio import create_task_group, fail_after, run, sleep, to_thread
+from pytest import raises
+
+from firebolt.client.auth import ServiceAccount, Token, UsernamePassword
+from firebolt.utils.account_id_cache import AccountIdCache, auth_user_key
+
+
+def test_account_id_cache_get():
+    """AccountIdCache resolves account ids once until they expire."""
+    cache = AccountIdCache(ttl=10)
+    calls = []
+
+    def resolve() -> str:
+        calls.append(1)
+        return "id"
+
+    with patch("firebolt.utils.account_id_cache.monotonic", return_value=100):
+        assert cache.get("a", resolve) == "id"
+        assert cache.get("a", resolve) == "id"
+    assert len(calls) == 1 and len(cache) == 1
+
+    with patch("firebolt.utils.account_id_cache.monotonic", return_value=110):
+        assert cache.get("a", resolve) == "id"
+    assert len(calls) == 2, "Expired account id was reused"
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with raises(ValueError):
+        AccountIdCache(ttl=0)
+
+
+def test_account_id_cache_single_flight():
+    """Concurrent lookups of the same account are combined."""
+    cache = AccountIdCache()
+    started, release = Event(), Event()
+    calls, results = [], []
+
+    def resolve() -> str:
+        calls.append(1)
+        started.set()
+        release.wait()
+        return "id"
+
+    threads = [
+        Thread(target=lambda: results.append(cache.get("a", resolve))) for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ["id"] * 4
+    assert len(calls) == 1
+
+
+def test_account_id_cache_error():
+    """Lookup error is raised by all waiting callers and isn't cached."""
+    cache = AccountIdCache()
+
+    def fail() -> str:
+        raise RuntimeError("lookup failed")
+
+    with raises(RuntimeError):
+        cache.get("a", fail)
+    assert len(cache) == 0
+    assert cache.get("a", lambda: "id") == "id"
+
+
+async def test_account_id_cache_async_single_flight():
+    """Concurrent asynchronous lookups are combined, cancelled lookup
+    isn't cached."""
+    cache = AccountIdCache()
+    calls, results = [], []
+
+    async def resolve() -> str:
+        calls.append(1)
+        await sleep(0.05)
+        return "id"
+
+    async def get() -> None:
+        results.append(await cache.async_get("a", resolve))
+
+    async with create_task_group() as task_group:
+        for _ in range(3):
+            task_group.start_soon(get)
+    assert results == ["id"] * 3
+    assert len(calls) == 1
+
+    cache.clear()
+    calls.clear()
+    results.clear()
+    async with create_task_group() as task_group:
+        task_group.start_soon(get)
+        await sleep(0.01)
+        task_group.start_soon(get)
+        await sleep(0.01)
+        # Cancel the caller, that performs the lookup
+        task_group.cancel_scope.cancel()
+    async with create_task_group() as task_group:
+        task_group.start_soon(get)
+    assert results == ["id"]
+    assert len(calls) == 2
+
+
+def test_account_id_cache_many_waiters_trio():
+    """Waiting callers don't hold worker threads, the lookup might need."""
+    cache = AccountIdCache()
+    results = []
+
+    async def resolve() -> str:
+        await sleep(0.01)
+        # DNS resolution runs in a worker thread
+        return await to_thread.run_sync(lambda: "id")
+
+    async def get() -> None:
+        results.append(await cache.async_get("a", resolve))
+
+    async def main() -> None:
+        # More waiters than trio's default worker thread limit
+        with fail_after(5):
+            async with create_task_group() as task_group:
+                for _ in range(60):
+                    task_group.start_soon(get)
+
+    run(main, backend="trio")
+    assert results == ["id"] * 60
+
+
+def test_auth_user_key():
+    """Users are identified without exposing tokens."""
+    assert auth_user_key(UsernamePassword("user", "p")) == "user"
+    assert auth_user_key(ServiceAccount("client", "s")) == "client"
+    key = auth_user_key(Token("secret"))
+    assert "secret" not in key and key != auth_user_key(Token("other"))
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from pytest import raises
+
+from firebolt.utils.engine_url_cache import EngineUrlCache, EngineUrlCacheStats
+
+
+def test_engine_url_cache_get_put():
+    """EngineUrlCache returns cached urls and counts hits and misses."""
+    cache = EngineUrlCache()
+    assert cache.get("a") is None
+    cache.put("a", "https://engine")
+    assert cache.get("a") == "https://engine"
+    assert cache.stats == EngineUrlCacheStats(
+        hits=1, misses=1, invalidations=0, entries=1
+    )
+
+    cache.clear()
+    assert cache.get("a") is None
+
+    with raises(ValueError):
+        EngineUrlCache(ttl=0)
+
+
+def test_engine_url_cache_expiration():
+    """Cached urls expire after ttl."""
+    cache = EngineUrlCache(ttl=10)
+    with patch("firebolt.utils.engine_url_cache.monotonic", return_value=100):
+        cache.put("a", "https://engine")
+    with patch("firebolt.utils.engine_url_cache.monotonic", return_value=109):
+        assert cache.get("a") == "https://engine"
+    with patch("firebolt.utils.engine_url_cache.monotonic", return_value=110):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_engine_url_cache_invalidate():
+    """All entries of an invalidated url are removed."""
+    cache = EngineUrlCache()
+    cache.put("a", "https://engine")
+    cache.put("b", "https://engine")
+    cache.put("c", "https://other")
+    cache.invalidate("https://engine")
+    assert (cache.get("a"), cache.get("b")) == (None, None)
+    assert cache.get("c") == "https://other"
+    assert cache.stats.invalidations == 2
+
+
+def test_engine_url_cache_persist():
+    """Persisted urls are shared between cache instances."""
+    cache = EngineUrlCache(persist=True)
+    cache.put(("api", "user", "engine"), "https://engine")
+    cache.put("b", "https://other")
+    with open(cache.file) as f:
+        assert "user" not in f.read(), "Cache key was stored unhashed"
+
+    other = EngineUrlCache(persist=True)
+    assert other.get(("api", "user", "engine")) == "https://engine"
+    assert other.stats.hits == 1
+
+    cache.invalidate("https://engine")
+    assert EngineUrlCache(persist=True).get(("api", "user", "engine")) is None
+    assert EngineUrlCache(persist=True).get("b") == "https://other"
+
+    # Expired and corrupted entries are ignored
+    with patch("firebolt.utils.engine_url_cache.time", return_value=0):
+        EngineUrlCache(persist=True, ttl=1).put("c", "https://expired")
+    assert EngineUrlCache(persist=True).get("c") is None
+    with open(cache.file, "w") as f:
+        f.write("{corrupted")
+    assert EngineUrlCache(persist=True).get("b") is None
+
+    cache.put("d", "https://engine")
+    cache.clear()
+    assert EngineUrlCache(persist=True).get("d") is None
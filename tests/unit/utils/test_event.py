@@ -0,0 +1,45 @@
+from threading import Thread
+
+from anyio import create_task_group, fail_after, run, sleep
+
+from firebolt.utils.event import ThreadSafeEvent
+
+
+def test_thread_safe_event_other_thread():
+    """Tasks of different event loops are woken up by an event, set from
+    another thread."""
+    for backend in ("asyncio", "trio"):
+        event = ThreadSafeEvent()
+        woken = []
+
+        async def wait() -> None:
+            await event.async_wait()
+            woken.append(1)
+
+        async def main() -> None:
+            with fail_after(5):
+                async with create_task_group() as task_group:
+                    for _ in range(3):
+                        task_group.start_soon(wait)
+                    await sleep(0.01)
+                    thread = Thread(target=event.set)
+                    thread.start()
+            thread.join()
+
+        run(main, backend=backend)
+        assert woken == [1] * 3
+        assert event.is_set()
+
+
+async def test_thread_safe_event_cancelled_waiter():
+    """Cancelled waiters are forgotten."""
+    event = ThreadSafeEvent()
+    async with create_task_group() as task_group:
+        task_group.start_soon(event.async_wait)
+        await sleep(0.01)
+        task_group.cancel_scope.cancel()
+    assert not event._waiters
+    event.set()
+    # Set event doesn't block
+    await event.async_wait()
+    event.wait()
@@ -0,0 +1,249 @@
+from os import path, utime
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from firebolt.async_db._types import Column, parse_type
+from firebolt.async_db.cursor import Statistics
+from firebolt.utils.result_cache import (
+    DiskResultCache,
+    ResultCache,
+    ResultCacheStats,
+)
+
+
+def row_set(rows: int) -> tuple:
+    return (rows, [], None, [[i] for i in range(rows)])
+
+
+def test_result_cache_get_put():
+    """ResultCache returns cached results and counts hits and misses."""
+    cache = ResultCache()
+    assert cache.get("a") is None
+    cache.put("a", row_set(2), 100)
+    assert cache.get("a") == row_set(2)
+    assert len(cache) == 1
+    assert cache.stats == ResultCacheStats(
+        hits=1, misses=1, evictions=0, entries=1, rows=2, bytes=100
+    )
+
+    cache.put("a", row_set(3), 50)
+    assert cache.get("a") == row_set(3), "Result wasn't replaced"
+    assert cache.stats.rows == 3 and cache.stats.bytes == 50
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats == ResultCacheStats(
+        hits=2, misses=2, evictions=0, entries=0, rows=0, bytes=0
+    )
+
+    with raises(ValueError):
+        ResultCache(ttl=0)
+
+
+def test_result_cache_ttl():
+    """ResultCache results expire after ttl."""
+    cache = ResultCache(ttl=10)
+    with patch("firebolt.utils.result_cache.monotonic", return_value=0):
+        cache.put("a", row_set(1), 1)
+    with patch("firebolt.utils.result_cache.monotonic", return_value=9.9):
+        assert cache.get("a") == row_set(1)
+    with patch("firebolt.utils.result_cache.monotonic", return_value=10):
+        assert cache.get("a") is None, "Expired result returned"
+    assert len(cache) == 0, "Expired result wasn't removed"
+
+
+def test_result_cache_eviction():
+    """ResultCache evicts least recently used results to fit size limits."""
+    cache = ResultCache(max_rows=10)
+    cache.put("a", row_set(4), 1)
+    cache.put("b", row_set(4), 1)
+    cache.get("a")
+    cache.put("c", row_set(4), 1)
+    assert cache.get("b") is None, "Least recently used result wasn't evicted"
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats.evictions == 1 and cache.stats.rows == 8
+
+    cache.put("d", row_set(11), 1)
+    assert cache.get("d") is None, "Result over the limit was cached"
+    assert len(cache) == 2
+
+    cache = ResultCache(max_rows=None, max_bytes=100)
+    cache.put("a", row_set(1), 60)
+    cache.put("b", row_set(1), 60)
+    assert cache.get("a") is None and cache.get("b") is not None
+    cache.put("c", row_set(1), 101)
+    assert cache.get("c") is None, "Result over the limit was cached"
+
+
+@mark.nofakefs
+def test_disk_result_cache(tmp_path):
+    """DiskResultCache stores results in files, shared between instances."""
+    cache = DiskResultCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", row_set(2))
+    # Another process uses the same directory
+    other = DiskResultCache(str(tmp_path))
+    assert other.get("a") == row_set(2)
+    assert other.stats.hits == 1
+    assert other.stats.entries == 1
+    assert other.stats.rows == 2
+
+    # Corrupted files are ignored and removed
+    file = Path(cache._file("a"))
+    file.write_bytes(b"corrupted")
+    assert cache.get("a") is None
+    assert not file.exists()
+
+    cache.put("a", row_set(2))
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats.misses == 3
+
+    with raises(ValueError):
+        DiskResultCache(str(tmp_path), ttl=-1)
+
+
+@mark.nofakefs
+def test_disk_result_cache_ttl(tmp_path):
+    """DiskResultCache results expire after ttl."""
+    cache = DiskResultCache(str(tmp_path), ttl=10)
+    with patch("firebolt.utils.result_cache.time", return_value=0):
+        cache.put("a", row_set(1))
+    with patch("firebolt.utils.result_cache.time", return_value=9):
+        assert cache.get("a") == row_set(1)
+    with patch("firebolt.utils.result_cache.time", return_value=10):
+        assert cache.get("a") is None
+    assert not path.exists(cache._file("a"))
+
+
+@mark.nofakefs
+def test_disk_result_cache_eviction(tmp_path):
+    """DiskResultCache removes least recently used files to fit size limit."""
+    cache = DiskResultCache(str(tmp_path), max_bytes=None)
+    cache.put("a", row_set(10))
+    cache.max_bytes = cache.stats.bytes * 2
+    cache.put("b", row_set(10))
+    # Make "a" the least recently used
+    utime(cache._file("a"), (1, 1))
+
+    cache.put("c", row_set(10))
+    assert cache.get("a") is None
+    assert cache.get("b") == row_set(10)
+    assert cache.get("c") == row_set(10)
+    assert cache.stats.evictions == 1
+
+    # Result is larger than the limit
+    cache.put("d", row_set(1000))
+    assert cache.get("d") is None
+
+
+@mark.nofakefs
+def test_result_cache_disk_tier(tmp_path):
+    """ResultCache loads results missing in memory from disk cache."""
+    cache = ResultCache(disk_cache=DiskResultCache(str(tmp_path)))
+    cache.put("a", row_set(2), 100)
+
+    cold = ResultCache(ttl=10, disk_cache=DiskResultCache(str(tmp_path)))
+    assert cold.get("a") == row_set(2)
+    assert len(cold) == 1
+    assert cold.disk_cache.stats.hits == 1
+    # Second read is served from memory
+    assert cold.get("a") == row_set(2)
+    assert cold.disk_cache.stats.hits == 1
+    assert cold.stats.hits == 2
+
+    # Disk cache is shared with other processes, so it's not cleared
+    cold.clear()
+    assert len(cold) == 0
+    assert cache.disk_cache.get("a") == row_set(2)
+
+    cold.invalidate()
+    assert cache.disk_cache.get("a") is None
+
+
+@mark.nofakefs
+def test_result_cache_invalidate_scope(tmp_path):
+    """Invalidation only removes results of its scope."""
+    cache = ResultCache(disk_cache=DiskResultCache(str(tmp_path)))
+    cache.put("a", row_set(1), 1, scope=("engine", "db1"))
+    cache.put("b", row_set(1), 1, scope=("engine", "db2"))
+
+    cache.invalidate(("engine", "db1"))
+    assert cache.get("a", ("engine", "db1")) is None
+    assert cache.get("b", ("engine", "db2")) == row_set(1)
+    cache.clear()
+    assert cache.get("b", ("engine", "db2")) == row_set(1), "Disk result removed"
+    assert cache.disk_cache.stats.entries == 1
+
+
+@mark.nofakefs
+def test_disk_result_cache_format(tmp_path):
+    """DiskResultCache stores values and descriptions of all types."""
+    descriptions = [
+        Column(name, parse_type(type_name), None, None, None, None, None)
+        for name, type_name in (
+            ("i", "Int64"),
+            ("f", "Float64"),
+            ("s", "String"),
+            ("d", "Date"),
+            ("t", "DateTime64(3)"),
+            ("a", "Array(Array(Decimal(10, 2)))"),
+            ("b", "UInt64"),
+        )
+    ]
+    statistics = Statistics(
+        elapsed=0.1,
+        rows_read=2,
+        bytes_read=10,
+        time_before_execution=0.01,
+        time_to_execute=0.05,
+        scanned_bytes_cache=None,
+        scanned_bytes_storage=1.0,
+    )
+    rows = [
+        [
+            1,
+            1.5,
+            "ä\t€",
+            "2022-01-01",
+            "2022-01-01 00:00:00.123",
+            [["1.5"]],
+            2**64 - 1,
+        ],
+        [None, None, None, None, True, [], -1],
+        [-(2**63), float("inf"), "", "x", "y", None, 0],
+    ]
+    cached = (3, descriptions, statistics, rows)
+
+    cache = DiskResultCache(str(tmp_path))
+    cache.put("a", cached)
+    loaded = cache.get("a")
+    assert loaded == cached
+    assert [column.type_code for column in loaded[1]] == [
+        column.type_code for column in descriptions
+    ]
+
+    # Insert result without rows
+    cache.put("b", (-1, None, None, None))
+    assert cache.get("b") == (-1, None, None, None)
+
+
+@mark.nofakefs
+def test_disk_result_cache_incompatible_file(tmp_path):
+    """Files of other format versions or with invalid contents are cache misses."""
+    cache = DiskResultCache(str(tmp_path))
+    cache.put("a", row_set(2))
+    file = Path(cache._file("a"))
+    data = file.read_bytes()
+
+    # Written by another SDK version
+    file.write_bytes(data[:4] + b"\xff\xff" + data[6:])
+    assert cache.get("a") is None
+
+    # Metadata refers to an unknown column encoding
+    cache.put("a", row_set(2))
+    file.write_bytes(data.replace(b"[[1,", b"[[9,"))
+    assert cache.get("a") is None
+    assert not file.exists()